@@ -0,0 +1,42 @@
+"""
+Benchmark the core string slice engine, outside of Binary Ninja,
+against ELF, PE or Mach-O files on disk.
+
+Run from the root of the repository with:
+
+    python -m benchmarks.bench_engine path/to/binary [path/to/binary ...]
+"""
+
+import argparse
+import time
+
+from binja_plugin.loader import load_binary_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for path in args.paths:
+        best_load = best_recover = float("inf")
+        recovered_count = 0
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            loaded = load_binary_file(path)
+            loaded_at = time.perf_counter()
+            recovered_count = len(loaded.create_engine().recover_from_readonly_data())
+            recovered_at = time.perf_counter()
+            best_load = min(best_load, loaded_at - start)
+            best_recover = min(best_recover, recovered_at - loaded_at)
+
+        readonly_size = sum(len(section.data) for section in loaded.sections)
+        print(
+            f"{path}: {loaded.format}, {len(loaded.sections)} read-only sections ({readonly_size:#x} bytes), "
+            f"{recovered_count} string slices, load {best_load:.4f}s, recover {best_recover:.4f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark pairing of string pointer writes with constant length writes in large synthetic basic blocks,
+comparing the original approach of re-filtering the whole block after each pointer write,
+against the single forward pass in `pair_pointers_with_lengths`.
+
+The single pass is also checked to pair each pointer with exactly one length,
+and to find the expected length for every generated string slice.
+
+Run from the root of the repository with:
+
+    python -m benchmarks.bench_pairing
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List, Tuple
+
+from binja_plugin.pairing import StoreEvent, pair_pointers_with_lengths
+
+ADDRESS_SIZE = 8
+
+
+def generate_block(
+    rng: random.Random, string_slice_count: int
+) -> Tuple[List[StoreEvent], Dict[int, int]]:
+    """
+    Generate a basic block with `string_slice_count` string slices, written either as a `&str`
+    on the stack (pointer at +0, length at +8), or as a pointer and length in registers,
+    interleaved with unrelated constant writes.
+
+    Returns the writes, and the expected length for each pointer write address.
+    """
+    events: List[StoreEvent] = []
+    expected_lengths: Dict[int, int] = {}
+    address = 0x140001000
+    for i in range(string_slice_count):
+        string_address = 0x140100000 + i * 0x40
+        length = rng.randrange(1, 0x40)
+        expected_lengths[address] = length
+        if rng.random() < 0.5:
+            slot = -0x100 - (i % 16) * 0x10
+            events.append(StoreEvent(address, True, string_address, slot))
+            # Unrelated local written in between the two halves of the `&str`.
+            events.append(StoreEvent(address + 4, False, 0, -0x8))
+            events.append(StoreEvent(address + 8, False, length, slot + ADDRESS_SIZE))
+        else:
+            events.append(StoreEvent(address, True, string_address))
+            # Unrelated local in a stack slot, which must not be taken as the length.
+            events.append(StoreEvent(address + 4, False, 0, -0x8))
+            events.append(StoreEvent(address + 8, False, length))
+        # Unrelated constant write after the string slice, e.g. for another argument.
+        events.append(StoreEvent(address + 12, False, rng.randrange(0x1000)))
+        address += 0x10
+    return events, expected_lengths
+
+
+def pair_by_refiltering(events: List[StoreEvent]) -> List[Tuple[int, int, int]]:
+    """
+    The original approach: for each pointer write, filter the whole block for later instructions,
+    and accept every constant written after it.
+    """
+    pairs: List[Tuple[int, int, int]] = []
+    for pointer_index, pointer in enumerate(events):
+        if not pointer.is_pointer:
+            continue
+        # Like filtering the whole `il_basic_block` on `instr_index`, this visits every write in the block.
+        for event_index, event in enumerate(events):
+            if event_index > pointer_index and not event.is_pointer:
+                pairs.append((pointer.address, pointer.value, event.value))
+    return pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--string-slices", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    events, expected_lengths = generate_block(rng, args.string_slices)
+
+    start = time.perf_counter()
+    refiltered_pairs = pair_by_refiltering(events)
+    refiltering_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pairs = pair_pointers_with_lengths(events, address_size=ADDRESS_SIZE)
+    single_pass_time = time.perf_counter() - start
+
+    lengths_by_pointer: Dict[int, List[int]] = {}
+    for pointer_address, _string_address, length in pairs:
+        lengths_by_pointer.setdefault(pointer_address, []).append(length)
+    for pointer_address, expected_length in expected_lengths.items():
+        lengths = lengths_by_pointer.get(pointer_address, [])
+        if lengths != [expected_length]:
+            raise SystemExit(
+                f"Pointer at {pointer_address:#x} was paired with lengths {lengths}, expected [{expected_length}]"
+            )
+
+    print(f"{len(events)} writes, {len(expected_lengths)} string slices")
+    print(
+        f"re-filtering: {refiltering_time:.4f}s, {len(refiltered_pairs)} candidate pairs"
+    )
+    print(
+        f"single pass:  {single_pass_time:.4f}s, {len(pairs)} candidate pairs ({refiltering_time / single_pass_time:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Micro-benchmark comparing read-only region membership checks done with
+the original nested loop over segments and sections, against `ReadOnlyRegionIndex`.
+
+Run from the root of the repository with:
+
+    python -m benchmarks.bench_readonly_regions
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, List, Tuple
+
+from binja_plugin.regions import ReadOnlyRegionIndex
+
+
+class Region:
+    """
+    Stand-in for a Binary Ninja `Segment` or `Section`, which implements
+    `__contains__` over the half-open interval [start, end).
+    """
+
+    def __init__(self, start: int, end: int):
+        self.start = start
+        self.end = end
+
+    def __contains__(self, address: int) -> bool:
+        return self.start <= address < self.end
+
+
+def generate_regions(
+    rng: random.Random, count: int, base: int = 0x140000000
+) -> Tuple[List[Region], List[Region]]:
+    segments: List[Region] = []
+    sections: List[Region] = []
+    address = base
+    for _ in range(count):
+        size = rng.randrange(0x1000, 0x100000, 0x1000)
+        segments.append(Region(address, address + size))
+        # Sections usually sit inside a segment, so they overlap with it.
+        section_start = address + rng.randrange(0, size // 2, 0x10)
+        sections.append(Region(section_start, section_start + size // 4))
+        address += size + rng.randrange(0, 0x100000, 0x1000)
+    return segments, sections
+
+
+def nested_loop(
+    segments: List[Region], sections: List[Region], addresses: List[int]
+) -> int:
+    found = 0
+    for address in addresses:
+        for readonly_segment_or_section in segments + sections:
+            if address in readonly_segment_or_section:
+                found += 1
+                break
+    return found
+
+
+def region_index(
+    segments: List[Region], sections: List[Region], addresses: List[int]
+) -> int:
+    index = ReadOnlyRegionIndex(
+        [(region.start, region.end) for region in segments + sections]
+    )
+    found = 0
+    for address in addresses:
+        if address in index:
+            found += 1
+    return found
+
+
+def time_it(function: Callable[[], int], repeat: int) -> Tuple[float, int]:
+    best = float("inf")
+    result = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--regions", type=int, default=48)
+    parser.add_argument("--addresses", type=int, default=300_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    segments, sections = generate_regions(rng, args.regions)
+    low = segments[0].start
+    high = segments[-1].end
+    addresses = [rng.randrange(low, high) for _ in range(args.addresses)]
+
+    nested_time, nested_found = time_it(
+        lambda: nested_loop(segments, sections, addresses), args.repeat
+    )
+    index_time, index_found = time_it(
+        lambda: region_index(segments, sections, addresses), args.repeat
+    )
+    if nested_found != index_found:
+        raise SystemExit(
+            f"Mismatched results: nested loop found {nested_found}, index found {index_found}"
+        )
+
+    print(
+        f"{args.addresses} addresses, {len(segments)} segments, {len(sections)} sections, {nested_found} in read-only data"
+    )
+    print(f"nested loop:  {nested_time:.4f}s")
+    print(f"region index: {index_time:.4f}s ({nested_time / index_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""
+Benchmark `RecoverStringFromReadOnlyDataTask`, `RecoverStringFromCodeTask` and
+`RecoverAllStringSlicesTask` against synthetic Rust-like binaries, in an in-memory stand-in
+for the Binary Ninja API.
+
+For each scenario and binary size, each stage of recovery (building the read-only region index,
+detection, and application of types, or for the `_run` scenarios, a whole run of the task,
+which interleaves detection and application a chunk at a time) is measured for wall time, peak memory allocated by Python,
+and the number of calls which would cross into the Binary Ninja core. Results are compared
+against a stored baseline; the number of recovered string slices must match the baseline exactly,
+and the other measurements are reported relative to it.
+
+Run from the root of the repository with:
+
+    python -m benchmarks.bench_tasks [--sizes 1000 10000 100000 1000000] [--update-baseline]
+
+or through nox with:
+
+    nox -s benchmark
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from . import standin
+
+standin.install()
+
+from binja_plugin.actions import (  # noqa: E402
+    RecoverAllStringSlicesTask,
+    RecoverStringFromCodeTask,
+    RecoverStringFromReadOnlyDataTask,
+    RecoverStringSlicesTask,
+    apply_string_slices,
+    create_rust_string_slice_type,
+    get_readonly_region_index,
+)
+from binja_plugin.regions import ReadOnlyRegionIndex  # noqa: E402
+
+from .fixtures import SyntheticBinary, generate_binary  # noqa: E402
+
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+# Measurements above these multiples of the baseline are reported as regressions.
+TIME_TOLERANCE = 1.5
+MEMORY_TOLERANCE = 1.25
+
+Stage = Tuple[str, Callable[[Dict[str, Any]], Any]]
+
+
+def _readonly_data_stages(binary: SyntheticBinary, bulk_scan: bool) -> List[Stage]:
+    task = RecoverStringFromReadOnlyDataTask(bv=binary.view, bulk_scan=bulk_scan)
+
+    def index(state: Dict[str, Any]) -> ReadOnlyRegionIndex:
+        state["regions"] = get_readonly_region_index(binary.view)
+        return state["regions"]
+
+    def detection(state: Dict[str, Any]) -> Any:
+        state["slices"] = task.recover_all(state["regions"])
+        state["recovered"] = len(state["slices"])
+        return state["slices"]
+
+    def application(state: Dict[str, Any]) -> Any:
+        return apply_string_slices(binary.view, state["slices"])
+
+    return [("index", index), ("detection", detection), ("application", application)]
+
+
+def _code_stages(binary: SyntheticBinary) -> List[Stage]:
+    task = RecoverStringFromCodeTask(bv=binary.view)
+
+    def index(state: Dict[str, Any]) -> ReadOnlyRegionIndex:
+        state["regions"] = get_readonly_region_index(binary.view)
+        return state["regions"]
+
+    def detection(state: Dict[str, Any]) -> Any:
+        state["slices"] = task.recover_all(state["regions"])
+        state["recovered"] = len(state["slices"])
+        return state["slices"]
+
+    def application(state: Dict[str, Any]) -> Any:
+        return apply_string_slices(binary.view, state["slices"])
+
+    return [("index", index), ("detection", detection), ("application", application)]
+
+
+def _run_stages(task: RecoverStringSlicesTask) -> List[Stage]:
+    """
+    Stages for a whole run of a task, which detects and applies string slices a chunk at a time.
+    """
+
+    def index(state: Dict[str, Any]) -> ReadOnlyRegionIndex:
+        state["regions"] = get_readonly_region_index(task.bv)
+        return state["regions"]
+
+    def run(state: Dict[str, Any]) -> Any:
+        task.run()
+        state["recovered"] = task.report.candidates["recovered"]
+
+    return [("index", index), ("run", run)]
+
+
+SCENARIOS: Dict[str, Callable[[SyntheticBinary], List[Stage]]] = {
+    "readonly_data": lambda binary: _readonly_data_stages(binary, bulk_scan=False),
+    "readonly_data_bulk_scan": lambda binary: _readonly_data_stages(
+        binary, bulk_scan=True
+    ),
+    "code": _code_stages,
+    "readonly_data_run": lambda binary: _run_stages(
+        RecoverStringFromReadOnlyDataTask(bv=binary.view)
+    ),
+    "readonly_data_bulk_scan_run": lambda binary: _run_stages(
+        RecoverStringFromReadOnlyDataTask(bv=binary.view, bulk_scan=True)
+    ),
+    "code_run": lambda binary: _run_stages(RecoverStringFromCodeTask(bv=binary.view)),
+    "all_run": lambda binary: _run_stages(RecoverAllStringSlicesTask(bv=binary.view)),
+}
+
+
+def run_scenario(
+    scenario: str, size: int, seed: int, measure_memory: bool
+) -> Dict[str, Any]:
+    """
+    Run all stages of `scenario` on a freshly generated binary of `size` candidates.
+
+    Wall time and call counts are measured in one run, and peak memory in a second run,
+    since tracing allocations slows everything down.
+    """
+    result: Dict[str, Any] = {"stages": {}}
+
+    binary = generate_binary(size, seed)
+    create_rust_string_slice_type(binary.view)
+    state: Dict[str, Any] = {}
+    for stage_name, stage in SCENARIOS[scenario](binary):
+        gc.collect()
+        standin.FFI_CALLS.clear()
+        start = time.perf_counter()
+        stage(state)
+        elapsed = time.perf_counter() - start
+        result["stages"][stage_name] = {
+            "time": elapsed,
+            "ffi_calls": sum(standin.FFI_CALLS.values()),
+            "ffi_calls_by_name": dict(sorted(standin.FFI_CALLS.items())),
+        }
+    result["genuine"] = binary.genuine_count
+    result["recovered"] = state["recovered"]
+    del binary, state
+
+    if measure_memory:
+        binary = generate_binary(size, seed)
+        create_rust_string_slice_type(binary.view)
+        state = {}
+        for stage_name, stage in SCENARIOS[scenario](binary):
+            gc.collect()
+            tracemalloc.start()
+            stage(state)
+            _current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            result["stages"][stage_name]["peak_memory"] = peak
+        del binary, state
+
+    return result
+
+
+def compare_to_baseline(
+    results: Dict[str, Any], baseline: Dict[str, Any]
+) -> Tuple[List[str], List[str]]:
+    """
+    Compare results against the baseline, returning (mismatches, regressions).
+    Mismatches are differences in the recovered string slices; regressions are
+    measurements which are worse than the baseline by more than the tolerances.
+    """
+    mismatches: List[str] = []
+    regressions: List[str] = []
+    for key, result in results.items():
+        baseline_result = baseline.get(key)
+        if baseline_result is None:
+            continue
+        if result["recovered"] != baseline_result["recovered"]:
+            mismatches.append(
+                f"{key}: recovered {result['recovered']} string slices, baseline recovered {baseline_result['recovered']}"
+            )
+        for stage_name, stage in result["stages"].items():
+            baseline_stage = baseline_result["stages"].get(stage_name)
+            if baseline_stage is None:
+                continue
+            if stage["time"] > baseline_stage["time"] * TIME_TOLERANCE:
+                regressions.append(
+                    f"{key} {stage_name}: {stage['time']:.3f}s, baseline {baseline_stage['time']:.3f}s"
+                )
+            if stage["ffi_calls"] > baseline_stage["ffi_calls"]:
+                regressions.append(
+                    f"{key} {stage_name}: {stage['ffi_calls']} FFI calls, baseline {baseline_stage['ffi_calls']}"
+                )
+            if (
+                "peak_memory" in stage
+                and "peak_memory" in baseline_stage
+                and stage["peak_memory"]
+                > baseline_stage["peak_memory"] * MEMORY_TOLERANCE
+            ):
+                regressions.append(
+                    f"{key} {stage_name}: {stage['peak_memory']} bytes peak memory, baseline {baseline_stage['peak_memory']}"
+                )
+    return mismatches, regressions
+
+
+def _format_ratio(value: float, baseline_value: Any) -> str:
+    if not baseline_value:
+        return ""
+    return f" ({value / baseline_value:.2f}x)"
+
+
+def print_results(results: Dict[str, Any], baseline: Dict[str, Any]):
+    for key, result in results.items():
+        print(f"{key}: recovered {result['recovered']} of {result['genuine']} genuine")
+        baseline_stages = baseline.get(key, {}).get("stages", {})
+        for stage_name, stage in result["stages"].items():
+            baseline_stage = baseline_stages.get(stage_name, {})
+            line = (
+                f"  {stage_name:<12} {stage['time']:9.4f}s"
+                f"{_format_ratio(stage['time'], baseline_stage.get('time'))}"
+                f"  {stage['ffi_calls']:9} FFI calls"
+                f"{_format_ratio(stage['ffi_calls'], baseline_stage.get('ffi_calls'))}"
+            )
+            if "peak_memory" in stage:
+                line += (
+                    f"  {stage['peak_memory'] / 1024 / 1024:9.2f} MiB peak"
+                    f"{_format_ratio(stage['peak_memory'], baseline_stage.get('peak_memory'))}"
+                )
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS)
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Skip the second run of each scenario which measures peak memory",
+    )
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Merge these results into the baseline, instead of comparing against it",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Also exit with an error if any measurement regresses past the tolerances",
+    )
+    parser.add_argument("-o", "--output", help="Write results as JSON to this path")
+    args = parser.parse_args()
+
+    try:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        baseline = {}
+
+    results: Dict[str, Any] = {}
+    for size in args.sizes:
+        for scenario in args.scenarios:
+            results[f"{scenario}/{size}"] = run_scenario(
+                scenario, size, args.seed, measure_memory=not args.no_memory
+            )
+
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.update_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Updated baseline in {args.baseline}")
+        return
+
+    mismatches, regressions = compare_to_baseline(results, baseline)
+    for regression in regressions:
+        print(f"regression: {regression}", file=sys.stderr)
+    for mismatch in mismatches:
+        print(f"mismatch: {mismatch}", file=sys.stderr)
+    if mismatches or (regressions and args.fail_on_regression):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""
+Generators for synthetic Rust-like binaries, as stand-in binary views, with a chosen number
+of candidate string slices.
+
+Each candidate is a `&str` (pointer, length) pair in read-only data, pointing to string data
+which autoanalysis has typed as a char array, and which is also loaded into a register or
+stack `&str` followed by its length in the code of some function. Most candidates are genuine
+string slices; the rest are the kinds of false positive which the heuristics must reject.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import List
+
+from .standin import (
+    Architecture,
+    ArrayType,
+    BinaryView,
+    DataVariable,
+    Function,
+    IntegerType,
+    MediumLevelILBasicBlock,
+    MediumLevelILConst,
+    MediumLevelILConstPtr,
+    MediumLevelILFunction,
+    MediumLevelILInstruction,
+    MediumLevelILOperation,
+    PointerType,
+    ReferenceSource,
+    Section,
+    SectionSemantics,
+    Segment,
+    Type,
+    Variable,
+    VariableSourceType,
+)
+
+ADDRESS_SIZE = 8
+BASE_ADDRESS = 0x140000000
+
+# Number of string slices loaded by each synthetic function.
+STRING_SLICES_PER_FUNCTION = 8
+
+_WORDS = [
+    "called",
+    "`Option::unwrap()`",
+    "on",
+    "a",
+    "`None`",
+    "value",
+    "src/main.rs",
+    "index",
+    "out",
+    "of",
+    "bounds:",
+    "the",
+    "len",
+    "is",
+    "but",
+    "capacity",
+    "overflow",
+    "attempt",
+    "to",
+    "add",
+    "with",
+    "invalid",
+    "UTF-8",
+    "données",
+    "→",
+    "\n",
+]
+
+
+@dataclass
+class SyntheticBinary:
+    view: BinaryView
+    candidate_count: int
+    # Number of candidates which are genuine string slices.
+    genuine_count: int
+
+
+def _genuine_string(rng: random.Random) -> bytes:
+    words = [rng.choice(_WORDS) for _ in range(rng.randrange(1, 8))]
+    return " ".join(words).encode("utf-8")
+
+
+def generate_binary(candidate_count: int, seed: int = 0) -> SyntheticBinary:
+    """
+    Generate a binary with `candidate_count` candidate string slices:
+
+    - 80% genuine string slices
+    - 5% with a zero length
+    - 5% with a length which is too long
+    - 5% pointing to data which is not valid UTF-8
+    - 5% pointing to binary data which is valid UTF-8, but mostly control characters
+    """
+    rng = random.Random(seed)
+    arch = Architecture(address_size=ADDRESS_SIZE)
+
+    targets: List[bytes] = []
+    lengths: List[int] = []
+    genuine_count = 0
+    for _ in range(candidate_count):
+        kind = rng.random()
+        if kind < 0.80:
+            data = _genuine_string(rng)
+            length = len(data)
+            genuine_count += 1
+        elif kind < 0.85:
+            data = _genuine_string(rng)
+            length = 0
+        elif kind < 0.90:
+            data = _genuine_string(rng)
+            length = 0x2000
+        elif kind < 0.95:
+            data = b"\xff" + bytes(
+                rng.randrange(0x80, 0x100) for _ in range(rng.randrange(2, 16))
+            )
+            length = len(data)
+        else:
+            data = bytes(rng.randrange(0, 4) for _ in range(rng.randrange(4, 16)))
+            length = len(data)
+        targets.append(data)
+        lengths.append(length)
+
+    # Layout: code, then string data in .rodata, then `&str` pairs in .data.rel.ro.
+    code_size = 0x1000 + candidate_count * 0x20
+    rodata_start = BASE_ADDRESS + code_size
+    target_addresses: List[int] = []
+    rodata = bytearray()
+    for data in targets:
+        target_addresses.append(rodata_start + len(rodata))
+        rodata += data
+        rodata += b"\0" * (-len(rodata) % ADDRESS_SIZE)
+    # Leave room for the lengths which are too long to still lie within read-only data.
+    rodata += b"\0" * 0x2000
+    pairs_start = rodata_start + len(rodata)
+    pairs = bytearray()
+    for target_address, length in zip(target_addresses, lengths):
+        pairs += target_address.to_bytes(ADDRESS_SIZE, "little")
+        pairs += length.to_bytes(ADDRESS_SIZE, "little")
+    end = pairs_start + len(pairs)
+
+    view = BinaryView(
+        arch=arch,
+        base=BASE_ADDRESS,
+        data=bytes(code_size) + bytes(rodata) + bytes(pairs),
+    )
+    view.segments = [
+        Segment(BASE_ADDRESS, rodata_start, executable=True),
+        Segment(rodata_start, end),
+    ]
+    view.sections = {
+        ".text": Section(
+            ".text",
+            BASE_ADDRESS,
+            rodata_start,
+            SectionSemantics.ReadOnlyCodeSectionSemantics,
+        ),
+        ".rodata": Section(
+            ".rodata",
+            rodata_start,
+            pairs_start,
+            SectionSemantics.ReadOnlyDataSectionSemantics,
+        ),
+        ".data.rel.ro": Section(
+            ".data.rel.ro",
+            pairs_start,
+            end,
+            SectionSemantics.ReadOnlyDataSectionSemantics,
+        ),
+    }
+
+    pointer_type = PointerType.create(arch=arch, type=Type.char())
+    usize_type = IntegerType.create(width=ADDRESS_SIZE)
+    for i, (target_address, data) in enumerate(zip(target_addresses, targets)):
+        view.data_vars[target_address] = DataVariable(
+            address=target_address,
+            type=ArrayType(element_type=Type.char(), count=len(data)),
+            value=data,
+        )
+        location = pairs_start + i * 2 * ADDRESS_SIZE
+        view.data_vars[location] = DataVariable(
+            address=location, type=pointer_type, value=target_address
+        )
+        # Autoanalysis only sometimes types the length as an integer.
+        if i % 2:
+            view.data_vars[location + ADDRESS_SIZE] = DataVariable(
+                address=location + ADDRESS_SIZE,
+                type=usize_type,
+                value=lengths[i],
+            )
+
+    # Each function loads a few of the string slices, either into registers as arguments,
+    # or into `&str` structures on the stack, with unrelated constants in between.
+    address = BASE_ADDRESS + 0x1000
+    for function_start_index in range(0, candidate_count, STRING_SLICES_PER_FUNCTION):
+        function = Function(start=address, arch=arch)
+        instructions: List[MediumLevelILInstruction] = []
+        for i in range(
+            function_start_index,
+            min(function_start_index + STRING_SLICES_PER_FUNCTION, candidate_count),
+        ):
+            pointer_address = address
+            if i % 2:
+                slot = -0x100 - (i % STRING_SLICES_PER_FUNCTION) * 0x10
+                pointer_dest = Variable(
+                    VariableSourceType.StackVariableSourceType, slot
+                )
+                length_dest = Variable(
+                    VariableSourceType.StackVariableSourceType, slot + ADDRESS_SIZE
+                )
+            else:
+                pointer_dest = Variable(
+                    VariableSourceType.RegisterVariableSourceType, 2
+                )
+                length_dest = Variable(VariableSourceType.RegisterVariableSourceType, 8)
+            instructions.extend(
+                [
+                    MediumLevelILInstruction(
+                        MediumLevelILOperation.MLIL_SET_VAR,
+                        address,
+                        dest=pointer_dest,
+                        src=MediumLevelILConstPtr(target_addresses[i]),
+                    ),
+                    MediumLevelILInstruction(
+                        MediumLevelILOperation.MLIL_SET_VAR,
+                        address + 4,
+                        dest=length_dest,
+                        src=MediumLevelILConst(lengths[i]),
+                    ),
+                    MediumLevelILInstruction(
+                        MediumLevelILOperation.MLIL_CALL, address + 8
+                    ),
+                    MediumLevelILInstruction(
+                        MediumLevelILOperation.MLIL_SET_VAR,
+                        address + 12,
+                        dest=Variable(VariableSourceType.RegisterVariableSourceType, 0),
+                        src=MediumLevelILConst(rng.randrange(0x100)),
+                    ),
+                ]
+            )
+            view.code_refs.setdefault(target_addresses[i], []).append(
+                ReferenceSource(function=function, address=pointer_address)
+            )
+            address += 0x10
+        function._mlil = MediumLevelILFunction(
+            basic_blocks=[MediumLevelILBasicBlock(instructions)]
+        )
+        view.functions[function.start] = function
+        address += 0x10
+
+    return SyntheticBinary(
+        view=view, candidate_count=candidate_count, genuine_count=genuine_count
+    )
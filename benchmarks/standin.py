@@ -0,0 +1,497 @@
+"""
+In-memory stand-in for the parts of the Binary Ninja API used by `binja_plugin.actions`,
+so that the recovery tasks can be benchmarked without a Binary Ninja installation.
+
+`install()` registers the stand-in as the `binaryninja` package in `sys.modules`; it must be
+called before `binja_plugin.actions` is imported. Calls which would cross into the Binary Ninja
+core in a real view are counted in `FFI_CALLS`, by method name.
+"""
+
+import sys
+import types
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+from enum import Enum, IntFlag
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+FFI_CALLS: Counter = Counter()
+
+
+# binaryninja.enums
+
+
+class Endianness(Enum):
+    LittleEndian = 0
+    BigEndian = 1
+
+
+class SectionSemantics(Enum):
+    DefaultSectionSemantics = 0
+    ReadOnlyCodeSectionSemantics = 1
+    ReadOnlyDataSectionSemantics = 2
+    ReadWriteDataSectionSemantics = 3
+
+
+class MediumLevelILOperation(Enum):
+    MLIL_SET_VAR = 1
+    MLIL_SET_VAR_FIELD = 2
+    MLIL_CALL = 3
+    MLIL_CONST = 4
+    MLIL_CONST_PTR = 5
+    MLIL_CALL_UNTYPED = 6
+    MLIL_TAILCALL = 7
+    MLIL_TAILCALL_UNTYPED = 8
+    MLIL_SYSCALL = 9
+    MLIL_SYSCALL_UNTYPED = 10
+
+
+class VariableSourceType(Enum):
+    StackVariableSourceType = 0
+    RegisterVariableSourceType = 1
+
+
+class NotificationType(IntFlag):
+    DataVariableAdded = 1 << 0
+    DataVariableUpdated = 1 << 1
+    DataVariableRemoved = 1 << 2
+    FunctionAdded = 1 << 3
+    FunctionUpdated = 1 << 4
+    FunctionRemoved = 1 << 5
+    SegmentAdded = 1 << 6
+    SegmentUpdated = 1 << 7
+    SegmentRemoved = 1 << 8
+    SectionAdded = 1 << 9
+    SectionUpdated = 1 << 10
+    SectionRemoved = 1 << 11
+
+
+# binaryninja.types
+
+
+class Type:
+    @staticmethod
+    def char() -> "IntegerType":
+        return IntegerType(width=1)
+
+    @staticmethod
+    def array(type: "Type", count: int) -> "ArrayType":
+        return ArrayType(element_type=type, count=count)
+
+
+@dataclass(eq=True, frozen=True)
+class IntegerType(Type):
+    width: int
+
+    @staticmethod
+    def create(width: int) -> "IntegerType":
+        return IntegerType(width=width)
+
+
+@dataclass(eq=True, frozen=True)
+class PointerType(Type):
+    width: int
+    target: Type
+
+    @staticmethod
+    def create(arch: "Architecture", type: Type) -> "PointerType":
+        return PointerType(width=arch.address_size, target=type)
+
+
+@dataclass(eq=True, frozen=True)
+class ArrayType(Type):
+    element_type: Type
+    count: int
+
+    @property
+    def width(self) -> int:
+        return self.element_type.width * self.count  # type: ignore[attr-defined]
+
+
+class StructureBuilder(Type):
+    def __init__(self, packed: bool = False):
+        self.packed = packed
+        self.members: List[Tuple[Type, str]] = []
+
+    @staticmethod
+    def create(packed: bool = False) -> "StructureBuilder":
+        return StructureBuilder(packed=packed)
+
+    def append(self, type: Type, name: str) -> None:
+        self.members.append((type, name))
+
+
+# binaryninja.log, binaryninja.settings, binaryninja.plugin, binaryninja.interaction
+
+
+class Logger:
+    """
+    Discards all messages, but counts them, so that the cost of formatting them is still measured.
+    """
+
+    messages: Counter = Counter()
+
+    def __init__(self, session_id: int, logger_name: str):
+        self.logger_name = logger_name
+
+    def log_debug(self, message: str) -> None:
+        Logger.messages["debug"] += 1
+
+    def log_info(self, message: str) -> None:
+        Logger.messages["info"] += 1
+
+    def log_warn(self, message: str) -> None:
+        Logger.messages["warn"] += 1
+
+    def log_error(self, message: str) -> None:
+        Logger.messages["error"] += 1
+
+
+class Settings:
+    def register_group(self, group: str, title: str) -> None:
+        pass
+
+    def register_setting(self, key: str, properties: str) -> None:
+        pass
+
+
+class BackgroundTaskThread:
+    """
+    Runs synchronously; the harness calls `run()`, or the stages within it, directly.
+    """
+
+    def __init__(self, initial_progress_text: str = "", can_cancel: bool = False):
+        self.progress = initial_progress_text
+        self.can_cancel = can_cancel
+        self.cancelled = False
+
+    def start(self) -> None:
+        self.run()
+
+    def run(self) -> None:
+        pass
+
+
+def get_text_line_input(prompt: str, title: str) -> Optional[str]:
+    return None
+
+
+class PluginCommand:
+    @staticmethod
+    def register(name: str, description: str, action: Any) -> None:
+        pass
+
+
+# binaryninja.exceptions
+
+
+class ILException(Exception):
+    pass
+
+
+# binaryninja.mediumlevelil
+
+
+@dataclass
+class Variable:
+    source_type: VariableSourceType
+    storage: int
+
+
+@dataclass
+class MediumLevelILConst:
+    constant: int
+
+
+@dataclass
+class MediumLevelILConstPtr:
+    constant: int
+
+
+@dataclass
+class MediumLevelILInstruction:
+    operation: MediumLevelILOperation
+    address: int
+    dest: Optional[Variable] = None
+    src: Any = None
+    offset: int = 0
+
+    @property
+    def detailed_operands(self) -> List[Tuple[str, Any, str]]:
+        FFI_CALLS["MediumLevelILInstruction.detailed_operands"] += 1
+        return [("dest", self.dest, "var"), ("src", self.src, "expr")]
+
+
+class MediumLevelILBasicBlock:
+    def __init__(self, instructions: List[MediumLevelILInstruction]):
+        self.instructions = instructions
+
+    def __iter__(self) -> Iterator[MediumLevelILInstruction]:
+        for instruction in self.instructions:
+            FFI_CALLS["MediumLevelILBasicBlock.__iter__"] += 1
+            yield instruction
+
+
+@dataclass
+class MediumLevelILFunction:
+    basic_blocks: List[MediumLevelILBasicBlock]
+
+
+# binaryninja.architecture, binaryninja.function, binaryninja.binaryview
+
+
+@dataclass
+class Architecture:
+    address_size: int = 8
+    endianness: Endianness = Endianness.LittleEndian
+
+
+@dataclass
+class Function:
+    start: int
+    arch: Architecture
+    _mlil: Optional[MediumLevelILFunction] = None
+
+    @property
+    def mlil(self) -> MediumLevelILFunction:
+        FFI_CALLS["Function.mlil"] += 1
+        if self._mlil is None:
+            raise ILException(f"Medium level IL was not loaded for {self!r}")
+        return self._mlil
+
+
+@dataclass
+class ReferenceSource:
+    function: Optional[Function]
+    address: int
+
+
+@dataclass
+class Segment:
+    start: int
+    end: int
+    readable: bool = True
+    writable: bool = False
+    executable: bool = False
+
+
+@dataclass
+class Section:
+    name: str
+    start: int
+    end: int
+    semantics: SectionSemantics = SectionSemantics.DefaultSectionSemantics
+
+
+@dataclass
+class DataVariable:
+    address: int
+    type: Any
+    value: Any = None
+    name: Optional[str] = None
+
+    def __str__(self) -> str:
+        return f"<var {self.address:#x}: {self.type}>"
+
+
+class BinaryDataNotification:
+    def __init__(self, notifications: Optional[NotificationType] = None):
+        self.notifications = notifications
+
+    def data_var_added(self, view: "BinaryView", var: DataVariable) -> None:
+        pass
+
+    def data_var_updated(self, view: "BinaryView", var: DataVariable) -> None:
+        pass
+
+    def data_var_removed(self, view: "BinaryView", var: DataVariable) -> None:
+        pass
+
+
+class BinaryView:
+    """
+    A flat memory image with segments, sections, data vars, functions and code references.
+    """
+
+    def __init__(self, arch: Architecture, base: int, data: bytes):
+        self.arch: Optional[Architecture] = arch
+        self.base = base
+        self.data = data
+        self.segments: List[Segment] = []
+        self.sections: Dict[str, Section] = {}
+        self.data_vars: Dict[int, DataVariable] = {}
+        self.functions: Dict[int, Function] = {}
+        self.code_refs: Dict[int, List[ReferenceSource]] = {}
+        # Sorted targets of `code_refs`, rebuilt when references are added.
+        self._code_ref_targets: List[int] = []
+        self.session_data: Dict[str, Any] = {}
+        self.metadata: Dict[str, Any] = {}
+        self.types: Dict[str, Any] = {}
+        self.notifications: List[BinaryDataNotification] = []
+
+    def read(self, addr: int, length: int) -> bytes:
+        FFI_CALLS["BinaryView.read"] += 1
+        offset = addr - self.base
+        if offset < 0:
+            return b""
+        return self.data[offset : offset + length]
+
+    def read_int(
+        self, address: int, size: int, sign: bool = True, endian: Any = None
+    ) -> int:
+        FFI_CALLS["BinaryView.read_int"] += 1
+        return int.from_bytes(
+            self.read(address, size),
+            "big" if endian == Endianness.BigEndian else "little",
+            signed=sign,
+        )
+
+    def get_data_var_at(self, addr: int) -> Optional[DataVariable]:
+        FFI_CALLS["BinaryView.get_data_var_at"] += 1
+        return self.data_vars.get(addr)
+
+    def define_user_data_var(
+        self, addr: int, var_type: Any, name: Optional[str] = None
+    ) -> None:
+        FFI_CALLS["BinaryView.define_user_data_var"] += 1
+        existing = self.data_vars.get(addr)
+        var = DataVariable(address=addr, type=var_type, name=name)
+        self.data_vars[addr] = var
+        # Notifications are delivered synchronously, from within the call which made the change.
+        for notification in self.notifications:
+            if existing is None:
+                notification.data_var_added(self, var)
+            else:
+                notification.data_var_updated(self, var)
+
+    def undefine_user_data_var(self, addr: int) -> None:
+        FFI_CALLS["BinaryView.undefine_user_data_var"] += 1
+        var = self.data_vars.pop(addr, None)
+        if var is not None:
+            for notification in self.notifications:
+                notification.data_var_removed(self, var)
+
+    def get_code_refs(
+        self, addr: int, length: Optional[int] = None
+    ) -> List[ReferenceSource]:
+        FFI_CALLS["BinaryView.get_code_refs"] += 1
+        if length is None:
+            return self.code_refs.get(addr, [])
+        if len(self._code_ref_targets) != len(self.code_refs):
+            self._code_ref_targets = sorted(self.code_refs)
+        targets = self._code_ref_targets
+        return [
+            code_ref
+            for target in targets[
+                bisect_left(targets, addr) : bisect_left(targets, addr + length)
+            ]
+            for code_ref in self.code_refs[target]
+        ]
+
+    def get_function_at(self, addr: int) -> Optional[Function]:
+        FFI_CALLS["BinaryView.get_function_at"] += 1
+        return self.functions.get(addr)
+
+    def get_type_by_name(self, name: str) -> Any:
+        FFI_CALLS["BinaryView.get_type_by_name"] += 1
+        return self.types.get(name)
+
+    def define_user_type(self, name: str, type_obj: Any) -> None:
+        FFI_CALLS["BinaryView.define_user_type"] += 1
+        self.types[name] = type_obj
+
+    def query_metadata(self, key: str) -> Any:
+        FFI_CALLS["BinaryView.query_metadata"] += 1
+        return self.metadata[key]
+
+    def store_metadata(self, key: str, md: Any, isAuto: bool = False) -> None:
+        FFI_CALLS["BinaryView.store_metadata"] += 1
+        self.metadata[key] = md
+
+    def remove_metadata(self, key: str) -> None:
+        FFI_CALLS["BinaryView.remove_metadata"] += 1
+        del self.metadata[key]
+
+    def register_notification(self, notify: BinaryDataNotification) -> None:
+        self.notifications.append(notify)
+
+    def begin_undo_actions(self) -> str:
+        FFI_CALLS["BinaryView.begin_undo_actions"] += 1
+        return ""
+
+    def commit_undo_actions(self, id: Optional[str] = None) -> None:
+        FFI_CALLS["BinaryView.commit_undo_actions"] += 1
+
+    def begin_bulk_modify_symbols(self) -> None:
+        FFI_CALLS["BinaryView.begin_bulk_modify_symbols"] += 1
+
+    def end_bulk_modify_symbols(self) -> None:
+        FFI_CALLS["BinaryView.end_bulk_modify_symbols"] += 1
+
+    def update_analysis(self) -> None:
+        FFI_CALLS["BinaryView.update_analysis"] += 1
+
+
+_MODULES: Dict[str, List[str]] = {
+    "binaryninja.architecture": ["Architecture"],
+    "binaryninja.binaryview": [
+        "BinaryDataNotification",
+        "BinaryView",
+        "DataVariable",
+        "ReferenceSource",
+        "Section",
+        "Segment",
+    ],
+    "binaryninja.enums": [
+        "Endianness",
+        "MediumLevelILOperation",
+        "NotificationType",
+        "SectionSemantics",
+        "VariableSourceType",
+    ],
+    "binaryninja.exceptions": ["ILException"],
+    "binaryninja.function": ["Function"],
+    "binaryninja.interaction": ["get_text_line_input"],
+    "binaryninja.log": ["Logger"],
+    "binaryninja.mediumlevelil": [
+        "MediumLevelILBasicBlock",
+        "MediumLevelILConst",
+        "MediumLevelILConstPtr",
+        "MediumLevelILFunction",
+        "MediumLevelILInstruction",
+    ],
+    "binaryninja.plugin": ["BackgroundTaskThread", "PluginCommand"],
+    "binaryninja.settings": ["Settings"],
+    "binaryninja.types": [
+        "ArrayType",
+        "IntegerType",
+        "PointerType",
+        "StructureBuilder",
+        "Type",
+    ],
+    "binaryninja.variable": ["Variable"],
+}
+
+
+def install() -> None:
+    """
+    Register the stand-in as the `binaryninja` package.
+    """
+    if "binaryninja" in sys.modules and not getattr(
+        sys.modules["binaryninja"], "__standin__", False
+    ):
+        raise RuntimeError(
+            "The real binaryninja module is already imported; run the benchmarks in a separate process"
+        )
+
+    package = types.ModuleType("binaryninja")
+    package.__path__ = []
+    package.__standin__ = True  # type: ignore[attr-defined]
+    sys.modules["binaryninja"] = package
+    this_module = sys.modules[__name__]
+    for module_name, names in _MODULES.items():
+        module = types.ModuleType(module_name)
+        for name in names:
+            setattr(module, name, getattr(this_module, name))
+        sys.modules[module_name] = module
+        setattr(package, module_name.split(".")[1], module)
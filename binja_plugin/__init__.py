@@ -0,0 +1,7 @@
+"""
+Rust String Slicer plugin for Binary Ninja.
+
+Only `actions`, `incremental`, `plugin` and `settings` use the Binary Ninja API. The other modules
+(the string slice engine and its loaders, validation, pairing, the region index, slice map, store,
+cache, catalogue and report) do not depend on it, so that they can be used and tested without it.
+"""
@@ -1,11 +1,43 @@
-from dataclasses import dataclass
-from typing import List
+import os
+import re
+import time
+from abc import ABCMeta, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
 
 from binaryninja.binaryview import BinaryView, DataVariable
-from binaryninja.enums import MediumLevelILOperation, SectionSemantics
+from binaryninja.enums import (
+    Endianness,
+    MediumLevelILOperation,
+    SectionSemantics,
+    VariableSourceType,
+)
+from binaryninja.exceptions import ILException
+from binaryninja.function import Function
+from binaryninja.interaction import get_text_line_input
 from binaryninja.log import Logger
-from binaryninja.mediumlevelil import MediumLevelILConst
+from binaryninja.mediumlevelil import (
+    MediumLevelILBasicBlock,
+    MediumLevelILConst,
+    MediumLevelILConstPtr,
+    MediumLevelILInstruction,
+)
 from binaryninja.plugin import BackgroundTaskThread
+from binaryninja.settings import Settings
 from binaryninja.types import (
     ArrayType,
     IntegerType,
@@ -14,56 +46,617 @@ from binaryninja.types import (
     Type,
 )
 
+from .cache import (
+    HEURISTIC_VERSION,
+    DiskCache,
+    compute_content_hash,
+    deserialize_string_slices,
+    serialize_string_slices,
+)
+from .catalogue import CatalogueEntry, StringCatalogue
+from .engine import (
+    ReadOnlySection,
+    RustStringSlice,
+    SliceSource,
+    StringSliceEngine,
+    string_slice_length_rejection,
+)
+from .incremental import (
+    INCREMENTAL_STATE_SESSION_KEY,
+    IncrementalRun,
+    IncrementalState,
+    get_incremental_state,
+)
+from .pairing import StoreEvent, pair_pointers_with_lengths
+from .regions import ReadOnlyRegionIndex
+from .report import ApiCallCounter, RejectionReason, RunReport
+from .settings import (
+    BULK_SCAN_SETTING,
+    CACHE_DIRECTORY_SETTING,
+    CACHE_MAX_SIZE_SETTING,
+    CACHE_SETTING,
+    CODE_WORKER_COUNT_SETTING,
+    DEBUG_LOGGING_SETTING,
+    INCREMENTAL_SETTING,
+    MIN_PRINTABLE_SCORE_SETTING,
+    REPORT_DIRECTORY_SETTING,
+)
+from .slicemap import SliceMap, uncovered_ranges
+from .store import CandidateSet, SliceStore, StoredStringSlice
+from .validate import DEFAULT_MIN_PRINTABLE_SCORE, SpanVerdict, score_string_slice
+
 logger = Logger(session_id=0, logger_name=__name__)
 
+READONLY_REGION_INDEX_SESSION_KEY = "rust_string_slicer.readonly_region_index"
+STRING_CATALOGUE_SESSION_KEY = "rust_string_slicer.catalogue"
+STRING_SLICE_CACHE_METADATA_KEY_PREFIX = "rust_string_slicer.cache."
+RUN_REPORT_METADATA_KEY_PREFIX = "rust_string_slicer.report."
+
+CHECKPOINT_METADATA_KEY_PREFIX = "rust_string_slicer.checkpoint."
+
+# Candidates are recovered and applied in chunks of this many bytes of address space.
+# Cancellation takes effect at the end of the current chunk, and each chunk is its own undo group.
+CHUNK_SIZE = 0x10000
+
+# Minimum number of consecutive `&str` which are typed as one array.
+MIN_STRING_SLICE_ARRAY_LENGTH = 2
+
+# Maximum number of strings shown in the report of a search of the catalogue.
+SEARCH_RESULT_LIMIT = 1000
+
+
+def _readonly_region_bounds(bv: BinaryView) -> Tuple[Tuple[int, int], ...]:
+    readonly_segments = [
+        (segment.start, segment.end)
+        for segment in bv.segments
+        if segment.readable and not segment.writable and not segment.executable
+    ]
+    readonly_sections = [
+        (section.start, section.end)
+        for section in bv.sections.values()
+        if section.semantics == SectionSemantics.ReadOnlyDataSectionSemantics
+    ]
+    return tuple(readonly_segments + readonly_sections)
+
+
+def get_readonly_region_index(bv: BinaryView) -> ReadOnlyRegionIndex:
+    """
+    Get the index of read-only segments and sections for this binary view.
+
+    The index is cached in the view's session data, and is rebuilt
+    whenever the set of read-only segment or section bounds changes.
+    """
+    bounds = _readonly_region_bounds(bv)
+    cached = bv.session_data.get(READONLY_REGION_INDEX_SESSION_KEY)
+    if cached is not None and cached[0] == bounds:
+        return cached[1]
+
+    index = ReadOnlyRegionIndex(bounds)
+    bv.session_data[READONLY_REGION_INDEX_SESSION_KEY] = (bounds, index)
+    logger.log_debug(f"Built read-only region index: {index}")
+    return index
+
+
+def get_string_catalogue(bv: BinaryView) -> StringCatalogue:
+    """
+    Get the catalogue of string slices recovered from this binary view in this session,
+    creating it the first time. Each run of a recovery task adds the string slices it applies.
+    """
+    catalogue = bv.session_data.get(STRING_CATALOGUE_SESSION_KEY)
+    if catalogue is None:
+        catalogue = StringCatalogue()
+        bv.session_data[STRING_CATALOGUE_SESSION_KEY] = catalogue
+    return catalogue
+
+
+def find_referencing_functions(
+    bv: BinaryView, string_slices: Iterable[RustStringSlice]
+) -> Dict[int, Tuple[int, ...]]:
+    """
+    Find the start addresses of the functions which reference the data of string slices from code,
+    in order, by the address of their data, leaving out string slices which are not referenced.
+
+    Each run of string data, with at most alignment padding between them, is first looked up
+    as one range, and its strings are only looked up one by one if anything in it is referenced.
+    """
+    arch = bv.arch
+    assert arch is not None
+    spans = sorted(
+        {
+            (string_slice.address, string_slice.address + string_slice.length)
+            for string_slice in string_slices
+        }
+    )
+    referencing_functions: Dict[int, Tuple[int, ...]] = {}
+    run_begin = 0
+    while run_begin < len(spans):
+        run_start, run_end = spans[run_begin]
+        run_stop = run_begin + 1
+        while (
+            run_stop < len(spans) and spans[run_stop][0] < run_end + arch.address_size
+        ):
+            run_end = max(run_end, spans[run_stop][1])
+            run_stop += 1
+        addresses = sorted({address for address, _end in spans[run_begin:run_stop]})
+        run_begin = run_stop
+
+        if (
+            len(addresses) > 1
+            and next(iter(bv.get_code_refs(run_start, run_end - run_start)), None)
+            is None
+        ):
+            continue
+        for address in addresses:
+            function_starts = {
+                code_ref.function.start
+                for code_ref in bv.get_code_refs(address)
+                if code_ref.function is not None
+            }
+            if function_starts:
+                referencing_functions[address] = tuple(sorted(function_starts))
+    return referencing_functions
+
+
+def create_string_slice_engine(
+    bv: BinaryView,
+    readonly_regions: ReadOnlyRegionIndex,
+    min_printable_score: float = DEFAULT_MIN_PRINTABLE_SCORE,
+) -> StringSliceEngine:
+    """
+    Create a `StringSliceEngine` over the read-only regions of this binary view,
+    reading each region once.
+    """
+    assert bv.arch is not None
+    return StringSliceEngine(
+        sections=[
+            ReadOnlySection(
+                name=f"region_{start:x}",
+                address=start,
+                data=bv.read(addr=start, length=end - start),
+            )
+            for start, end in readonly_regions.intervals
+        ],
+        address_size=bv.arch.address_size,
+        byteorder="big" if bv.arch.endianness == Endianness.BigEndian else "little",
+        min_printable_score=min_printable_score,
+    )
+
 
-@dataclass
-class RustStringSlice:
+def compute_readonly_content_hash(
+    bv: BinaryView, readonly_regions: ReadOnlyRegionIndex
+) -> bytes:
     """
-    Class to work with the string slice type in Rust, &str
+    Hash the contents of the read-only regions of this binary view, to key cached results by.
     """
+    assert bv.arch is not None
+    return compute_content_hash(
+        regions=(
+            (start, bv.read(addr=start, length=end - start))
+            for start, end in readonly_regions.intervals
+        ),
+        address_size=bv.arch.address_size,
+        byteorder="big" if bv.arch.endianness == Endianness.BigEndian else "little",
+    )
 
-    address: int
-    length: int
-    data: bytes
 
-    def __repr__(self):
-        return f"StringSlice(address={self.address:#x}, length={self.length:#x}, data={self.data!r})"
+def disk_cache_key(kind: str, content_hash: bytes, min_printable_score: float) -> str:
+    # Results for each threshold are kept side by side on disk,
+    # so switching the setting back and forth does not rescan.
+    return f"{content_hash.hex()}-{kind}-{min_printable_score!r}"
 
-    @classmethod
-    def check_binary_ninja_type_exists(cls, bv: BinaryView) -> bool:
-        return bv.get_type_by_name("&str") is not None
 
-    @classmethod
-    def create_binary_ninja_type(cls, bv: BinaryView):
-        if bv.arch is not None:
-            rust_string_slice_bn_type_obj = StructureBuilder.create(packed=True)
-            rust_string_slice_bn_type_obj.append(
-                type=PointerType.create(arch=bv.arch, type=Type.char()), name="_address"
+def load_cached_string_slices(
+    bv: BinaryView,
+    kind: str,
+    content_hash: bytes,
+    min_printable_score: float,
+    disk_cache: Optional[DiskCache] = None,
+) -> Optional[SliceStore]:
+    """
+    Load the string slices recovered by the heuristic `kind` from the view's metadata,
+    or failing that from `disk_cache`. Returns None if there are no cached results
+    for this content hash, heuristic version and minimum printable score.
+
+    The string data is not cached, but is unchanged since the content hash matches,
+    so can be read back from the view with `read_stored_string_slice`.
+    """
+    cached_string_slices = None
+    try:
+        blob = bv.query_metadata(STRING_SLICE_CACHE_METADATA_KEY_PREFIX + kind)
+    except KeyError:
+        blob = None
+    if isinstance(blob, bytes):
+        cached_string_slices = deserialize_string_slices(
+            blob, content_hash, min_printable_score
+        )
+
+    if cached_string_slices is None and disk_cache is not None:
+        blob = disk_cache.get(disk_cache_key(kind, content_hash, min_printable_score))
+        if blob is not None:
+            cached_string_slices = deserialize_string_slices(
+                blob, content_hash, min_printable_score
             )
-            rust_string_slice_bn_type_obj.append(
-                type=IntegerType.create(width=bv.arch.address_size), name="_length"
+    return cached_string_slices
+
+
+def read_stored_string_slice(
+    bv: BinaryView, stored_string_slice: StoredStringSlice
+) -> RustStringSlice:
+    return RustStringSlice(
+        address=stored_string_slice.address,
+        length=stored_string_slice.length,
+        data=bv.read(
+            addr=stored_string_slice.address, length=stored_string_slice.length
+        ),
+        location=stored_string_slice.location,
+        source=stored_string_slice.source,
+        confidence=stored_string_slice.confidence,
+    )
+
+
+def store_cached_string_slices(
+    bv: BinaryView,
+    kind: str,
+    content_hash: bytes,
+    min_printable_score: float,
+    string_slices: SliceStore,
+    disk_cache: Optional[DiskCache] = None,
+):
+    blob = serialize_string_slices(string_slices, content_hash, min_printable_score)
+    bv.store_metadata(STRING_SLICE_CACHE_METADATA_KEY_PREFIX + kind, blob)
+    if disk_cache is not None:
+        try:
+            disk_cache.put(
+                disk_cache_key(kind, content_hash, min_printable_score), blob
+            )
+        except OSError as err:
+            logger.log_warn(
+                f"Failed to write cached results to {disk_cache.directory}: {err}"
+            )
+
+
+def create_disk_cache(bv: BinaryView) -> Optional[DiskCache]:
+    directory = Settings().get_string(CACHE_DIRECTORY_SETTING, bv)
+    if not directory:
+        return None
+    return DiskCache(
+        directory=directory,
+        max_size=Settings().get_integer(CACHE_MAX_SIZE_SETTING, bv) * 1024 * 1024,
+    )
+
+
+def check_rust_string_slice_type_exists(bv: BinaryView) -> bool:
+    return bv.get_type_by_name("&str") is not None
+
+
+def create_rust_string_slice_type(bv: BinaryView):
+    if bv.arch is not None:
+        rust_string_slice_bn_type_obj = StructureBuilder.create(packed=True)
+        rust_string_slice_bn_type_obj.append(
+            type=PointerType.create(arch=bv.arch, type=Type.char()), name="_address"
+        )
+        rust_string_slice_bn_type_obj.append(
+            type=IntegerType.create(width=bv.arch.address_size), name="_length"
+        )
+
+        bv.define_user_type(
+            name="&str",
+            type_obj=rust_string_slice_bn_type_obj,
+        )
+        logger.log_info(f"Defined new type, `&str`, for Rust string slices")
+
+
+def create_rust_string_slice_instance(
+    bv: BinaryView, location: int, name: str, debug_logging: bool = True
+):
+    bv.define_user_data_var(addr=location, var_type="`&str`", name=name)
+    if debug_logging:
+        logger.log_debug(f"Defined new `&str` at {location:#x}")
+
+
+def create_rust_string_slice_array(
+    bv: BinaryView, location: int, count: int, name: str, debug_logging: bool = True
+):
+    bv.define_user_data_var(addr=location, var_type=f"`&str`[{count}]", name=name)
+    if debug_logging:
+        logger.log_debug(f"Defined new `&str`[{count}] at {location:#x}")
+
+
+def find_string_slice_runs(
+    string_slices: List[RustStringSlice], stride: int
+) -> List[List[RustStringSlice]]:
+    """
+    Group the string slices which have a location into runs whose (pointer, length) pairs
+    directly follow each other, `stride` bytes apart, in order of location.
+    Each location is only included once, and a `stride` of 0 puts each string slice in its own run.
+    """
+    located = sorted(
+        (
+            (string_slice.location, string_slice)
+            for string_slice in string_slices
+            if string_slice.location is not None
+        ),
+        key=lambda located_string_slice: located_string_slice[0],
+    )
+
+    runs: List[List[RustStringSlice]] = []
+    last_location = None
+    for location, string_slice in located:
+        if location == last_location:
+            continue
+        if last_location is not None and location == last_location + stride:
+            runs[-1].append(string_slice)
+        else:
+            runs.append([string_slice])
+        last_location = location
+    return runs
+
+
+def index_char_arrays(char_arrays: Dict[int, int]) -> ReadOnlyRegionIndex:
+    """
+    Index the [start, end) ranges of char arrays, given as lengths by address, so that pointers
+    anywhere into them are found, since rustc packs many string literals into one char array.
+    """
+    return ReadOnlyRegionIndex(
+        (address, address + length) for address, length in char_arrays.items()
+    )
+
+
+def find_string_slice_pairs_in_function(
+    function: Function, char_array_index: ReadOnlyRegionIndex
+) -> List[Tuple[int, int, int]]:
+    """
+    Find all places in a function's MLIL where a pointer into one of the char arrays
+    in `char_array_index` is written to a var, and pair each one with the nearest write
+    of a constant in the same basic block, which is a candidate for the string slice length.
+
+    Returns tuples of (address of the pointer write, address of the string data, candidate length).
+    """
+    mlil = function.mlil
+    if mlil is None:
+        return []
+
+    string_slice_pairs: List[Tuple[int, int, int]] = []
+    for basic_block in mlil.basic_blocks:
+        string_slice_pairs.extend(
+            pair_pointers_with_lengths(
+                _iter_store_events(basic_block, char_array_index),
+                address_size=function.arch.address_size,
+            )
+        )
+    return string_slice_pairs
+
+
+def _stack_slot_of_write(instruction: MediumLevelILInstruction) -> Optional[int]:
+    """
+    Get the stack offset written to by a MLIL_SET_VAR or MLIL_SET_VAR_FIELD, if the destination is a stack variable.
+    """
+    if instruction.dest.source_type != VariableSourceType.StackVariableSourceType:
+        return None
+    if instruction.operation == MediumLevelILOperation.MLIL_SET_VAR_FIELD:
+        return instruction.dest.storage + instruction.offset
+    return instruction.dest.storage
+
+
+# Operations after which the pointers waiting in registers for their lengths are clobbered.
+_CALL_OPERATIONS = frozenset(
+    (
+        MediumLevelILOperation.MLIL_CALL,
+        MediumLevelILOperation.MLIL_CALL_UNTYPED,
+        MediumLevelILOperation.MLIL_TAILCALL,
+        MediumLevelILOperation.MLIL_TAILCALL_UNTYPED,
+        MediumLevelILOperation.MLIL_SYSCALL,
+        MediumLevelILOperation.MLIL_SYSCALL_UNTYPED,
+    )
+)
+
+
+def _iter_store_events(
+    basic_block: MediumLevelILBasicBlock, char_array_index: ReadOnlyRegionIndex
+) -> Iterator[StoreEvent]:
+    for instruction in basic_block:
+        if instruction.operation in _CALL_OPERATIONS:
+            yield StoreEvent(
+                address=instruction.address, is_pointer=False, value=0, is_call=True
             )
+            continue
 
-            bv.define_user_type(
-                name="&str",
-                type_obj=rust_string_slice_bn_type_obj,
+        is_set_var = instruction.operation in (
+            MediumLevelILOperation.MLIL_SET_VAR,
+            MediumLevelILOperation.MLIL_SET_VAR_FIELD,
+        )
+        if is_set_var:
+            # Data pointer is being written to a var.
+            if (
+                isinstance(instruction.src, MediumLevelILConstPtr)
+                and instruction.src.constant in char_array_index
+            ):
+                yield StoreEvent(
+                    address=instruction.address,
+                    is_pointer=True,
+                    value=instruction.src.constant,
+                    slot=_stack_slot_of_write(instruction),
+                )
+                continue
+
+        # Look for a write of a constant to a var, for the length.
+        # Note that it may not be the next instruction!
+        for operand_name, operand, _operand_type in instruction.detailed_operands:
+            if operand_name == "src" and isinstance(operand, MediumLevelILConst):
+                yield StoreEvent(
+                    address=instruction.address,
+                    is_pointer=False,
+                    value=operand.constant,
+                    slot=_stack_slot_of_write(instruction) if is_set_var else None,
+                )
+
+
+def apply_string_slices(
+    bv: BinaryView,
+    string_slices: List[RustStringSlice],
+    debug_logging: bool = False,
+    update_analysis: bool = True,
+    slice_map: Optional[SliceMap] = None,
+) -> int:
+    """
+    Define recovered string slices in the binary view, as a single batch and undo group.
+
+    Each string's data is typed as `char[<length>]`, and each `&str` which refers to it
+    is typed and named after the string; runs of at least `MIN_STRING_SLICE_ARRAY_LENGTH`
+    consecutive `&str`, such as tables of names, are typed as one `&str[<count>]` array instead,
+    named after the first string. The `char[]` definitions are resolved with `slice_map`
+    so that they do not overlap, both within this batch and with earlier batches applied with
+    the same map. Returns the number of `char[]` definitions made.
+
+    If `update_analysis` is not set, the caller is responsible for updating analysis afterwards.
+    """
+    if slice_map is None:
+        slice_map = SliceMap()
+    char_array_addresses, char_array_lengths, replaced_addresses = slice_map.update(
+        (string_slice.address, string_slice.length) for string_slice in string_slices
+    )
+
+    # Reuse the same type object for all strings of the same length.
+    char_array_types: Dict[int, Type] = {}
+
+    bv.begin_undo_actions()
+    bv.begin_bulk_modify_symbols()
+    try:
+        for address in replaced_addresses:
+            bv.undefine_user_data_var(addr=address)
+
+        for address, length in zip(char_array_addresses, char_array_lengths):
+            char_array_type = char_array_types.get(length)
+            if char_array_type is None:
+                char_array_type = Type.array(type=Type.char(), count=length)
+                char_array_types[length] = char_array_type
+
+            # Set the char[<length>] type on the location of the string data.
+            existing_string_slice_data = bv.get_data_var_at(address)
+            if existing_string_slice_data is not None:
+                if existing_string_slice_data.type == char_array_type:
+                    continue
+                bv.undefine_user_data_var(addr=address)
+            bv.define_user_data_var(addr=address, var_type=char_array_type)
+
+        # Set the `&str` type on the location of each (pointer, length) pair, or of each run of them.
+        stride = 2 * bv.arch.address_size if bv.arch is not None else 0
+        for run in find_string_slice_runs(string_slices, stride):
+            location = cast(int, run[0].location)
+            if len(run) >= MIN_STRING_SLICE_ARRAY_LENGTH:
+                create_rust_string_slice_array(
+                    bv=bv,
+                    location=location,
+                    count=len(run),
+                    name=f'strs_"{run[0].text}"',
+                    debug_logging=debug_logging,
+                )
+                continue
+            create_rust_string_slice_instance(
+                bv=bv,
+                location=location,
+                name=f'str_"{run[0].text}"',
+                debug_logging=debug_logging,
             )
-            logger.log_info(f"Defined new type, `&str`, for Rust string slices")
+    finally:
+        bv.end_bulk_modify_symbols()
+        bv.commit_undo_actions()
+
+    if update_analysis:
+        bv.update_analysis()
+    return len(char_array_addresses)
+
+
+class RecoverStringSlicesTask(BackgroundTaskThread, metaclass=ABCMeta):
+    """
+    Common driver for the recovery tasks: detection of string slices (or loading them from the cache),
+    then application of them chunk by chunk, with a report of the run.
 
-    @classmethod
-    def create_binary_ninja_instance(cls, bv: BinaryView, location: int, name: str):
-        bv.define_user_data_var(addr=location, var_type="`&str`", name=name)
-        logger.log_info(f"Defined new `&str` at {location:#x}")
+    Subclasses implement `enumerate_candidates` and `recover_chunk` for full scans,
+    and `recover_incrementally` for incremental re-scans.
+    """
 
+    # Name of the task; see also `kind`.
+    task_name = ""
+    # Which changes incremental re-scans take from `IncrementalState`: "readonly" or "code".
+    incremental_task = ""
+    # What string slices are recovered from, for log messages.
+    description = ""
+    progress_text = ""
 
-class RecoverStringFromReadOnlyDataTask(BackgroundTaskThread):
-    def __init__(self, bv: BinaryView):
+    def __init__(
+        self,
+        bv: BinaryView,
+        incremental: bool = False,
+        use_cache: bool = False,
+        disk_cache: Optional[DiskCache] = None,
+        min_printable_score: float = DEFAULT_MIN_PRINTABLE_SCORE,
+        debug_logging: bool = False,
+        report_directory: Optional[str] = None,
+    ):
         super().__init__(
-            initial_progress_text="Recovering Rust strings from readonly data...",
+            initial_progress_text=self.progress_text,
             can_cancel=True,
         )
-        self.bv = bv
+        self.report = RunReport(task=self.kind, filename=_view_filename(bv))
+        self.unwrapped_bv = bv
+        # Count all calls made on the view in the report.
+        self.bv = cast(BinaryView, ApiCallCounter(bv, self.report.api_calls))
+        # Only re-examine what changed since the last run on this view.
+        self.incremental = incremental
+        # Reuse results cached in the view's metadata or in `disk_cache`; ignored for incremental re-scans.
+        self.use_cache = use_cache and not incremental
+        self.disk_cache = disk_cache
+        self.catalogue = get_string_catalogue(bv)
+        self.min_printable_score = min_printable_score
+        # Log every candidate at debug level; the messages are only formatted if this is set.
+        self.debug_logging = debug_logging
+        # If set, also write the report of each run as JSON to this directory.
+        self.report_directory = report_directory
+        # Number of candidates in the current scan, and how many of them have been processed.
+        self.progress_total = 0
+        self.progress_done = 0
+        self.progress_started_at = time.perf_counter()
+        # `char[]` definitions made in this run, so that those of later chunks do not overlap them.
+        self.slice_map = SliceMap()
+
+    @property
+    def kind(self) -> str:
+        """
+        Name of what the task recovers in this configuration, in reports, cache entries and metadata keys.
+        """
+        return self.task_name
+
+    @abstractmethod
+    def enumerate_candidates(self, readonly_regions: ReadOnlyRegionIndex) -> array:
+        """
+        Find all candidates for a full scan, returning their addresses in order.
+        Anything else needed to recover them is kept by the task, in the same order.
+        """
+
+    @abstractmethod
+    def recover_chunk(self, start: int, end: int) -> List[RustStringSlice]:
+        """
+        Recover string slices from the candidates from index `start` up to `end`
+        of those found by `enumerate_candidates`.
+        """
+
+    @abstractmethod
+    def recover_incrementally(
+        self, readonly_regions: ReadOnlyRegionIndex, incremental_run: IncrementalRun
+    ) -> List[RustStringSlice]:
+        """
+        Recover string slices from only what changed since the last run, as taken in `incremental_run`,
+        recording the new verdicts in it rather than in the view's `IncrementalState`.
+        """
+
+    def recover_all(
+        self, readonly_regions: ReadOnlyRegionIndex
+    ) -> List[RustStringSlice]:
+        """
+        Recover string slices from all candidates at once, without applying them.
+        """
+        return self.recover_chunk(0, len(self.enumerate_candidates(readonly_regions)))
 
     def run(self):
         if self.bv.arch is None:
@@ -72,163 +665,703 @@ class RecoverStringFromReadOnlyDataTask(BackgroundTaskThread):
             )
             return
 
-        readonly_segments = list(
-            filter(
-                lambda segment: segment.readable
-                and not segment.writable
-                and not segment.executable,
-                self.bv.segments,
+        readonly_regions = get_readonly_region_index(self.bv)
+        if not readonly_regions:
+            logger.log_error(
+                "Could not find any read-only segments or sections in binary, exiting"
+            )
+            return
+
+        content_hash = None
+        cached_string_slices = None
+        if self.use_cache:
+            content_hash = compute_readonly_content_hash(self.bv, readonly_regions)
+            cached_string_slices = load_cached_string_slices(
+                self.bv,
+                self.kind,
+                content_hash,
+                self.min_printable_score,
+                self.disk_cache,
+            )
+        self.report.cache_hit = cached_string_slices is not None
+
+        if cached_string_slices is not None:
+            # Chunked by location, as a full scan of read-only data is, so that the same `&str` arrays are defined.
+            cached_string_slices.sort_by_location()
+            self.process_in_chunks(
+                cached_string_slices.locations,
+                recover=lambda start, end: [
+                    read_stored_string_slice(self.bv, cached_string_slices[i])
+                    for i in range(start, end)
+                ],
             )
+        elif self.incremental:
+            self.rescan_incrementally(readonly_regions)
+        else:
+            all_string_slices = self.recover_full_scan(
+                readonly_regions, collect=content_hash is not None
+            )
+            if all_string_slices is not None and content_hash is not None:
+                store_cached_string_slices(
+                    self.bv,
+                    self.kind,
+                    content_hash,
+                    self.min_printable_score,
+                    all_string_slices,
+                    self.disk_cache,
+                )
+
+        if self.report.candidates["recovered"]:
+            self.bv.update_analysis()
+
+        self.report.cancelled = self.cancelled
+        self._finish_report()
+        if self.cancelled:
+            logger.log_info(
+                f"Recovering string slices from {self.description} was cancelled, "
+                f"after recovering {self.report.candidates['recovered']} string slices"
+            )
+            return
+
+        timings = ", ".join(
+            f"{stage} {seconds:.2f}s" for stage, seconds in self.report.timings.items()
+        )
+        logger.log_info(
+            f"Recovered {self.report.candidates['recovered']} string slices from {self.description} "
+            f"{'from cache ' if self.report.cache_hit else ''}({self.report.summary()}; {timings})"
         )
+        if self.report.rejections:
+            logger.log_info(
+                "Rejected candidates: "
+                + ", ".join(
+                    f"{reason} {count}"
+                    for reason, count in sorted(self.report.rejections.items())
+                )
+            )
+
+    def recover_full_scan(
+        self, readonly_regions: ReadOnlyRegionIndex, collect: bool = False
+    ) -> Optional[SliceStore]:
+        """
+        Recover and apply string slices from all candidates, a chunk at a time,
+        resuming from the checkpoint left by a cancelled or interrupted run if there is one.
+
+        If `collect` is set, all recovered string slices are returned, unless the task was cancelled
+        or resumed, since then not all of them are known.
+        """
+        candidate_addresses = self.enumerate_candidates(readonly_regions)
+
+        resume_address = self._load_checkpoint(readonly_regions)
+        if resume_address is not None:
+            logger.log_info(
+                f"Resuming recovery of string slices from {self.description} at {resume_address:#x}"
+            )
+
+        return self.process_in_chunks(
+            candidate_addresses,
+            recover=self.recover_chunk,
+            resume_address=resume_address,
+            readonly_regions=readonly_regions,
+            collect=collect and resume_address is None,
+        )
+
+    def rescan_incrementally(self, readonly_regions: ReadOnlyRegionIndex):
+        """
+        Recover and apply string slices from only what changed since the last run.
+
+        Incremental re-scans only examine what changed, so are not split into chunks. The new verdicts
+        are only saved once the string slices are applied; if the task is cancelled, or fails,
+        before then, the changes are left to be examined again by the next run.
+        """
+        state = get_incremental_state(self.bv)
+        incremental_run = state.take_dirty(self.incremental_task)
+        saved = False
+        try:
+            recovered_string_slices = self.recover_incrementally(
+                readonly_regions, incremental_run
+            )
+            if not self.cancelled:
+                self.apply(recovered_string_slices)
+                state.save(incremental_run)
+                saved = True
+        finally:
+            if not saved:
+                state.restore_dirty(incremental_run)
+
+    def process_in_chunks(
+        self,
+        candidate_addresses: Sequence[int],
+        recover: Callable[[int, int], List[RustStringSlice]],
+        readonly_regions: Optional[ReadOnlyRegionIndex] = None,
+        resume_address: Optional[int] = None,
+        collect: bool = False,
+    ) -> Optional[SliceStore]:
+        """
+        Recover and apply string slices from candidates at `candidate_addresses`, in order,
+        in chunks of `CHUNK_SIZE` bytes of address space, stopping after the current chunk
+        if the task is cancelled. `recover` is called with the range of indices of each chunk.
+
+        If `readonly_regions` is given, a checkpoint is stored after each chunk, and removed once all are done.
+        Candidates before `resume_address` are skipped.
+        If `collect` is set, all recovered string slices are returned, unless the task was cancelled.
+        """
+        collected = SliceStore() if collect else None
+        first_index = (
+            0
+            if resume_address is None
+            else bisect_left(candidate_addresses, resume_address)
+        )
+        self.progress_total = len(candidate_addresses) - first_index
+        self.progress_done = 0
+        self.progress_started_at = time.perf_counter()
+        self.update_progress()
+
+        for chunk_end, start, end in split_into_chunks(
+            candidate_addresses, CHUNK_SIZE, first_index
+        ):
+            if self.cancelled:
+                return None
+            recovered_string_slices = recover(start, end)
+            # The chunk may be incomplete, so is left to be recovered again when resuming.
+            if self.cancelled:
+                return None
+            self.apply(recovered_string_slices)
+            if collected is not None:
+                collected.extend(recovered_string_slices)
+            if readonly_regions is not None:
+                self._store_checkpoint(readonly_regions, chunk_end)
+
+            self.progress_done += end - start
+            self.update_progress()
+
+        if readonly_regions is not None:
+            self._remove_checkpoint()
+        return collected
+
+    def apply(self, string_slices: List[RustStringSlice]):
+        """
+        Apply recovered string slices as one undo group.
+        """
+        application_start = time.perf_counter()
+        apply_string_slices(
+            self.bv,
+            string_slices,
+            self.debug_logging,
+            update_analysis=False,
+            slice_map=self.slice_map,
+        )
+        self.report.timings["application"] += time.perf_counter() - application_start
+        self.report.candidates["recovered"] += len(string_slices)
+        self.report.details[
+            "char_arrays_skipped_as_overlapping"
+        ] = self.slice_map.skipped
+
+        # Once incremental re-scans are in use, keep them from re-examining what was just defined.
+        incremental_state: Optional[
+            IncrementalState
+        ] = self.unwrapped_bv.session_data.get(INCREMENTAL_STATE_SESSION_KEY)
+        if incremental_state is not None:
+            incremental_state.ignore_own_data_vars(
+                address
+                for string_slice in string_slices
+                for address in (string_slice.address, string_slice.location)
+                if address is not None
+            )
+
+        # Look up the referencing functions here, on the task's thread, rather than in a search.
+        catalogue_start = time.perf_counter()
+        self.catalogue.add(
+            string_slices, find_referencing_functions(self.bv, string_slices)
+        )
+        self.report.timings["catalogue"] += time.perf_counter() - catalogue_start
+
+    def update_progress(self, detail: str = ""):
+        progress = self.progress_text
+        if self.progress_total:
+            fraction_done = self.progress_done / self.progress_total
+            progress += f" {fraction_done:.0%}"
+            if 0 < fraction_done < 1:
+                elapsed = time.perf_counter() - self.progress_started_at
+                remaining = elapsed / fraction_done * (1 - fraction_done)
+                progress += f", about {format_duration(remaining)} remaining"
+        self.progress = f"{progress} {detail}({self.report.summary()})"
+
+    def _checkpoint_key(self) -> str:
+        return CHECKPOINT_METADATA_KEY_PREFIX + self.kind
+
+    def _load_checkpoint(self, readonly_regions: ReadOnlyRegionIndex) -> Optional[int]:
+        """
+        Get the address to resume a cancelled or interrupted full scan from, if there is a checkpoint
+        for the same read-only regions, heuristics and minimum printable score.
+        """
+        try:
+            checkpoint = self.unwrapped_bv.query_metadata(self._checkpoint_key())
+        except KeyError:
+            return None
+        if (
+            not isinstance(checkpoint, dict)
+            or checkpoint.get("heuristic_version") != HEURISTIC_VERSION
+            or checkpoint.get("min_printable_score") != self.min_printable_score
+            or checkpoint.get("regions")
+            != [[start, end] for start, end in readonly_regions.intervals]
+        ):
+            return None
+        return checkpoint.get("next_address")
+
+    def _store_checkpoint(
+        self, readonly_regions: ReadOnlyRegionIndex, next_address: int
+    ):
+        # Stored through the unwrapped view, so that checkpoints are not counted in the report.
+        self.unwrapped_bv.store_metadata(
+            self._checkpoint_key(),
+            {
+                "heuristic_version": HEURISTIC_VERSION,
+                "min_printable_score": self.min_printable_score,
+                "regions": [[start, end] for start, end in readonly_regions.intervals],
+                "next_address": next_address,
+            },
+        )
+
+    def _remove_checkpoint(self):
+        # Removed once a full scan completes, so that the next run starts over.
+        try:
+            self.unwrapped_bv.remove_metadata(self._checkpoint_key())
+        except KeyError:
+            pass
+
+    def _finish_report(self):
+        self.update_progress()
+        # Stored through the unwrapped view, so that storing the report is not counted in it.
+        self.unwrapped_bv.store_metadata(
+            RUN_REPORT_METADATA_KEY_PREFIX + self.kind, self.report.to_dict()
+        )
+        if self.report_directory:
+            basename = os.path.basename(self.report.filename or "") or "view"
+            path = os.path.join(
+                self.report_directory,
+                f"{basename}-{self.kind}-{int(self.report.started_at)}.json",
+            )
+            try:
+                os.makedirs(self.report_directory, exist_ok=True)
+                with open(path, "w") as f:
+                    f.write(self.report.to_json())
+            except OSError as err:
+                logger.log_warn(f"Failed to write run report to {path}: {err}")
+
+    def _reject(self, reason: RejectionReason, message: str = ""):
+        self.report.reject(reason)
+        if self.debug_logging and message:
+            logger.log_debug(
+                f"{message}; excluding from final results ({reason.value})"
+            )
+
+    def _validate_string_slice(
+        self,
+        location: Optional[int],
+        address: int,
+        data: bytes,
+        source: SliceSource,
+        verdict: Optional[SpanVerdict] = None,
+    ) -> Optional[RustStringSlice]:
+        """
+        Validate a candidate string slice at `address`, pointed to from a `&str` at `location` if known.
+
+        `verdict` may be given if the data has already been scored.
+        """
+        if self.debug_logging:
+            logger.log_debug(
+                f"Obtained candidate string slice with addr {address:#x}, len {len(data):#x}: {data!r}"
+            )
+
+        # Sanity check whether the recovered string is valid UTF-8, and looks like text
+        if verdict is None:
+            validation_start = time.perf_counter()
+            verdict = score_string_slice(data)
+            self.report.timings["validation"] += time.perf_counter() - validation_start
+            self.report.candidates["validated"] += 1
+        if not verdict.valid_utf8:
+            self._reject(
+                RejectionReason.INVALID_UTF8,
+                f"Candidate string slice {data!r} does not decode to a valid UTF-8 string",
+            )
+            return None
+        if verdict.printable_score < self.min_printable_score:
+            self._reject(
+                RejectionReason.NOT_PRINTABLE,
+                f"Candidate string slice {data!r} is not printable enough ({verdict.printable_score:.2f})",
+            )
+            return None
 
-        readonly_sections = list(
-            filter(
-                lambda section: section.semantics
-                == SectionSemantics.ReadOnlyDataSectionSemantics,
-                self.bv.sections.values(),
+        if self.debug_logging:
+            logger.log_debug(
+                f'Recovered string at addr {address:#x}, len {len(data):#x}: "{data.decode("utf-8")}"'
             )
+
+        return RustStringSlice(
+            address=address,
+            length=len(data),
+            data=data,
+            location=location,
+            source=source,
+            confidence=verdict.printable_score,
         )
 
-        if len(readonly_segments) == 0 and len(readonly_sections) == 0:
+    def _read_string_slice_data(self, address: int, length: int) -> Optional[bytes]:
+        """
+        Read the data of a candidate string slice with an acceptable length,
+        returning None if it could not be read in full.
+        """
+        reads_start = time.perf_counter()
+        # Attempt to read out the pointed to value as a string slice, with the length obtained above.
+        try:
+            data = self.bv.read(addr=address, length=length)
+        except Exception as err:
             logger.log_error(
-                "Could not find any read-only segments or sections in binary, exiting"
+                f"Failed to read from address {address} with length {length}: {err}"
             )
-            return
+            data = None
+        self.report.timings["reads"] += time.perf_counter() - reads_start
+        self.report.candidates["read"] += 1
 
-        self.bv.begin_undo_actions()
-        # Obtain all data vars which are pointers to data in read-only data segments or sections
-        data_vars_to_readonly_data: List[DataVariable] = []
-        for (
-            _data_var_addr,
-            candidate_string_slice_data_ptr,
-        ) in self.bv.data_vars.items():
-            if isinstance(candidate_string_slice_data_ptr.type, PointerType):
-                for readonly_segment_or_section in (
-                    readonly_segments + readonly_sections
-                ):
-                    if (
-                        candidate_string_slice_data_ptr.value
-                        in readonly_segment_or_section
-                    ):
-                        data_vars_to_readonly_data.append(
-                            candidate_string_slice_data_ptr
-                        )
-                        logger.log_debug(
-                            f"Found pointer var at {candidate_string_slice_data_ptr.address:#x} ({candidate_string_slice_data_ptr}) pointing to {candidate_string_slice_data_ptr.value:#x} "
-                        )
+        if data is None or len(data) != length:
+            self._reject(
+                RejectionReason.READ_FAILURE,
+                f"Could not read {length:#x} bytes at {address:#x}",
+            )
+            return None
+        return data
+
+
+class RecoverStringFromReadOnlyDataTask(RecoverStringSlicesTask):
+    task_name = "readonly_data"
+    incremental_task = "readonly"
+    description = "readonly data"
+    progress_text = "Recovering Rust strings from readonly data..."
+
+    def __init__(self, bv: BinaryView, bulk_scan: bool = False, **kwargs):
+        # Incremental re-scans only apply to data vars, so are ignored for bulk scans.
+        if bulk_scan:
+            kwargs["incremental"] = False
+        self.bulk_scan = bulk_scan
+        super().__init__(bv, **kwargs)
+        # Read-only regions read by a bulk scan, and scanned for candidates.
+        self.engine: Optional[StringSliceEngine] = None
+        # Columns of the candidates found by `enumerate_candidates`, in order of location:
+        # where the pointer is, what it points to, and for bulk scans, the length after it.
+        self.candidate_locations = array("Q")
+        self.candidate_addresses = array("Q")
+        self.candidate_lengths = array("Q")
+
+    @property
+    def kind(self) -> str:
+        return "readonly_data_bulk_scan" if self.bulk_scan else "readonly_data"
+
+    def enumerate_candidates(self, readonly_regions: ReadOnlyRegionIndex) -> array:
+        if self.bulk_scan:
+            return self._enumerate_bulk_scan_candidates(readonly_regions)
+
+        enumeration_start = time.perf_counter()
+        # Obtain all data vars which are pointers to data in read-only data segments or sections,
+        # keeping only their addresses and the addresses they point to.
+        self.candidate_locations = array("Q")
+        self.candidate_addresses = array("Q")
+        for candidate_string_slice_data_ptr in self.bv.data_vars.values():
+            if self._is_pointer_to_readonly_data(
+                candidate_string_slice_data_ptr, readonly_regions
+            ):
+                self.candidate_locations.append(candidate_string_slice_data_ptr.address)
+                self.candidate_addresses.append(candidate_string_slice_data_ptr.value)
+                if self.debug_logging:
+                    logger.log_debug(
+                        f"Found pointer var at {candidate_string_slice_data_ptr.address:#x} ({candidate_string_slice_data_ptr}) pointing to {candidate_string_slice_data_ptr.value:#x} "
+                    )
+        _sort_columns(self.candidate_locations, self.candidate_addresses)
+        self.report.timings["enumeration"] += time.perf_counter() - enumeration_start
+        self.report.candidates["enumerated"] += len(self.candidate_locations)
+        return self.candidate_locations
+
+    def recover_chunk(self, start: int, end: int) -> List[RustStringSlice]:
+        if self.bulk_scan:
+            return self._recover_from_candidate_pairs(start, end)
+        return list(
+            self.recover_from_pointers(
+                zip(
+                    self.candidate_locations[start:end],
+                    self.candidate_addresses[start:end],
+                )
+            )
+        )
+
+    def recover_from_pointers(
+        self, pointers: Iterable[Tuple[int, int]]
+    ) -> Iterator[RustStringSlice]:
+        """
+        Recover string slices from (location, address) pairs of pointers into read-only data,
+        which autoanalysis has already typed as pointer data vars.
+        """
+        for location, address in pointers:
+            recovered_string_slice = self._recover_from_pointer(location, address)
+            if recovered_string_slice is not None:
+                yield recovered_string_slice
+
+    def recover_incrementally(
+        self, readonly_regions: ReadOnlyRegionIndex, incremental_run: IncrementalRun
+    ) -> List[RustStringSlice]:
+        """
+        Recover string slices from data vars, only re-examining data vars which have changed
+        since the last run on this binary view.
+
+        Only string slices whose verdict has changed since the last run are returned.
+        """
+        assert self.bv.arch is not None
+
+        enumeration_start = time.perf_counter()
+        state = get_incremental_state(self.bv)
+        previous_verdicts = state.previous_readonly_data_verdicts(incremental_run)
+        data_vars: Iterable[DataVariable]
+        if incremental_run.needs_full_scan:
+            data_vars = self.bv.data_vars.values()
+        else:
+            # A change to a data var can also change the verdict for the pointer before it,
+            # whose length it would be.
+            dirty_data_var_addrs = incremental_run.dirty_data_vars
+            addresses_to_check = dirty_data_var_addrs | {
+                address - self.bv.arch.address_size for address in dirty_data_var_addrs
+            }
+            dirty_data_vars: List[DataVariable] = []
+            for address in sorted(addresses_to_check):
+                data_var = self.bv.get_data_var_at(address)
+                if data_var is None:
+                    incremental_run.readonly_data_verdicts[address] = None
+                else:
+                    dirty_data_vars.append(data_var)
+            data_vars = dirty_data_vars
+            logger.log_debug(f"Incrementally checking {len(dirty_data_vars)} data vars")
+        self.report.timings["enumeration"] += time.perf_counter() - enumeration_start
 
         recovered_string_slices: List[RustStringSlice] = []
-        for candidate_string_slice_data_ptr in data_vars_to_readonly_data:
-            # Try to read an integer following the data var,
-            # and treat it as a candidate for a string slice length.
-            candidate_string_slice_len_addr = (
-                candidate_string_slice_data_ptr.address
-                + candidate_string_slice_data_ptr.type.width
-            )
-
-            # Filter out anything at the candidate address
-            # that's already defined as any data var type which is not an integer.
-            existing_data_var_at_candidate_string_slice_len_addr = (
-                self.bv.get_data_var_at(candidate_string_slice_len_addr)
-            )
-            if existing_data_var_at_candidate_string_slice_len_addr is not None:
-                if not isinstance(
-                    existing_data_var_at_candidate_string_slice_len_addr.type,
-                    IntegerType,
-                ):
-                    continue
+        for data_var in data_vars:
+            if self.cancelled:
+                return []
+            recovered_string_slice = None
+            if self._is_pointer_to_readonly_data(data_var, readonly_regions):
+                self.report.candidates["enumerated"] += 1
+                recovered_string_slice = self._recover_from_pointer(
+                    data_var.address, data_var.value
+                )
+
+            verdict = (
+                None
+                if recovered_string_slice is None
+                else (recovered_string_slice.address, recovered_string_slice.length)
+            )
+            incremental_run.readonly_data_verdicts[data_var.address] = verdict
+            if recovered_string_slice is not None and verdict != previous_verdicts.get(
+                data_var.address
+            ):
+                recovered_string_slices.append(recovered_string_slice)
+
+        return recovered_string_slices
+
+    def _is_pointer_to_readonly_data(
+        self, data_var: DataVariable, readonly_regions: ReadOnlyRegionIndex
+    ) -> bool:
+        return (
+            isinstance(data_var.type, PointerType)
+            and data_var.value in readonly_regions
+        )
 
+    def _recover_from_pointer(
+        self, location: int, address: int
+    ) -> Optional[RustStringSlice]:
+        """
+        Recover a string slice at `address`, from a pointer data var to it at `location`.
+        """
+        arch = self.bv.arch
+        assert arch is not None
+
+        reads_start = time.perf_counter()
+        # Try to read an integer following the data var,
+        # and treat it as a candidate for a string slice length.
+        candidate_string_slice_len_addr = location + arch.address_size
+
+        # Filter out anything at the candidate address
+        # that's already defined as any data var type which is not an integer.
+        is_integer_or_undefined = self._is_integer_or_undefined(
+            candidate_string_slice_len_addr
+        )
+        if is_integer_or_undefined:
             candidate_string_slice_len = self.bv.read_int(
                 address=candidate_string_slice_len_addr,
-                size=self.bv.arch.address_size,  # In Rust's definition of the `str` type, this length is a `usize`, which is defined to be the same size as the size of pointers for the platform.
+                size=arch.address_size,  # In Rust's definition of the `str` type, this length is a `usize`, which is defined to be the same size as the size of pointers for the platform.
                 sign=False,
-                endian=self.bv.arch.endianness,
+                endian=arch.endianness,
             )
+        self.report.timings["reads"] += time.perf_counter() - reads_start
+
+        if not is_integer_or_undefined:
+            self._reject(
+                RejectionReason.NON_INTEGER_LENGTH_VAR,
+                f"Pointer var at {location:#x} is followed by a data var which is not an integer",
+            )
+            return None
 
+        if self.debug_logging:
             logger.log_debug(
-                f"Pointer var at {candidate_string_slice_data_ptr.address:#x} is followed by integer with value {candidate_string_slice_len:#x}"
+                f"Pointer var at {location:#x} is followed by integer with value {candidate_string_slice_len:#x}"
             )
 
-            # Filter out any potential string slice which has length 0
-            if candidate_string_slice_len == 0:
-                continue
-            # Filter out any potential string slice which is too long
-            if candidate_string_slice_len >= 0x1000:  # TODO: maybe change this limit
-                continue
+        length_rejection = string_slice_length_rejection(candidate_string_slice_len)
+        if length_rejection is not None:
+            self.report.reject(length_rejection)
+            return None
 
-            # Attempt to read out the pointed to value as a string slice, with the length obtained above.
-            try:
-                candidate_string_slice = self.bv.read(
-                    addr=candidate_string_slice_data_ptr.value,
-                    length=candidate_string_slice_len,
-                )
-            except Exception as err:
-                logger.log_error(
-                    f"Failed to read from address {candidate_string_slice_data_ptr.value} with length {candidate_string_slice_len}: {err}"
-                )
-                continue
+        candidate_string_slice = self._read_string_slice_data(
+            address, candidate_string_slice_len
+        )
+        if candidate_string_slice is None:
+            return None
 
-            logger.log_debug(
-                f"Obtained candidate string slice with addr {candidate_string_slice_data_ptr.value:#x}, len {candidate_string_slice_len:#x}: {candidate_string_slice}"
+        return self._validate_string_slice(
+            location=location,
+            address=address,
+            data=candidate_string_slice,
+            source=SliceSource.READONLY_DATA,
+        )
+
+    def _enumerate_bulk_scan_candidates(
+        self, readonly_regions: ReadOnlyRegionIndex
+    ) -> array:
+        """
+        Read each read-only region once, and scan it for (pointer, length) pairs as arrays of `usize` words.
+
+        This also finds string slices which autoanalysis never typed as a pointer data var.
+        Since lengths are checked while scanning, candidates with a length which is zero
+        or too long are never enumerated, so are not counted as rejected.
+        """
+        reads_start = time.perf_counter()
+        self.engine = create_string_slice_engine(
+            self.bv, readonly_regions, self.min_printable_score
+        )
+        self.report.timings["reads"] += time.perf_counter() - reads_start
+
+        enumeration_start = time.perf_counter()
+        self.candidate_locations = array("Q")
+        self.candidate_addresses = array("Q")
+        self.candidate_lengths = array("Q")
+        for location, address, length in self.engine.find_candidate_pairs():
+            self.candidate_locations.append(location)
+            self.candidate_addresses.append(address)
+            self.candidate_lengths.append(length)
+        _sort_columns(
+            self.candidate_locations, self.candidate_addresses, self.candidate_lengths
+        )
+        self.report.timings["enumeration"] += time.perf_counter() - enumeration_start
+        self.report.candidates["enumerated"] += len(self.candidate_locations)
+        # The string data lies entirely in one read-only region, so it is already read.
+        self.report.candidates["read"] += len(self.candidate_locations)
+        return self.candidate_locations
+
+    def _recover_from_candidate_pairs(
+        self, start: int, end: int
+    ) -> List[RustStringSlice]:
+        assert self.engine is not None and self.bv.arch is not None
+        address_size = self.bv.arch.address_size
+        candidate_pairs = list(
+            zip(
+                self.candidate_locations[start:end],
+                self.candidate_addresses[start:end],
+                self.candidate_lengths[start:end],
             )
+        )
 
-            # Sanity check whether the recovered string is valid UTF-8
-            try:
-                candidate_utf8_string = candidate_string_slice.decode("utf-8")
-                logger.log_info(
-                    f'Recovered string at addr {candidate_string_slice_data_ptr.value:#x}, len {candidate_string_slice_len:#x}: "{candidate_utf8_string}"'
-                )
+        # Validate the data in the buffers we already have, in one batch per region.
+        validation_start = time.perf_counter()
+        verdicts = self.engine.validate_candidate_pairs(candidate_pairs)
+        self.report.timings["validation"] += time.perf_counter() - validation_start
+        self.report.candidates["validated"] += len(candidate_pairs)
 
-                # Append the final string slice object to the list of recovered strings.
-                recovered_string_slices.append(
-                    RustStringSlice(
-                        address=candidate_string_slice_data_ptr.value,
-                        length=candidate_string_slice_len,
-                        data=candidate_string_slice,
-                    )
+        recovered_string_slices: List[RustStringSlice] = []
+        for (
+            candidate_string_slice_location,
+            candidate_string_slice_addr,
+            candidate_string_slice_len,
+        ), verdict in zip(candidate_pairs, verdicts):
+            if self.debug_logging:
+                logger.log_debug(
+                    f"Found candidate pair at {candidate_string_slice_location:#x} pointing to {candidate_string_slice_addr:#x} with length {candidate_string_slice_len:#x}"
                 )
 
-                # Set the char[<candidate_string_slice_len>] type on the location pointed to by the data var.
-                existing_string_slice_data = self.bv.get_data_var_at(
-                    candidate_string_slice_data_ptr.value
+            # Check the data first, since it is cheaper than asking the binary view about the length.
+            if verdict.is_plausible(self.min_printable_score):
+                reads_start = time.perf_counter()
+                is_integer_or_undefined = self._is_integer_or_undefined(
+                    candidate_string_slice_location + address_size
                 )
-                if existing_string_slice_data is not None:
-                    self.bv.undefine_user_data_var(
-                        addr=candidate_string_slice_data_ptr.value
+                self.report.timings["reads"] += time.perf_counter() - reads_start
+                if not is_integer_or_undefined:
+                    self._reject(
+                        RejectionReason.NON_INTEGER_LENGTH_VAR,
+                        f"Candidate pair at {candidate_string_slice_location:#x} has a data var which is not an integer as its length",
                     )
+                    continue
 
-                self.bv.define_user_data_var(
-                    addr=candidate_string_slice_data_ptr.value,
-                    var_type=Type.array(
-                        type=Type.char(), count=candidate_string_slice_len
-                    ),
-                )
+            candidate_string_slice = self.engine.read(
+                candidate_string_slice_addr, candidate_string_slice_len
+            )
+            assert candidate_string_slice is not None
+            recovered_string_slice = self._validate_string_slice(
+                location=candidate_string_slice_location,
+                address=candidate_string_slice_addr,
+                data=candidate_string_slice,
+                source=SliceSource.READONLY_DATA_BULK_SCAN,
+                verdict=verdict,
+            )
+            if recovered_string_slice is not None:
+                recovered_string_slices.append(recovered_string_slice)
 
-                # Set the RustStringSlice type on the location of the data var.
-                RustStringSlice.create_binary_ninja_instance(
-                    bv=self.bv,
-                    location=candidate_string_slice_data_ptr.address,
-                    name=f'str_"{candidate_utf8_string}"',
-                )
+        return recovered_string_slices
 
-            except UnicodeDecodeError as err:
-                logger.log_warn(
-                    f"Candidate string slice {candidate_string_slice} does not decode to a valid UTF-8 string; excluding from final results: {err}"
-                )
-                continue
-        self.bv.commit_undo_actions()
-        self.bv.update_analysis()
+    def _is_integer_or_undefined(self, address: int) -> bool:
+        existing_data_var = self.bv.get_data_var_at(address)
+        return existing_data_var is None or isinstance(
+            existing_data_var.type, IntegerType
+        )
 
 
-class RecoverStringFromCodeTask(BackgroundTaskThread):
-    def __init__(self, bv: BinaryView):
-        super().__init__(
-            initial_progress_text="Recovering Rust strings from code...",
-            can_cancel=True,
+class RecoverStringFromCodeTask(RecoverStringSlicesTask):
+    task_name = "code"
+    incremental_task = "code"
+    description = "code"
+    progress_text = "Recovering Rust strings from code..."
+
+    def __init__(self, bv: BinaryView, worker_count: int = 0, **kwargs):
+        super().__init__(bv, **kwargs)
+        # Number of threads to scan functions with; 0 means one per core.
+        self.worker_count = worker_count
+        # Ranges of the char arrays in read-only data, and the (address, length) candidates
+        # already validated, in a full scan.
+        self.char_array_index = ReadOnlyRegionIndex(())
+        self.seen_candidates = CandidateSet()
+        # Start addresses of the functions found by `enumerate_candidates`, in order;
+        # each chunk only gets the functions it scans from the view.
+        self.function_starts = array("Q")
+
+    def enumerate_candidates(self, readonly_regions: ReadOnlyRegionIndex) -> array:
+        """
+        Find the functions which reference char arrays in read-only data, to scan for string slices.
+        """
+        enumeration_start = time.perf_counter()
+        char_arrays = self._find_char_arrays(
+            self.bv.data_vars.values(), readonly_regions
         )
-        self.bv = bv
+        self.char_array_index = index_char_arrays(char_arrays)
+        self.seen_candidates = CandidateSet()
+        self.function_starts = self._functions_referencing(char_arrays)
+        self.report.timings["enumeration"] += time.perf_counter() - enumeration_start
+        return self.function_starts
 
-    def run(self):
+    def recover_chunk(self, start: int, end: int) -> List[RustStringSlice]:
         # char const data_14003ca50[0x27] = "{size limit reached}SizeLimitExhausted", 0
         # ->
         # 0 @ 14002c910  (MLIL_SET_VAR rcx_1 = (MLIL_VAR rdx))
@@ -252,151 +1385,535 @@ class RecoverStringFromCodeTask(BackgroundTaskThread):
         # 70 @ 14002c902  (MLIL_CALL (MLIL_CONST_PTR _ZN4core6result13unwrap_failed17h45a312f1aaedd5feE)())
         # 71 @ 14002c902  (MLIL_NORET noreturn)
 
-        if self.bv.arch is None:
-            logger.log_error(
-                "Could not get architecture of current binary view, exiting"
-            )
-            return None
+        # The xref from data method is more reliable, so `RecoverAllStringSlicesTask` runs it first,
+        # and only scans code for the char arrays which it did not resolve.
 
-        readonly_segments = list(
-            filter(
-                lambda segment: segment.readable
-                and not segment.writable
-                and not segment.executable,
-                self.bv.segments,
+        enumeration_start = time.perf_counter()
+        functions = [
+            function
+            for function in map(
+                self.bv.get_function_at, self.function_starts[start:end]
             )
-        )
+            if function is not None
+        ]
+        pairs_by_function_start = self._scan_functions(functions, self.char_array_index)
+        candidate_pairs = [
+            pair
+            for function_start in sorted(pairs_by_function_start)
+            for pair in pairs_by_function_start[function_start]
+        ]
+        self.report.timings["enumeration"] += time.perf_counter() - enumeration_start
+        return self._validate_candidate_pairs(candidate_pairs, self.seen_candidates)
+
+    def recover_incrementally(
+        self, readonly_regions: ReadOnlyRegionIndex, incremental_run: IncrementalRun
+    ) -> List[RustStringSlice]:
+        """
+        Recover string slices from code, only re-scanning functions which have changed since
+        the last run on this binary view, and functions which reference newly found char arrays.
 
-        readonly_sections = list(
-            filter(
-                lambda section: section.semantics
-                == SectionSemantics.ReadOnlyDataSectionSemantics,
-                self.bv.sections.values(),
+        Only string slices from pairs which were not found in the last run are returned.
+        """
+        enumeration_start = time.perf_counter()
+        state = get_incremental_state(self.bv)
+        previous_verdicts = state.previous_code_verdicts(incremental_run)
+        if incremental_run.needs_full_scan:
+            char_arrays = self._find_char_arrays(
+                self.bv.data_vars.values(), readonly_regions
             )
+            function_starts = set(self._functions_referencing(char_arrays))
+        else:
+            dirty_data_var_addrs = incremental_run.dirty_data_vars
+            dirty_data_vars = [
+                data_var
+                for data_var in map(self.bv.get_data_var_at, dirty_data_var_addrs)
+                if data_var is not None
+            ]
+            current_char_arrays = self._find_char_arrays(
+                dirty_data_vars, readonly_regions
+            )
+            new_char_arrays = {
+                address: length
+                for address, length in current_char_arrays.items()
+                if state.char_arrays.get(address) != length
+            }
+            char_arrays = {
+                address: length
+                for address, length in state.char_arrays.items()
+                if address not in dirty_data_var_addrs
+            }
+            char_arrays.update(current_char_arrays)
+
+            function_starts = set(self._functions_referencing(new_char_arrays))
+            function_starts.update(incremental_run.dirty_functions)
+        functions: List[Function] = []
+        for function_start in sorted(function_starts):
+            function = self.bv.get_function_at(function_start)
+            if function is None:
+                incremental_run.code_verdicts[function_start] = None
+            else:
+                functions.append(function)
+        incremental_run.char_arrays = char_arrays
+        logger.log_debug(
+            f"Incrementally scanning {len(functions)} functions (full scan: {incremental_run.needs_full_scan})"
         )
 
-        if len(readonly_segments) == 0 and len(readonly_sections) == 0:
-            logger.log_error(
-                "Could not find any read-only segments or sections in binary, exiting"
-            )
-            return
+        pairs_by_function_start = self._scan_functions(
+            functions, index_char_arrays(char_arrays)
+        )
+        if self.cancelled:
+            return []
 
-        # TODO: Since the xref from data method is more reliable, we probably want to always do that as the first pass
-        # track which ones didn't work after that first pass, and only do the ones that didn't work after the first pass here
+        new_pairs: List[Tuple[int, int, int]] = []
+        for function_start in sorted(pairs_by_function_start):
+            pairs = pairs_by_function_start[function_start]
+            previous_pairs = set(previous_verdicts.get(function_start, []))
+            new_pairs.extend(pair for pair in pairs if pair not in previous_pairs)
+            incremental_run.code_verdicts[function_start] = pairs
+        self.report.timings["enumeration"] += time.perf_counter() - enumeration_start
+        return self._validate_candidate_pairs(new_pairs)
 
+    def _find_char_arrays(
+        self,
+        data_vars: Iterable[DataVariable],
+        readonly_regions: ReadOnlyRegionIndex,
+    ) -> Dict[int, int]:
         # Obtain all data vars which are themselves already identified char arays, in readonly data segments.
         # TODO: what about non-ascii strings? will binja type them to char arrays in its initial autoanalysis?
-        self.bv.begin_undo_actions()
-        char_array_data_vars_in_readonly_data: List[DataVariable] = []
-        for _data_var_addr, candidate_string_slice_data in self.bv.data_vars.items():
-            if isinstance(candidate_string_slice_data.type, ArrayType):
-                for readonly_segment_or_section in (
-                    readonly_segments + readonly_sections
-                ):
-                    if (
-                        candidate_string_slice_data.address
-                        in readonly_segment_or_section
-                    ):
-                        char_array_data_vars_in_readonly_data.append(
-                            candidate_string_slice_data
-                        )
-                        logger.log_debug(
-                            f"Found char array var at {candidate_string_slice_data.address:#x} ({candidate_string_slice_data}) with value {candidate_string_slice_data.value} "
-                        )
-
-        # Find cross-references to those data vars, from code.
-        for data_var in char_array_data_vars_in_readonly_data:
-            code_refs = self.bv.get_code_refs(data_var.address)
-            for code_ref in code_refs:
-                if code_ref.mlil is not None:
-                    logger.log_debug(f"{code_ref.address:#x}: {code_ref.mlil.instr}")
-
-                    # Obtain more information about the instruction at the cross reference.
-                    # Is the pointer being read, or written to?
-                    # Is the other operand a register, or a memory location?
-                    if code_ref.mlil.instr.operation in (
-                        MediumLevelILOperation.MLIL_SET_VAR,
-                        MediumLevelILOperation.MLIL_SET_VAR_FIELD,
-                    ):
-                        # Data pointer is being written to a var; look for a write of a constant to a var, for the length.
-                        # Note that it may not be the next instruction!
-                        # Filter so that we only look after the cross-referenced instruction, but still within the same basic block.
-                        for instruction in filter(
-                            lambda instr: instr.instr_index > code_ref.mlil.instr_index,
-                            code_ref.mlil.il_basic_block,
-                        ):
-                            logger.log_debug(
-                                f"instruction: {instruction.instr_index}, {instruction}"
-                            )
-                            for detailed_operand in instruction.detailed_operands:
-                                if detailed_operand[0] == "src" and isinstance(
-                                    detailed_operand[1], MediumLevelILConst
-                                ):
-                                    candidate_string_slice_data_addr = data_var.address
-                                    candidate_string_slice_data = data_var.value
-                                    candidate_string_slice_len = detailed_operand[
-                                        1
-                                    ].value.value
-                                    logger.log_debug(
-                                        f"Reference to candidate string in code at {code_ref.address:#x} with data at {candidate_string_slice_data_addr:#x} with value {candidate_string_slice_data} is followed by store of integer with value {candidate_string_slice_len}"
-                                    )
-
-                                    # Filter out any potential string slice which has length 0
-                                    if candidate_string_slice_len == 0:
-                                        continue
-                                    # Filter out any potential string slice which is too long
-                                    if (
-                                        candidate_string_slice_len >= 0x1000
-                                    ):  # TODO: maybe change this limit
-                                        continue
-
-                                    # Attempt to read out the pointed to value as a string slice, with the length obtained above.
-                                    try:
-                                        candidate_string_slice = self.bv.read(
-                                            addr=candidate_string_slice_data_addr,
-                                            length=candidate_string_slice_len,
-                                        )
-                                    except Exception as err:
-                                        logger.log_error(
-                                            f"Failed to read from address {candidate_string_slice_data_addr} with length {candidate_string_slice_len}: {err}"
-                                        )
-                                        continue
-
-                                    # Sanity check whether the recovered string is valid UTF-8
-                                    try:
-                                        candidate_utf8_string = (
-                                            candidate_string_slice.decode("utf-8")
-                                        )
-
-                                        logger.log_info(
-                                            f'Recovered string referenced in code at {code_ref.address:#x}, with data at addr {candidate_string_slice_data_addr:#x}, len {candidate_string_slice_len}: "{candidate_utf8_string}"'
-                                        )
-
-                                        self.bv.define_user_data_var(
-                                            addr=data_var.address,
-                                            var_type=Type.array(
-                                                type=Type.char(),
-                                                count=candidate_string_slice_len,
-                                            ),
-                                        )
-
-                                    except UnicodeDecodeError as err:
-                                        logger.log_warn(
-                                            f"Candidate string slice {candidate_string_slice} does not decode to a valid UTF-8 string; excluding from final results: {err}"
-                                        )
-                                        continue
-
-        self.bv.commit_undo_actions()
-        self.bv.update_analysis()
+        char_arrays: Dict[int, int] = {}
+        for candidate_string_slice_data in data_vars:
+            if self._is_char_array_in_readonly_data(
+                candidate_string_slice_data, readonly_regions
+            ):
+                char_arrays[
+                    candidate_string_slice_data.address
+                ] = candidate_string_slice_data.type.width
+                if self.debug_logging:
+                    logger.log_debug(
+                        f"Found char array var at {candidate_string_slice_data.address:#x} ({candidate_string_slice_data}) with value {candidate_string_slice_data.value} "
+                    )
+        return char_arrays
+
+    def _is_char_array_in_readonly_data(
+        self, data_var: DataVariable, readonly_regions: ReadOnlyRegionIndex
+    ) -> bool:
+        return (
+            isinstance(data_var.type, ArrayType)
+            and data_var.address in readonly_regions
+        )
+
+    def _functions_referencing(self, char_arrays: Dict[int, int]) -> array:
+        """
+        Find the start addresses of the functions which reference anywhere in `char_arrays`,
+        given as lengths by address, from code, in order, so that each function's MLIL
+        only needs to be visited once.
+        """
+        function_starts: Set[int] = set()
+        for address, length in char_arrays.items():
+            for code_ref in self.bv.get_code_refs(address, length):
+                if code_ref.function is not None:
+                    function_starts.add(code_ref.function.start)
+        return array("Q", sorted(function_starts))
+
+    def _validate_candidate_pairs(
+        self,
+        candidate_string_slice_pairs: List[Tuple[int, int, int]],
+        seen_candidates: Optional[CandidateSet] = None,
+    ) -> List[RustStringSlice]:
+        """
+        Validate candidate (code reference, address, length) pairs, skipping any (address, length)
+        in `seen_candidates`, which is updated with the candidates validated here.
+        """
+        self.report.candidates["enumerated"] += len(candidate_string_slice_pairs)
+        # Only the candidates of this batch are held as a set of tuples.
+        batch_candidates: Set[Tuple[int, int]] = set()
+
+        recovered_string_slices: List[RustStringSlice] = []
+        for (
+            code_ref_address,
+            candidate_string_slice_data_addr,
+            candidate_string_slice_len,
+        ) in candidate_string_slice_pairs:
+            if self.debug_logging:
+                logger.log_debug(
+                    f"Reference to candidate string in code at {code_ref_address:#x} with data at {candidate_string_slice_data_addr:#x} is followed by store of integer with value {candidate_string_slice_len}"
+                )
+
+            length_rejection = string_slice_length_rejection(candidate_string_slice_len)
+            if length_rejection is not None:
+                self.report.reject(length_rejection)
+                continue
+            candidate = (candidate_string_slice_data_addr, candidate_string_slice_len)
+            if candidate in batch_candidates or (
+                seen_candidates is not None and candidate in seen_candidates
+            ):
+                self.report.reject(RejectionReason.DUPLICATE)
+                continue
+            batch_candidates.add(candidate)
+
+            candidate_string_slice = self._read_string_slice_data(
+                candidate_string_slice_data_addr, candidate_string_slice_len
+            )
+            if candidate_string_slice is None:
+                continue
+
+            recovered_string_slice = self._validate_string_slice(
+                location=None,
+                address=candidate_string_slice_data_addr,
+                data=candidate_string_slice,
+                source=SliceSource.CODE,
+            )
+            if recovered_string_slice is not None:
+                if self.debug_logging:
+                    logger.log_debug(
+                        f"String at addr {candidate_string_slice_data_addr:#x} is referenced in code at {code_ref_address:#x}"
+                    )
+                recovered_string_slices.append(recovered_string_slice)
+
+        if seen_candidates is not None:
+            seen_candidates.update(batch_candidates)
+        return recovered_string_slices
+
+    def _scan_functions(
+        self, functions: List[Function], char_array_index: ReadOnlyRegionIndex
+    ) -> Dict[int, List[Tuple[int, int, int]]]:
+        """
+        Scan the MLIL of each function for string slice pairs, spread over a pool of worker threads.
+
+        Results are returned by function start address, so that they can be merged in an order
+        which does not depend on the order in which the workers finish.
+        Functions whose MLIL could not be generated are left out, and counted in the report.
+        If the task is cancelled, no results are returned.
+        """
+        results_by_function_start: Dict[int, List[Tuple[int, int, int]]] = {}
+        with ThreadPoolExecutor(
+            max_workers=self.worker_count or os.cpu_count() or 1
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self._scan_function, function, char_array_index
+                ): function.start
+                for function in functions
+            }
+            for completed_count, future in enumerate(as_completed(futures), start=1):
+                pairs = future.result()
+                if pairs is None:
+                    self.report.details["functions_without_mlil"] = (
+                        self.report.details.get("functions_without_mlil", 0) + 1
+                    )
+                else:
+                    results_by_function_start[futures[future]] = pairs
+                self.update_progress(f"{completed_count}/{len(functions)} functions ")
+                if self.cancelled:
+                    for pending_future in futures:
+                        pending_future.cancel()
+                    return {}
+
+        return results_by_function_start
+
+    def _scan_function(
+        self, function: Function, char_array_index: ReadOnlyRegionIndex
+    ) -> Optional[List[Tuple[int, int, int]]]:
+        """
+        Scan one function, on a worker thread. Returns None if its MLIL could not be generated;
+        any other error is raised again in the task's thread by `_scan_functions`.
+        """
+        if self.cancelled:
+            return []
+        try:
+            return find_string_slice_pairs_in_function(function, char_array_index)
+        except ILException as err:
+            logger.log_warn(
+                f"Skipping function at {function.start:#x}, since its MLIL could not be generated: {err}"
+            )
+            return None
+
+
+class RecoverAllStringSlicesTask(
+    RecoverStringFromReadOnlyDataTask, RecoverStringFromCodeTask
+):
+    """
+    Recover string slices from readonly data first, then from code, but only for the char arrays
+    which the readonly data heuristic did not resolve, and apply all of them at once.
+    """
+
+    task_name = "all"
+    description = "readonly data and code"
+    progress_text = "Recovering Rust strings from readonly data and code..."
+
+    def __init__(self, bv: BinaryView, **kwargs):
+        # The code pass depends on all results of the readonly data pass,
+        # so there are no incremental re-scans.
+        kwargs["incremental"] = False
+        super().__init__(bv, **kwargs)
+
+    @property
+    def kind(self) -> str:
+        return "all_bulk_scan" if self.bulk_scan else "all"
+
+    def recover_all(
+        self, readonly_regions: ReadOnlyRegionIndex
+    ) -> List[RustStringSlice]:
+        return self.detect(readonly_regions) or []
+
+    def recover_full_scan(
+        self, readonly_regions: ReadOnlyRegionIndex, collect: bool = False
+    ) -> Optional[SliceStore]:
+        """
+        Recover string slices from readonly data and code, and apply all of them in one batch.
+
+        This is not split into chunks or checkpointed, since the code pass depends on
+        all results of the readonly data pass.
+        """
+        recovered_string_slices = self.detect(readonly_regions)
+        if recovered_string_slices is None:
+            return None
+        self.apply(recovered_string_slices)
+        return SliceStore(recovered_string_slices) if collect else None
+
+    def detect(
+        self, readonly_regions: ReadOnlyRegionIndex
+    ) -> Optional[List[RustStringSlice]]:
+        """
+        Recover string slices from readonly data and code, without applying them.
+        Returns None if the task is cancelled.
+        """
+        # Enumerate data vars once, for both pointers into read-only data and char arrays.
+        enumeration_start = time.perf_counter()
+        self.candidate_locations = array("Q")
+        self.candidate_addresses = array("Q")
+        char_arrays: Dict[int, int] = {}
+        for data_var in self.bv.data_vars.values():
+            if self._is_char_array_in_readonly_data(data_var, readonly_regions):
+                char_arrays[data_var.address] = data_var.type.width
+            elif not self.bulk_scan and self._is_pointer_to_readonly_data(
+                data_var, readonly_regions
+            ):
+                self.candidate_locations.append(data_var.address)
+                self.candidate_addresses.append(data_var.value)
+        _sort_columns(self.candidate_locations, self.candidate_addresses)
+        self.report.timings["enumeration"] += time.perf_counter() - enumeration_start
+
+        if self.bulk_scan:
+            candidate_locations = self._enumerate_bulk_scan_candidates(readonly_regions)
+        else:
+            candidate_locations = self.candidate_locations
+            self.report.candidates["enumerated"] += len(candidate_locations)
+
+        recovered_string_slices: List[RustStringSlice] = []
+        self.progress_total = len(candidate_locations)
+        self.progress_done = 0
+        self.progress_started_at = time.perf_counter()
+        for _chunk_end, start, end in split_into_chunks(
+            candidate_locations, CHUNK_SIZE
+        ):
+            if self.cancelled:
+                return None
+            recovered_string_slices.extend(
+                RecoverStringFromReadOnlyDataTask.recover_chunk(self, start, end)
+            )
+            self.progress_done += end - start
+            self.update_progress("readonly data ")
+
+        # Only scan code for the parts of char arrays which are still left, since a char array
+        # may hold other string literals after the ones the readonly data pass recovered.
+        enumeration_start = time.perf_counter()
+        remaining_char_arrays = dict(
+            uncovered_ranges(
+                char_arrays.items(),
+                (
+                    (string_slice.address, string_slice.length)
+                    for string_slice in recovered_string_slices
+                ),
+            )
+        )
+        self.char_array_index = index_char_arrays(remaining_char_arrays)
+        self.seen_candidates = CandidateSet()
+        self.function_starts = self._functions_referencing(remaining_char_arrays)
+        self.report.timings["enumeration"] += time.perf_counter() - enumeration_start
+        self.progress_total = 0
+        recovered_from_code = RecoverStringFromCodeTask.recover_chunk(
+            self, 0, len(self.function_starts)
+        )
+        if self.cancelled:
+            return None
+
+        char_array_addresses = sorted(char_arrays)
+        char_arrays_left = {
+            char_array_addresses[bisect_right(char_array_addresses, address) - 1]
+            for address in remaining_char_arrays
+        }
+        self.report.details.update(
+            char_arrays=len(char_arrays),
+            char_arrays_resolved_from_readonly_data=len(char_arrays)
+            - len(char_arrays_left),
+            char_array_parts_left=len(remaining_char_arrays),
+            functions_scanned=len(self.function_starts),
+            recovered_from_readonly_data=len(recovered_string_slices),
+            recovered_from_code=len(recovered_from_code),
+        )
+        logger.log_info(
+            f"Readonly data pass resolved {self.report.details['char_arrays_resolved_from_readonly_data']} "
+            f"of {len(char_arrays)} char arrays, so the code pass only looked up references to "
+            f"the {len(remaining_char_arrays)} parts of char arrays left, and scanned {len(self.function_starts)} functions"
+        )
+
+        recovered_string_slices.extend(recovered_from_code)
+        return recovered_string_slices
+
+
+def _sort_columns(keys: array, *columns: array):
+    """
+    Sort parallel columns in place by `keys`, if they are not already in order.
+    """
+    if all(keys[i] <= keys[i + 1] for i in range(len(keys) - 1)):
+        return
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    for column in (keys, *columns):
+        column[:] = array(column.typecode, (column[i] for i in order))
+
+
+def split_into_chunks(
+    addresses: Sequence[int], chunk_size: int, start: int = 0
+) -> Iterator[Tuple[int, int, int]]:
+    """
+    Split `addresses`, in order, from index `start` into chunks of `chunk_size` bytes of address space,
+    yielding the end address of each chunk, and the range of indices of the addresses in it.
+    Empty chunks are skipped.
+    """
+    while start < len(addresses):
+        chunk_end = (addresses[start] // chunk_size + 1) * chunk_size
+        end = bisect_left(addresses, chunk_end, start)
+        yield chunk_end, start, end
+        start = end
+
+
+def format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes:02}m"
+    if minutes:
+        return f"{minutes}m {seconds:02}s"
+    return f"{seconds}s"
+
+
+def _view_filename(bv: BinaryView) -> str:
+    file = getattr(bv, "file", None)
+    return getattr(file, "filename", None) or ""
+
+
+def _task_options(bv: BinaryView) -> Dict[str, Any]:
+    """
+    Options shared by both recovery tasks, from the settings for this view.
+    """
+    settings = Settings()
+    return {
+        "incremental": settings.get_bool(INCREMENTAL_SETTING, bv),
+        "use_cache": settings.get_bool(CACHE_SETTING, bv),
+        "disk_cache": create_disk_cache(bv),
+        "min_printable_score": settings.get_double(MIN_PRINTABLE_SCORE_SETTING, bv),
+        "debug_logging": settings.get_bool(DEBUG_LOGGING_SETTING, bv),
+        "report_directory": settings.get_string(REPORT_DIRECTORY_SETTING, bv) or None,
+    }
 
 
 def action_recover_string_slices_from_code(bv: BinaryView):
-    if not RustStringSlice.check_binary_ninja_type_exists(bv):
-        RustStringSlice.create_binary_ninja_type(bv)
-    RecoverStringFromCodeTask(bv=bv).start()
+    if not check_rust_string_slice_type_exists(bv):
+        create_rust_string_slice_type(bv)
+    RecoverStringFromCodeTask(
+        bv=bv,
+        worker_count=Settings().get_integer(CODE_WORKER_COUNT_SETTING, bv),
+        **_task_options(bv),
+    ).start()
+
+
+def action_recover_all_string_slices(bv: BinaryView):
+    if not check_rust_string_slice_type_exists(bv):
+        create_rust_string_slice_type(bv)
+    RecoverAllStringSlicesTask(
+        bv=bv,
+        bulk_scan=Settings().get_bool(BULK_SCAN_SETTING, bv),
+        worker_count=Settings().get_integer(CODE_WORKER_COUNT_SETTING, bv),
+        **_task_options(bv),
+    ).start()
+
+
+def _escape_markdown(text: str) -> str:
+    return re.sub(r"([\\`*_{}\[\]<>()#+\-.!|])", r"\\\1", text)
+
+
+def format_catalogue_entries(
+    title: str, entries: List[CatalogueEntry], limit: int
+) -> str:
+    """
+    Format catalogue entries as a Markdown table, showing at most `limit` of them.
+    """
+    lines = [f"# {_escape_markdown(title)}", ""]
+    if not entries:
+        lines.append("No matching strings.")
+        return "\n".join(lines)
+    if len(entries) > limit:
+        lines += [f"Showing the first {limit} matching strings.", ""]
+
+    lines += [
+        "| String | Address | Length | `&str` | Referenced from |",
+        "| --- | --- | --- | --- | --- |",
+    ]
+    for entry in entries[:limit]:
+        location = "" if entry.location is None else f"{entry.location:#x}"
+        referencing_functions = ", ".join(
+            f"{function_start:#x}" for function_start in entry.referencing_functions
+        )
+        # Show escapes for newlines and other control characters, as in the string's source.
+        text = _escape_markdown(repr(entry.text)[1:-1])
+        lines.append(
+            f"| {text} | {entry.address:#x} | {entry.length:#x} | {location} | {referencing_functions} |"
+        )
+    return "\n".join(lines)
+
+
+def action_search_recovered_strings(bv: BinaryView):
+    catalogue = get_string_catalogue(bv)
+    if not len(catalogue):
+        logger.log_warn(
+            "No strings have been recovered from this binary view in this session; run one of the recovery commands first"
+        )
+        return
+
+    query = get_text_line_input(
+        "Text to search for, /regular expression/, or 0x address:",
+        "Search Recovered Strings",
+    )
+    if query is None:
+        return
+    if isinstance(query, bytes):
+        query = query.decode("utf-8")
+
+    if re.fullmatch(r"0x[0-9a-fA-F]+", query.strip()):
+        entries = catalogue.lookup(int(query.strip(), 16))
+    elif len(query) > 1 and query.startswith("/") and query.endswith("/"):
+        try:
+            entries = catalogue.search_regex(query[1:-1], limit=SEARCH_RESULT_LIMIT + 1)
+        except re.error as err:
+            logger.log_error(f"Invalid regular expression {query[1:-1]!r}: {err}")
+            return
+    else:
+        entries = catalogue.search(query, limit=SEARCH_RESULT_LIMIT + 1)
+
+    bv.show_markdown_report(
+        "Recovered Strings",
+        format_catalogue_entries(
+            f"Recovered strings matching {query}", entries, SEARCH_RESULT_LIMIT
+        ),
+    )
 
 
 def action_recover_string_slices_from_readonly_data(bv: BinaryView):
-    if not RustStringSlice.check_binary_ninja_type_exists(bv):
-        RustStringSlice.create_binary_ninja_type(bv)
-    RecoverStringFromReadOnlyDataTask(bv=bv).start()
+    if not check_rust_string_slice_type_exists(bv):
+        create_rust_string_slice_type(bv)
+    RecoverStringFromReadOnlyDataTask(
+        bv=bv,
+        bulk_scan=Settings().get_bool(BULK_SCAN_SETTING, bv),
+        **_task_options(bv),
+    ).start()
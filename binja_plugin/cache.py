@@ -0,0 +1,158 @@
+"""
+Compact binary serialisation of recovered string slices, and a size-bounded on-disk cache for it.
+
+Serialised results are keyed by a content hash of the read-only regions they were recovered from,
+and stamped with `HEURISTIC_VERSION` and the minimum printable score they were validated with,
+so that results from older heuristics, or from a different threshold, are discarded.
+"""
+
+import hashlib
+import os
+import struct
+from typing import Iterable, List, Optional, Tuple
+
+from .store import SliceStore
+
+# Bump whenever a heuristic changes what it recovers,
+# so that results cached by older versions of the plugin are no longer used.
+HEURISTIC_VERSION = 2
+
+CACHE_MAGIC = b"RSSC"
+CACHE_FORMAT_VERSION = 2
+
+# magic, format version, heuristic version, content hash, minimum printable score,
+# number of string slices
+_HEADER = struct.Struct("<4sHH32sdI")
+
+CACHE_FILE_SUFFIX = ".rss"
+
+
+def compute_content_hash(
+    regions: Iterable[Tuple[int, bytes]], address_size: int, byteorder: str
+) -> bytes:
+    """
+    Hash the contents and load addresses of read-only regions, given as (address, data) pairs,
+    together with the pointer size and endianness they are interpreted with.
+    """
+    content_hash = hashlib.sha256()
+    content_hash.update(struct.pack("<B", address_size))
+    content_hash.update(byteorder.encode("ascii"))
+    for address, data in sorted(regions, key=lambda region: region[0]):
+        content_hash.update(struct.pack("<QQ", address, len(data)))
+        content_hash.update(data)
+    return content_hash.digest()
+
+
+def serialize_string_slices(
+    string_slices: SliceStore, content_hash: bytes, min_printable_score: float
+) -> bytes:
+    """
+    Serialise string slices as a header followed by one packed array per field.
+    The string data itself is not stored, since it can be read back from the binary.
+    """
+    return (
+        _HEADER.pack(
+            CACHE_MAGIC,
+            CACHE_FORMAT_VERSION,
+            HEURISTIC_VERSION,
+            content_hash,
+            min_printable_score,
+            len(string_slices),
+        )
+        + string_slices.to_bytes()
+    )
+
+
+def deserialize_string_slices(
+    blob: bytes, content_hash: bytes, min_printable_score: float
+) -> Optional[SliceStore]:
+    """
+    Deserialise string slices serialised with `serialize_string_slices`.
+
+    Returns None if the blob is malformed, was written by a different format or heuristic version,
+    or was recovered from read-only regions with a different content hash, or with a different
+    minimum printable score.
+    """
+    if len(blob) < _HEADER.size:
+        return None
+    (
+        magic,
+        format_version,
+        heuristic_version,
+        blob_content_hash,
+        blob_min_printable_score,
+        count,
+    ) = _HEADER.unpack_from(blob)
+    if (
+        magic != CACHE_MAGIC
+        or format_version != CACHE_FORMAT_VERSION
+        or heuristic_version != HEURISTIC_VERSION
+        or blob_content_hash != content_hash
+        or blob_min_printable_score != min_printable_score
+    ):
+        return None
+
+    return SliceStore.from_bytes(memoryview(blob)[_HEADER.size :], count)
+
+
+class DiskCache:
+    """
+    Directory of serialised results, one file per key, holding at most `max_size` bytes in total.
+
+    Reading an entry marks it as recently used; when the total size goes over `max_size`,
+    the least recently used entries are evicted.
+    """
+
+    def __init__(self, directory: str, max_size: int):
+        self.directory = directory
+        self.max_size = max_size
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + CACHE_FILE_SUFFIX)
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                blob = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return blob
+
+    def put(self, key: str, blob: bytes) -> None:
+        if len(blob) > self.max_size:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as f:
+            f.write(blob)
+        # Atomic, so that concurrent readers never see a partially written entry.
+        os.replace(temporary_path, path)
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove least recently used entries until the total size is at most `max_size`.
+        """
+        entries: List[Tuple[float, int, str]] = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(CACHE_FILE_SUFFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_size = sum(size for _mtime, size, _path in entries)
+        for _mtime, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
@@ -0,0 +1,268 @@
+"""
+Searchable catalogue of recovered string slices.
+
+Strings are indexed by the trigrams (runs of three characters) of their text, so that a
+substring search only has to check the strings which contain every trigram of the query,
+and by the address of their data and of the `&str` which refers to them, along with the start
+addresses of the functions which reference each string's data from code.
+"""
+
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
+
+from .engine import RustStringSlice, SliceSource
+from .store import NO_LOCATION
+
+TRIGRAM_LENGTH = 3
+
+
+class CatalogueEntry(NamedTuple):
+    address: int
+    length: int
+    location: Optional[int]
+    source: SliceSource
+    text: str
+    # Start addresses of the functions which reference the string data from code, in order.
+    referencing_functions: Sequence[int]
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i : i + TRIGRAM_LENGTH] for i in range(len(text) - TRIGRAM_LENGTH + 1)}
+
+
+class StringCatalogue:
+    """
+    Catalogue of the string slices recovered from one binary view, which is added to
+    as each batch of string slices is applied.
+
+    Like `SliceStore`, each field is held in its own typed `array`, and entries are only
+    created for the results of a query. Batches are added from the recovery tasks' threads
+    while searches may run on the UI thread, so all access is done under a lock.
+    The referencing functions of each batch are looked up by the recovery task before it
+    is added, so that nothing calls into the binary view while the lock is held.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._addresses = array("Q")
+        self._lengths = array("Q")
+        self._locations = array("Q")
+        self._sources = array("B")
+        self._texts: List[str] = []
+        # Each string's referencing functions are `_function_starts[begin:end]`.
+        self._function_starts = array("Q")
+        self._function_begins = array("Q")
+        self._function_ends = array("Q")
+
+        # Index of the last string added with its data or its `&str` at each address,
+        # and for each string, the index of the string added before it at the same address,
+        # or -1, for its data and for its `&str`.
+        self._last_ids_by_address: Dict[int, int] = {}
+        self._previous_ids_by_address = array("q")
+        self._previous_ids_by_location = array("q")
+
+        # Sorted indices of the strings containing each trigram, for the first
+        # `_trigram_indexed_count` strings. The rest are indexed by the next search,
+        # so that adding strings does not slow down the recovery tasks.
+        self._ids_by_trigram: Dict[str, array] = {}
+        self._trigram_indexed_count = 0
+
+    def __len__(self) -> int:
+        return len(self._addresses)
+
+    def __repr__(self):
+        return f"<StringCatalogue: {len(self)} strings>"
+
+    def add(
+        self,
+        string_slices: Iterable[RustStringSlice],
+        referencing_functions: Optional[Mapping[int, Sequence[int]]] = None,
+    ) -> None:
+        """
+        Add recovered string slices, with the start addresses of the functions which reference
+        their data from code, in order, by the address of their data.
+        """
+        if referencing_functions is None:
+            referencing_functions = {}
+        with self._lock:
+            for string_slice in string_slices:
+                address = string_slice.address
+                location = (
+                    NO_LOCATION
+                    if string_slice.location is None
+                    else string_slice.location
+                )
+
+                # A string slice which is recovered again only has its referencing functions
+                # replaced, since the code may have changed.
+                entry_id = None
+                if address in self._last_ids_by_address:
+                    entry_id = self._find(address, string_slice.length, location)
+                if entry_id is not None:
+                    self._function_begins[entry_id] = len(self._function_starts)
+                    self._function_starts.extend(referencing_functions.get(address, ()))
+                    self._function_ends[entry_id] = len(self._function_starts)
+                    continue
+
+                entry_id = len(self._addresses)
+                self._addresses.append(address)
+                self._lengths.append(string_slice.length)
+                self._locations.append(location)
+                self._sources.append(string_slice.source)
+                self._texts.append(string_slice.text)
+                self._function_begins.append(len(self._function_starts))
+                self._function_starts.extend(referencing_functions.get(address, ()))
+                self._function_ends.append(len(self._function_starts))
+
+                self._previous_ids_by_address.append(
+                    self._last_ids_by_address.get(address, -1)
+                )
+                self._last_ids_by_address[address] = entry_id
+                if location == NO_LOCATION:
+                    self._previous_ids_by_location.append(-1)
+                else:
+                    self._previous_ids_by_location.append(
+                        self._last_ids_by_address.get(location, -1)
+                    )
+                    self._last_ids_by_address[location] = entry_id
+
+    def search(
+        self, substring: str, limit: Optional[int] = None
+    ) -> List[CatalogueEntry]:
+        """
+        Find the strings which contain `substring`, in the order they were recovered.
+        """
+        with self._lock:
+            texts = self._texts
+            if len(substring) < TRIGRAM_LENGTH:
+                candidate_ids: Iterable[int] = range(len(texts))
+            else:
+                self._index_trigrams()
+                postings = []
+                for trigram in _trigrams(substring):
+                    ids = self._ids_by_trigram.get(trigram)
+                    if ids is None:
+                        return []
+                    postings.append(ids)
+                postings.sort(key=len)
+                candidate_ids = (
+                    entry_id
+                    for entry_id in postings[0]
+                    if all(_contains(ids, entry_id) for ids in postings[1:])
+                )
+            return self._take(
+                (
+                    entry_id
+                    for entry_id in candidate_ids
+                    if substring in texts[entry_id]
+                ),
+                limit,
+            )
+
+    def search_regex(
+        self, pattern: Union[str, "re.Pattern[str]"], limit: Optional[int] = None
+    ) -> List[CatalogueEntry]:
+        """
+        Find the strings in which the regular expression `pattern` matches anywhere,
+        in the order they were recovered.
+        """
+        search = re.compile(pattern).search
+        with self._lock:
+            return self._take(
+                (entry_id for entry_id, text in enumerate(self._texts) if search(text)),
+                limit,
+            )
+
+    def lookup(self, address: int) -> List[CatalogueEntry]:
+        """
+        Find the strings whose data, or whose `&str`, is at `address`, in the order they were recovered.
+        """
+        with self._lock:
+            return [self._entry(entry_id) for entry_id in self._ids_at(address)][::-1]
+
+    def referencing_functions(self, address: int) -> Sequence[int]:
+        """
+        Get the start addresses of the functions which reference the string data at `address`.
+        """
+        with self._lock:
+            for entry_id in self._ids_at(address):
+                if self._addresses[entry_id] == address:
+                    return self._referencing_functions(entry_id)
+        return ()
+
+    def _find(self, address: int, length: int, location: int) -> Optional[int]:
+        for entry_id in self._ids_at(address):
+            if (
+                self._addresses[entry_id] == address
+                and self._lengths[entry_id] == length
+                and self._locations[entry_id] == location
+            ):
+                return entry_id
+        return None
+
+    def _ids_at(self, address: int) -> Iterator[int]:
+        """
+        Indices of the strings whose data or `&str` is at `address`, from the last one added.
+        """
+        entry_id = self._last_ids_by_address.get(address, -1)
+        while entry_id != -1:
+            yield entry_id
+            if self._addresses[entry_id] == address:
+                entry_id = self._previous_ids_by_address[entry_id]
+            else:
+                entry_id = self._previous_ids_by_location[entry_id]
+
+    def _entry(self, entry_id: int) -> CatalogueEntry:
+        location = self._locations[entry_id]
+        return CatalogueEntry(
+            address=self._addresses[entry_id],
+            length=self._lengths[entry_id],
+            location=None if location == NO_LOCATION else location,
+            source=SliceSource(self._sources[entry_id]),
+            text=self._texts[entry_id],
+            referencing_functions=self._referencing_functions(entry_id),
+        )
+
+    def _referencing_functions(self, entry_id: int) -> Sequence[int]:
+        return self._function_starts[
+            self._function_begins[entry_id] : self._function_ends[entry_id]
+        ]
+
+    def _index_trigrams(self) -> None:
+        ids_by_trigram = self._ids_by_trigram
+        for entry_id in range(self._trigram_indexed_count, len(self._texts)):
+            for trigram in _trigrams(self._texts[entry_id]):
+                ids = ids_by_trigram.get(trigram)
+                if ids is None:
+                    ids = ids_by_trigram[trigram] = array("I")
+                ids.append(entry_id)
+        self._trigram_indexed_count = len(self._texts)
+
+    def _take(
+        self, entry_ids: Iterable[int], limit: Optional[int]
+    ) -> List[CatalogueEntry]:
+        entries: List[CatalogueEntry] = []
+        for entry_id in entry_ids:
+            if limit is not None and len(entries) >= limit:
+                break
+            entries.append(self._entry(entry_id))
+        return entries
+
+
+def _contains(sorted_ids: array, entry_id: int) -> bool:
+    i = bisect_left(sorted_ids, entry_id)
+    return i < len(sorted_ids) and sorted_ids[i] == entry_id
@@ -0,0 +1,226 @@
+"""
+Command line interface for recovering Rust string slices from a corpus of binaries,
+using the core string slice engine without Binary Ninja.
+
+Run from the root of the repository with:
+
+    python -m binja_plugin.cli [-o results.jsonl] path [path ...]
+
+Results are written as JSON Lines. Each recovered string slice is written as a
+`"type": "slice"` record, followed by a single `"type": "sample"` record once all
+string slices for a binary have been written, which is also used to resume
+from a partially written output file.
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from struct import error as struct_error
+from typing import IO, Dict, Iterator, List, NamedTuple, Optional, Set
+
+from .loader import UnsupportedBinaryError, load_binary
+
+DEFAULT_MAX_FILE_SIZE = 512 * 1024 * 1024
+DEFAULT_MAX_TASKS_PER_CHILD = 64
+
+
+class SampleResult(NamedTuple):
+    path: str
+    lines: List[str]
+    slice_count: int
+
+
+def iter_sample_paths(paths: List[str]) -> Iterator[str]:
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, _subdirectories, filenames in os.walk(path):
+                for filename in sorted(filenames):
+                    yield os.path.join(directory, filename)
+        else:
+            yield path
+
+
+def process_sample(path: str, max_file_size: int) -> SampleResult:
+    """
+    Recover all string slices from the binary at `path`, as serialised JSON Lines records.
+
+    This runs in a worker process, and only holds one binary in memory at a time.
+    """
+    sample_record: Dict[str, object] = {"type": "sample", "path": path}
+    lines: List[str] = []
+    try:
+        if os.path.getsize(path) > max_file_size:
+            raise UnsupportedBinaryError(
+                f"File is larger than the maximum size of {max_file_size} bytes"
+            )
+        with open(path, "rb") as f:
+            data = f.read()
+        sha256 = hashlib.sha256(data).hexdigest()
+        sample_record["sha256"] = sha256
+
+        loaded = load_binary(data)
+        del data
+        sample_record["format"] = loaded.format
+
+        for string_slice in loaded.create_engine().recover_from_readonly_data():
+            lines.append(
+                json.dumps(
+                    {
+                        "type": "slice",
+                        "sha256": sha256,
+                        "address": string_slice.address,
+                        "location": string_slice.location,
+                        "length": string_slice.length,
+                        "text": string_slice.text,
+                    },
+                    ensure_ascii=False,
+                )
+            )
+    except (OSError, ValueError, IndexError, struct_error) as err:
+        sample_record["error"] = f"{type(err).__name__}: {err}"
+
+    sample_record["slices"] = len(lines)
+    lines.append(json.dumps(sample_record, ensure_ascii=False))
+    return SampleResult(path=path, lines=lines, slice_count=len(lines) - 1)
+
+
+def _process_sample_worker(arguments) -> SampleResult:
+    return process_sample(*arguments)
+
+
+def prepare_resume(output_path: str) -> Set[str]:
+    """
+    Find the paths of all samples which were completely written to an existing output file,
+    and truncate the file after the last complete sample, discarding any partial results.
+    """
+    completed_paths: Set[str] = set()
+    if not os.path.exists(output_path):
+        return completed_paths
+
+    end_of_last_sample = 0
+    with open(output_path, "rb") as f:
+        offset = 0
+        for raw_line in f:
+            offset += len(raw_line)
+            if not raw_line.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(raw_line)
+            except ValueError:
+                break
+            if record.get("type") == "sample":
+                completed_paths.add(record["path"])
+                end_of_last_sample = offset
+
+    with open(output_path, "r+b") as f:
+        f.truncate(end_of_last_sample)
+    return completed_paths
+
+
+def run(
+    paths: List[str],
+    output: IO[str],
+    jobs: int,
+    max_file_size: int,
+    max_tasks_per_child: int,
+    skip_paths: Optional[Set[str]] = None,
+) -> None:
+    sample_paths = [
+        path for path in iter_sample_paths(paths) if path not in (skip_paths or ())
+    ]
+
+    start = time.perf_counter()
+    file_count = 0
+    slice_count = 0
+    with multiprocessing.Pool(
+        processes=jobs, maxtasksperchild=max_tasks_per_child
+    ) as pool:
+        for result in pool.imap_unordered(
+            _process_sample_worker,
+            ((path, max_file_size) for path in sample_paths),
+        ):
+            # Write all records for a sample at once, so that the sample record
+            # is only ever written after all of its string slice records.
+            output.write("\n".join(result.lines) + "\n")
+            output.flush()
+            file_count += 1
+            slice_count += result.slice_count
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"Processed {file_count} files, recovered {slice_count} string slices in {elapsed:.2f}s "
+        f"({file_count / elapsed if elapsed else 0:.1f} files/sec, {slice_count / elapsed if elapsed else 0:.1f} slices/sec)",
+        file=sys.stderr,
+    )
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="rust-string-slicer",
+        description="Recover Rust string slices from the read-only data of ELF, PE and Mach-O binaries.",
+    )
+    parser.add_argument(
+        "paths", nargs="+", help="Binaries, or directories to search for binaries"
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="JSON Lines file to write results to; defaults to standard output",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip samples which are already complete in the output file, and append to it",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: one per core)",
+    )
+    parser.add_argument(
+        "--max-file-size",
+        type=int,
+        default=DEFAULT_MAX_FILE_SIZE,
+        help="Skip binaries larger than this many bytes, to bound memory use per worker",
+    )
+    parser.add_argument(
+        "--max-tasks-per-child",
+        type=int,
+        default=DEFAULT_MAX_TASKS_PER_CHILD,
+        help="Replace each worker process after it has processed this many binaries",
+    )
+    args = parser.parse_args(argv)
+
+    if args.resume and args.output is None:
+        parser.error("--resume requires --output")
+
+    if args.output is None:
+        run(
+            args.paths,
+            sys.stdout,
+            args.jobs,
+            args.max_file_size,
+            args.max_tasks_per_child,
+        )
+        return
+
+    skip_paths = prepare_resume(args.output) if args.resume else set()
+    with open(args.output, "a" if args.resume else "w", encoding="utf-8") as output:
+        run(
+            args.paths,
+            output,
+            args.jobs,
+            args.max_file_size,
+            args.max_tasks_per_child,
+            skip_paths=skip_paths,
+        )
+
+
+if __name__ == "__main__":
+    main()
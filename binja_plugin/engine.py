@@ -0,0 +1,197 @@
+"""
+Core string slice recovery logic.
+
+The engine works on raw read-only section bytes and their load addresses, so it can
+be driven either by the Binary Ninja plugin tasks, or by the loaders in `loader.py`
+for ELF, PE and Mach-O files on disk.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .regions import ReadOnlyRegionIndex
+from .report import RejectionReason
+from .scan import MAX_STRING_SLICE_LENGTH, scan_string_slice_pairs
+from .validate import DEFAULT_MIN_PRINTABLE_SCORE, SpanVerdict, validate_spans
+
+
+class SliceSource(IntEnum):
+    """
+    The heuristic which recovered a string slice.
+    """
+
+    UNKNOWN = 0
+    READONLY_DATA = 1
+    READONLY_DATA_BULK_SCAN = 2
+    CODE = 3
+
+
+class RustStringSlice:
+    """
+    Class to work with the string slice type in Rust, &str
+    """
+
+    __slots__ = ("address", "length", "data", "location", "source", "confidence")
+
+    def __init__(
+        self,
+        address: int,
+        length: int,
+        data: bytes,
+        location: Optional[int] = None,
+        source: SliceSource = SliceSource.UNKNOWN,
+        confidence: float = 1.0,
+    ):
+        self.address = address
+        self.length = length
+        self.data = data
+        # Address of the `&str` (pointer, length) pair which refers to this string, if known.
+        self.location = location
+        self.source = source
+        # How likely this is to be a real string slice, from 0 to 1.
+        self.confidence = confidence
+
+    def __repr__(self):
+        return f"StringSlice(address={self.address:#x}, length={self.length:#x}, data={self.data!r})"
+
+    @property
+    def text(self) -> str:
+        return self.data.decode("utf-8")
+
+
+@dataclass
+class ReadOnlySection:
+    """
+    Contents of a read-only section, loaded at `address`.
+    """
+
+    name: str
+    address: int
+    data: bytes
+
+    @property
+    def end(self) -> int:
+        return self.address + len(self.data)
+
+
+def string_slice_length_rejection(length: int) -> Optional[RejectionReason]:
+    """
+    Get the reason a candidate string slice with this length is rejected, or None if it is not.
+    """
+    # Filter out any potential string slice which has length 0,
+    # or which is too long.
+    if length <= 0:
+        return RejectionReason.ZERO_LENGTH
+    if length >= MAX_STRING_SLICE_LENGTH:
+        return RejectionReason.LENGTH_TOO_LONG
+    return None
+
+
+class StringSliceEngine:
+    """
+    Recovers Rust string slices from the (non-overlapping) read-only sections of a binary.
+
+    `address_size` is the size of a pointer (and so of a `usize`) on the target,
+    and `byteorder` is either "little" or "big". Candidates whose data is less printable
+    than `min_printable_score` are rejected.
+    """
+
+    def __init__(
+        self,
+        sections: Sequence[ReadOnlySection],
+        address_size: int,
+        byteorder: str,
+        max_length: int = MAX_STRING_SLICE_LENGTH,
+        min_printable_score: float = DEFAULT_MIN_PRINTABLE_SCORE,
+    ):
+        self.sections = sorted(sections, key=lambda section: section.address)
+        self.address_size = address_size
+        self.byteorder = byteorder
+        self.max_length = max_length
+        self.min_printable_score = min_printable_score
+        self.readonly_regions = ReadOnlyRegionIndex(
+            (section.address, section.end) for section in self.sections
+        )
+        self._section_starts = [section.address for section in self.sections]
+
+    def read(self, address: int, length: int) -> Optional[bytes]:
+        """
+        Read `length` bytes at `address`, if they lie entirely within one section.
+        """
+        i = bisect_right(self._section_starts, address) - 1
+        if i < 0 or address + length > self.sections[i].end:
+            return None
+        offset = address - self.sections[i].address
+        return self.sections[i].data[offset : offset + length]
+
+    def find_candidate_pairs(self) -> Iterator[Tuple[int, int, int]]:
+        """
+        Find all candidate `&str` (pointer, length) pairs in the read-only sections,
+        as tuples of (address of the pair, address of the string data, length).
+        """
+        for section in self.sections:
+            yield from scan_string_slice_pairs(
+                buffer=section.data,
+                base_address=section.address,
+                address_size=self.address_size,
+                byteorder=self.byteorder,
+                readonly_regions=self.readonly_regions,
+                max_length=self.max_length,
+            )
+
+    def validate_candidate_pairs(
+        self, candidate_pairs: Sequence[Tuple[int, int, int]]
+    ) -> List[SpanVerdict]:
+        """
+        Validate and score the string data of each candidate pair, in one batch per section.
+        Candidates whose data does not lie entirely within one section are invalid.
+        """
+        spans_by_section: Dict[int, List[Tuple[int, int]]] = {}
+        candidate_indices_by_section: Dict[int, List[int]] = {}
+        for candidate_index, (_location, address, length) in enumerate(candidate_pairs):
+            i = bisect_right(self._section_starts, address) - 1
+            if i < 0:
+                continue
+            spans_by_section.setdefault(i, []).append(
+                (address - self.sections[i].address, length)
+            )
+            candidate_indices_by_section.setdefault(i, []).append(candidate_index)
+
+        verdicts = [SpanVerdict(valid_utf8=False, printable_score=0.0)] * len(
+            candidate_pairs
+        )
+        for i, spans in spans_by_section.items():
+            for candidate_index, verdict in zip(
+                candidate_indices_by_section[i],
+                validate_spans(self.sections[i].data, spans),
+            ):
+                verdicts[candidate_index] = verdict
+        return verdicts
+
+    def recover_from_readonly_data(self) -> List[RustStringSlice]:
+        """
+        Recover all string slices referred to by `&str` pairs in read-only data,
+        whose data is valid UTF-8 and printable enough.
+        """
+        candidate_pairs = list(self.find_candidate_pairs())
+        verdicts = self.validate_candidate_pairs(candidate_pairs)
+
+        recovered_string_slices: List[RustStringSlice] = []
+        for (location, address, length), verdict in zip(candidate_pairs, verdicts):
+            if not verdict.is_plausible(self.min_printable_score):
+                continue
+            data = self.read(address, length)
+            assert data is not None
+            recovered_string_slices.append(
+                RustStringSlice(
+                    address=address,
+                    length=length,
+                    data=data,
+                    location=location,
+                    source=SliceSource.READONLY_DATA_BULK_SCAN,
+                    confidence=verdict.printable_score,
+                )
+            )
+        return recovered_string_slices
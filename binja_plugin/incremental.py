@@ -0,0 +1,249 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from binaryninja.binaryview import (
+    BinaryDataNotification,
+    BinaryView,
+    DataVariable,
+    Section,
+    Segment,
+)
+from binaryninja.enums import NotificationType
+from binaryninja.function import Function
+from binaryninja.log import Logger
+
+logger = Logger(session_id=0, logger_name=__name__)
+
+INCREMENTAL_STATE_SESSION_KEY = "rust_string_slicer.incremental_state"
+
+# Verdict for a data var in the readonly data heuristic:
+# the (address, length) of the string slice it refers to, or None if it is not a string slice.
+ReadOnlyDataVerdict = Optional[Tuple[int, int]]
+# Verdict for a function in the code heuristic:
+# the (pointer write address, char array address, length) pairs found in it.
+CodeVerdict = List[Tuple[int, int, int]]
+
+
+class StringSliceChangeTracker(BinaryDataNotification):
+    """
+    Records which data vars and functions have changed since the last run of each recovery task,
+    and whether any segments or sections have changed, which requires a full re-scan.
+    """
+
+    def __init__(self, state: "IncrementalState"):
+        super().__init__(
+            NotificationType.DataVariableAdded
+            | NotificationType.DataVariableUpdated
+            | NotificationType.DataVariableRemoved
+            | NotificationType.FunctionAdded
+            | NotificationType.FunctionUpdated
+            | NotificationType.FunctionRemoved
+            | NotificationType.SegmentAdded
+            | NotificationType.SegmentUpdated
+            | NotificationType.SegmentRemoved
+            | NotificationType.SectionAdded
+            | NotificationType.SectionUpdated
+            | NotificationType.SectionRemoved
+        )
+        self.state = state
+
+    def data_var_added(self, view: BinaryView, var: DataVariable) -> None:
+        self.state.mark_data_var_dirty(var.address)
+
+    def data_var_updated(self, view: BinaryView, var: DataVariable) -> None:
+        self.state.mark_data_var_dirty(var.address)
+
+    def data_var_removed(self, view: BinaryView, var: DataVariable) -> None:
+        self.state.mark_data_var_removed(var.address)
+
+    def function_added(self, view: BinaryView, func: Function) -> None:
+        self.state.mark_function_dirty(func.start)
+
+    def function_updated(self, view: BinaryView, func: Function) -> None:
+        self.state.mark_function_dirty(func.start)
+
+    def function_removed(self, view: BinaryView, func: Function) -> None:
+        self.state.mark_function_dirty(func.start)
+
+    def segment_added(self, view: BinaryView, segment: Segment) -> None:
+        self.state.mark_all_dirty()
+
+    def segment_updated(self, view: BinaryView, segment: Segment) -> None:
+        self.state.mark_all_dirty()
+
+    def segment_removed(self, view: BinaryView, segment: Segment) -> None:
+        self.state.mark_all_dirty()
+
+    def section_added(self, view: BinaryView, section: Section) -> None:
+        self.state.mark_all_dirty()
+
+    def section_updated(self, view: BinaryView, section: Section) -> None:
+        self.state.mark_all_dirty()
+
+    def section_removed(self, view: BinaryView, section: Section) -> None:
+        self.state.mark_all_dirty()
+
+
+@dataclass
+class IncrementalRun:
+    """
+    The changes taken by one run of a task ("readonly" or "code") with `IncrementalState.take_dirty`,
+    and the verdicts found for them. The verdicts are only saved with `IncrementalState.save`
+    once the run's string slices have been applied; if the run is cancelled or fails before then,
+    the changes are put back with `IncrementalState.restore_dirty`, to be examined again.
+    """
+
+    task: str
+    needs_full_scan: bool
+    dirty_data_vars: Set[int]
+    dirty_functions: Set[int]
+    # New verdicts, by data var address or function start; None removes the verdict.
+    readonly_data_verdicts: Dict[int, ReadOnlyDataVerdict] = field(default_factory=dict)
+    code_verdicts: Dict[int, Optional[CodeVerdict]] = field(default_factory=dict)
+    # Lengths of char arrays in read-only data by address, as of this run of the code heuristic.
+    char_arrays: Optional[Dict[int, int]] = None
+
+
+class IncrementalState:
+    """
+    Per-view state for incremental re-scans: the verdicts from previous runs of each recovery task,
+    and the addresses which have changed since.
+
+    Notifications arrive on analysis threads, so all access to the dirty sets is done under a lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._dirty_data_vars: Dict[str, Set[int]] = {"readonly": set(), "code": set()}
+        self._dirty_functions: Set[int] = set()
+        self._needs_full_scan: Dict[str, bool] = {"readonly": True, "code": True}
+        # Data vars defined by the recovery tasks themselves, whose notifications are ignored.
+        self._own_data_vars: Set[int] = set()
+
+        # Verdicts from previous runs, by data var address and by function start.
+        self.readonly_data_verdicts: Dict[int, ReadOnlyDataVerdict] = {}
+        self.code_verdicts: Dict[int, CodeVerdict] = {}
+        # Lengths of char arrays in read-only data by address, as of the last run of the code heuristic.
+        self.char_arrays: Dict[int, int] = {}
+
+        self.tracker = StringSliceChangeTracker(self)
+
+    def mark_data_var_dirty(self, address: int) -> None:
+        with self._lock:
+            if address in self._own_data_vars:
+                return
+            for dirty_data_vars in self._dirty_data_vars.values():
+                dirty_data_vars.add(address)
+
+    def mark_data_var_removed(self, address: int) -> None:
+        with self._lock:
+            # Once removed, whatever is defined there next is not the tasks' own.
+            self._own_data_vars.discard(address)
+            for dirty_data_vars in self._dirty_data_vars.values():
+                dirty_data_vars.add(address)
+
+    def ignore_own_data_vars(self, addresses: Iterable[int]) -> None:
+        """
+        Stop marking the data vars at `addresses`, which a recovery task has just defined,
+        as dirty when they are added or updated, until they are removed. Whatever the task
+        defined there is already accounted for in its results, so re-examining them would
+        only cost time. Notifications which have already arrived for them are dropped.
+        """
+        with self._lock:
+            self._own_data_vars.update(addresses)
+            for task, dirty_data_vars in self._dirty_data_vars.items():
+                self._dirty_data_vars[task] = dirty_data_vars - self._own_data_vars
+
+    def mark_function_dirty(self, start: int) -> None:
+        with self._lock:
+            self._dirty_functions.add(start)
+
+    def mark_all_dirty(self) -> None:
+        with self._lock:
+            for task in self._needs_full_scan:
+                self._needs_full_scan[task] = True
+
+    def take_dirty(self, task: str) -> IncrementalRun:
+        """
+        Take the set of changes since the last run of `task` ("readonly" or "code"),
+        for a new run of it.
+        """
+        with self._lock:
+            needs_full_scan = self._needs_full_scan[task]
+            dirty_data_vars = self._dirty_data_vars[task]
+            self._needs_full_scan[task] = False
+            self._dirty_data_vars[task] = set()
+            dirty_functions: Set[int] = set()
+            if task == "code":
+                dirty_functions = self._dirty_functions
+                self._dirty_functions = set()
+        return IncrementalRun(
+            task=task,
+            needs_full_scan=needs_full_scan,
+            dirty_data_vars=dirty_data_vars,
+            dirty_functions=dirty_functions,
+        )
+
+    def restore_dirty(self, run: IncrementalRun) -> None:
+        """
+        Put back the changes taken for `run`, e.g. when it is cancelled before its string slices
+        are applied, so that the next run examines them again.
+        """
+        with self._lock:
+            self._needs_full_scan[run.task] = (
+                self._needs_full_scan[run.task] or run.needs_full_scan
+            )
+            self._dirty_data_vars[run.task] |= run.dirty_data_vars
+            self._dirty_functions |= run.dirty_functions
+
+    def previous_readonly_data_verdicts(
+        self, run: IncrementalRun
+    ) -> Dict[int, ReadOnlyDataVerdict]:
+        """
+        Verdicts to compare the readonly data verdicts of `run` against, which are none for a full scan.
+        """
+        return {} if run.needs_full_scan else self.readonly_data_verdicts
+
+    def previous_code_verdicts(self, run: IncrementalRun) -> Dict[int, CodeVerdict]:
+        """
+        Verdicts to compare the code verdicts of `run` against, which are none for a full scan.
+        """
+        return {} if run.needs_full_scan else self.code_verdicts
+
+    def save(self, run: IncrementalRun) -> None:
+        """
+        Save the verdicts found by `run`, once its string slices have been applied.
+        """
+        if run.task == "readonly":
+            if run.needs_full_scan:
+                self.readonly_data_verdicts.clear()
+            for address, verdict in run.readonly_data_verdicts.items():
+                if verdict is None:
+                    self.readonly_data_verdicts.pop(address, None)
+                else:
+                    self.readonly_data_verdicts[address] = verdict
+        else:
+            if run.needs_full_scan:
+                self.code_verdicts.clear()
+            for function_start, pairs in run.code_verdicts.items():
+                if pairs is None:
+                    self.code_verdicts.pop(function_start, None)
+                else:
+                    self.code_verdicts[function_start] = pairs
+            if run.char_arrays is not None:
+                self.char_arrays = run.char_arrays
+
+
+def get_incremental_state(bv: BinaryView) -> IncrementalState:
+    """
+    Get the incremental re-scan state for this binary view, creating it
+    and registering its change notifications the first time.
+    """
+    state = bv.session_data.get(INCREMENTAL_STATE_SESSION_KEY)
+    if state is None:
+        state = IncrementalState()
+        bv.register_notification(state.tracker)
+        bv.session_data[INCREMENTAL_STATE_SESSION_KEY] = state
+        logger.log_debug("Registered change notifications for incremental re-scans")
+    return state
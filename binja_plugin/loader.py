@@ -0,0 +1,352 @@
+"""
+Minimal loaders for the read-only sections of ELF, PE and Mach-O files,
+for use with `StringSliceEngine` outside of Binary Ninja.
+
+These only parse as much of each format as is needed to find the read-only data
+and the address it is loaded at; they are not general purpose loaders.
+"""
+
+import struct
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from .engine import ReadOnlySection, StringSliceEngine
+
+
+class UnsupportedBinaryError(ValueError):
+    pass
+
+
+@dataclass
+class LoadedBinary:
+    format: str
+    address_size: int
+    byteorder: str
+    sections: List[ReadOnlySection] = field(default_factory=list)
+
+    def create_engine(self) -> StringSliceEngine:
+        return StringSliceEngine(
+            sections=self.sections,
+            address_size=self.address_size,
+            byteorder=self.byteorder,
+        )
+
+
+# ELF
+
+_ELF_SHT_PROGBITS = 1
+_ELF_SHT_RELA = 4
+_ELF_SHF_WRITE = 0x1
+_ELF_SHF_ALLOC = 0x2
+_ELF_SHF_EXECINSTR = 0x4
+
+# Relocation types, by e_machine, for relocations of the form `base + addend`.
+# Only RELA-style relocations need to be applied here;
+# REL and RELR relocations already store the addend in place.
+_ELF_RELATIVE_RELOCATION_TYPES: Dict[int, int] = {
+    62: 8,  # EM_X86_64: R_X86_64_RELATIVE
+    183: 1027,  # EM_AARCH64: R_AARCH64_RELATIVE
+    243: 3,  # EM_RISCV: R_RISCV_RELATIVE
+    21: 22,  # EM_PPC64: R_PPC64_RELATIVE
+    20: 22,  # EM_PPC: R_PPC_RELATIVE
+}
+
+
+def _is_elf_readonly_section(name: str, sh_type: int, sh_flags: int) -> bool:
+    if sh_type != _ELF_SHT_PROGBITS or not sh_flags & _ELF_SHF_ALLOC:
+        return False
+    if sh_flags & _ELF_SHF_EXECINSTR:
+        return False
+    # .data.rel.ro is writable in the file, but is remapped read-only after relocation,
+    # and is where rustc places most `&str` pairs in position-independent binaries.
+    return not sh_flags & _ELF_SHF_WRITE or name.startswith(".data.rel.ro")
+
+
+def load_elf(data: bytes) -> LoadedBinary:
+    if data[:4] != b"\x7fELF":
+        raise UnsupportedBinaryError("Not an ELF file")
+    if data[4] not in (1, 2) or data[5] not in (1, 2):
+        raise UnsupportedBinaryError("Unknown ELF class or data encoding")
+
+    is_64 = data[4] == 2
+    byteorder = "little" if data[5] == 1 else "big"
+    prefix = "<" if byteorder == "little" else ">"
+
+    e_machine = struct.unpack_from(f"{prefix}H", data, 0x12)[0]
+    if is_64:
+        e_shoff, e_shentsize, e_shnum, e_shstrndx = struct.unpack_from(
+            f"{prefix}Q", data, 0x28
+        ) + struct.unpack_from(f"{prefix}HHH", data, 0x3A)
+        section_header_format = f"{prefix}IIQQQQIIQQ"
+    else:
+        e_shoff, e_shentsize, e_shnum, e_shstrndx = struct.unpack_from(
+            f"{prefix}I", data, 0x20
+        ) + struct.unpack_from(f"{prefix}HHH", data, 0x2E)
+        section_header_format = f"{prefix}IIIIIIIIII"
+    if e_shnum and (
+        e_shentsize < struct.calcsize(section_header_format)
+        or e_shoff + e_shnum * e_shentsize > len(data)
+    ):
+        raise UnsupportedBinaryError("ELF section headers lie outside the file")
+
+    section_headers = [
+        struct.unpack_from(section_header_format, data, e_shoff + i * e_shentsize)
+        for i in range(e_shnum)
+    ]
+    if e_shstrndx >= len(section_headers):
+        raise UnsupportedBinaryError("ELF file has no section name string table")
+    shstrtab_offset = section_headers[e_shstrndx][4]
+
+    def section_name(sh_name: int) -> str:
+        start = shstrtab_offset + sh_name
+        return data[start : data.index(b"\x00", start)].decode(errors="replace")
+
+    address_size = 8 if is_64 else 4
+    readonly_sections: List[Tuple[str, int, bytearray]] = []
+    for sh_name, sh_type, sh_flags, sh_addr, sh_offset, sh_size, *_ in section_headers:
+        name = section_name(sh_name)
+        if _is_elf_readonly_section(name, sh_type, sh_flags) and sh_size > 0:
+            readonly_sections.append(
+                (name, sh_addr, bytearray(data[sh_offset : sh_offset + sh_size]))
+            )
+
+    # Apply relative relocations, so that pointers in .data.rel.ro
+    # in position-independent binaries have their (unrebased) values.
+    relative_type = _ELF_RELATIVE_RELOCATION_TYPES.get(e_machine)
+    if relative_type is not None:
+        rela_format = f"{prefix}QQq" if is_64 else f"{prefix}IIi"
+        rela_size = struct.calcsize(rela_format)
+        pointer_format = f"{prefix}Q" if is_64 else f"{prefix}I"
+        pointer_mask = (1 << (8 * address_size)) - 1
+        for _sh_name, sh_type, _f, _a, sh_offset, sh_size, *_ in section_headers:
+            if sh_type != _ELF_SHT_RELA:
+                continue
+            for r_offset, r_info, r_addend in struct.iter_unpack(
+                rela_format, data[sh_offset : sh_offset + sh_size - sh_size % rela_size]
+            ):
+                r_type = r_info & 0xFFFFFFFF if is_64 else r_info & 0xFF
+                if r_type != relative_type:
+                    continue
+                for _name, address, contents in readonly_sections:
+                    if address <= r_offset <= address + len(contents) - address_size:
+                        struct.pack_into(
+                            pointer_format,
+                            contents,
+                            r_offset - address,
+                            r_addend & pointer_mask,
+                        )
+                        break
+
+    return LoadedBinary(
+        format="ELF",
+        address_size=address_size,
+        byteorder=byteorder,
+        sections=[
+            ReadOnlySection(name=name, address=address, data=bytes(contents))
+            for name, address, contents in readonly_sections
+        ],
+    )
+
+
+# PE
+
+_PE_SCN_CNT_INITIALIZED_DATA = 0x00000040
+_PE_SCN_MEM_EXECUTE = 0x20000000
+_PE_SCN_MEM_READ = 0x40000000
+_PE_SCN_MEM_WRITE = 0x80000000
+
+
+def load_pe(data: bytes) -> LoadedBinary:
+    if data[:2] != b"MZ":
+        raise UnsupportedBinaryError("Not a PE file")
+    pe_offset = struct.unpack_from("<I", data, 0x3C)[0]
+    if data[pe_offset : pe_offset + 4] != b"PE\x00\x00":
+        raise UnsupportedBinaryError("Missing PE signature")
+
+    coff_offset = pe_offset + 4
+    number_of_sections, size_of_optional_header = struct.unpack_from(
+        "<H", data, coff_offset + 2
+    ) + struct.unpack_from("<H", data, coff_offset + 16)
+    optional_header_offset = coff_offset + 20
+    magic = struct.unpack_from("<H", data, optional_header_offset)[0]
+    if magic == 0x20B:
+        address_size = 8
+        image_base = struct.unpack_from("<Q", data, optional_header_offset + 24)[0]
+    elif magic == 0x10B:
+        address_size = 4
+        image_base = struct.unpack_from("<I", data, optional_header_offset + 28)[0]
+    else:
+        raise UnsupportedBinaryError(f"Unknown PE optional header magic {magic:#x}")
+
+    loaded = LoadedBinary(format="PE", address_size=address_size, byteorder="little")
+    section_table_offset = optional_header_offset + size_of_optional_header
+    for i in range(number_of_sections):
+        (
+            raw_name,
+            virtual_size,
+            virtual_address,
+            size_of_raw_data,
+            pointer_to_raw_data,
+        ) = struct.unpack_from("<8sIIII", data, section_table_offset + i * 40)
+        characteristics = struct.unpack_from(
+            "<I", data, section_table_offset + i * 40 + 36
+        )[0]
+        if (
+            not characteristics & _PE_SCN_MEM_READ
+            or not characteristics & _PE_SCN_CNT_INITIALIZED_DATA
+            or characteristics & (_PE_SCN_MEM_WRITE | _PE_SCN_MEM_EXECUTE)
+        ):
+            continue
+        size = min(virtual_size, size_of_raw_data) if virtual_size else size_of_raw_data
+        if size == 0:
+            continue
+        loaded.sections.append(
+            ReadOnlySection(
+                name=raw_name.rstrip(b"\x00").decode(errors="replace"),
+                address=image_base + virtual_address,
+                data=data[pointer_to_raw_data : pointer_to_raw_data + size],
+            )
+        )
+    return loaded
+
+
+# Mach-O
+
+_MACHO_MAGICS = {
+    b"\xfe\xed\xfa\xce": (4, "big"),
+    b"\xce\xfa\xed\xfe": (4, "little"),
+    b"\xfe\xed\xfa\xcf": (8, "big"),
+    b"\xcf\xfa\xed\xfe": (8, "little"),
+}
+_MACHO_FAT_MAGIC = b"\xca\xfe\xba\xbe"
+_MACHO_LC_SEGMENT = 0x1
+_MACHO_LC_SEGMENT_64 = 0x19
+_MACHO_SECTION_TYPE_MASK = 0xFF
+_MACHO_S_ZEROFILL = 0x1
+_MACHO_S_ATTR_PURE_INSTRUCTIONS = 0x80000000
+_MACHO_S_ATTR_SOME_INSTRUCTIONS = 0x00000400
+_MACHO_VM_PROT_READ = 0x1
+_MACHO_VM_PROT_WRITE = 0x2
+_MACHO_VM_PROT_EXECUTE = 0x4
+_MACHO_READONLY_DATA_SEGMENTS = ("__TEXT", "__DATA_CONST")
+
+
+def load_macho(data: bytes) -> LoadedBinary:
+    if data[:4] == _MACHO_FAT_MAGIC:
+        # Universal binary; use the first architecture slice.
+        nfat_arch = struct.unpack_from(">I", data, 4)[0]
+        if nfat_arch == 0:
+            raise UnsupportedBinaryError("Universal binary has no architectures")
+        offset, size = struct.unpack_from(">II", data, 8 + 8)
+        data = data[offset : offset + size]
+
+    if data[:4] not in _MACHO_MAGICS:
+        raise UnsupportedBinaryError("Not a Mach-O file")
+    address_size, byteorder = _MACHO_MAGICS[data[:4]]
+    prefix = "<" if byteorder == "little" else ">"
+
+    ncmds, sizeofcmds = struct.unpack_from(f"{prefix}II", data, 16)
+    if address_size == 8:
+        header_size = 32
+        segment_format = f"{prefix}II16sQQQQiiII"
+        section_format = f"{prefix}16s16sQQIIIIIIII"
+    else:
+        header_size = 28
+        segment_format = f"{prefix}II16sIIIIiiII"
+        section_format = f"{prefix}16s16sIIIIIIIII"
+    segment_size = struct.calcsize(segment_format)
+    section_size = struct.calcsize(section_format)
+
+    loaded = LoadedBinary(
+        format="Mach-O", address_size=address_size, byteorder=byteorder
+    )
+    # Each command is at least 8 bytes long, so this also bounds the number of commands read.
+    commands_end = min(header_size + sizeofcmds, len(data))
+    offset = header_size
+    for _ in range(ncmds):
+        if offset + 8 > commands_end:
+            raise UnsupportedBinaryError("Mach-O load commands lie outside the file")
+        cmd, cmdsize = struct.unpack_from(f"{prefix}II", data, offset)
+        if cmdsize < 8 or offset + cmdsize > commands_end:
+            raise UnsupportedBinaryError(f"Mach-O load command has size {cmdsize:#x}")
+        if cmd in (_MACHO_LC_SEGMENT, _MACHO_LC_SEGMENT_64):
+            if cmdsize < segment_size:
+                raise UnsupportedBinaryError("Mach-O segment command is truncated")
+            (
+                _cmd,
+                _cmdsize,
+                raw_segname,
+                _vmaddr,
+                _vmsize,
+                _fileoff,
+                _filesize,
+                _maxprot,
+                initprot,
+                nsects,
+                _flags,
+            ) = struct.unpack_from(segment_format, data, offset)
+            if segment_size + nsects * section_size > cmdsize:
+                raise UnsupportedBinaryError(
+                    f"Mach-O segment command has too many sections ({nsects})"
+                )
+            segname = raw_segname.rstrip(b"\x00").decode(errors="replace")
+            if segname in _MACHO_READONLY_DATA_SEGMENTS or (
+                initprot & _MACHO_VM_PROT_READ
+                and not initprot & (_MACHO_VM_PROT_WRITE | _MACHO_VM_PROT_EXECUTE)
+            ):
+                for i in range(nsects):
+                    (
+                        raw_sectname,
+                        _segname,
+                        addr,
+                        size,
+                        section_offset,
+                        _align,
+                        _reloff,
+                        _nreloc,
+                        flags,
+                        *_,
+                    ) = struct.unpack_from(
+                        section_format, data, offset + segment_size + i * section_size
+                    )
+                    if (
+                        flags & _MACHO_SECTION_TYPE_MASK == _MACHO_S_ZEROFILL
+                        or flags
+                        & (
+                            _MACHO_S_ATTR_PURE_INSTRUCTIONS
+                            | _MACHO_S_ATTR_SOME_INSTRUCTIONS
+                        )
+                        or size == 0
+                    ):
+                        continue
+                    sectname = raw_sectname.rstrip(b"\x00").decode(errors="replace")
+                    loaded.sections.append(
+                        ReadOnlySection(
+                            name=f"{segname},{sectname}",
+                            address=addr,
+                            data=data[section_offset : section_offset + size],
+                        )
+                    )
+        offset += cmdsize
+    return loaded
+
+
+def load_binary(data: bytes) -> LoadedBinary:
+    """
+    Load the read-only sections of an ELF, PE or Mach-O file.
+
+    Pointers which are stored with chained fixups in Mach-O files are not decoded,
+    so `&str` pairs in those sections will generally not be found.
+    """
+    if data[:4] == b"\x7fELF":
+        return load_elf(data)
+    if data[:2] == b"MZ":
+        return load_pe(data)
+    if data[:4] in _MACHO_MAGICS or data[:4] == _MACHO_FAT_MAGIC:
+        return load_macho(data)
+    raise UnsupportedBinaryError("Unrecognised binary format")
+
+
+def load_binary_file(path: str) -> LoadedBinary:
+    with open(path, "rb") as f:
+        return load_binary(f.read())
@@ -0,0 +1,71 @@
+"""
+Pairing of string pointer writes with constant length writes within a basic block.
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+class StoreEvent(NamedTuple):
+    """
+    A write of either a pointer to candidate string data, or of a constant, to a var,
+    or a call, which clobbers the registers that pointers are waiting in for their lengths.
+    """
+
+    # Address of the instruction doing the write.
+    address: int
+    # True if this is a write of a pointer to candidate string data,
+    # False if this is a write of a constant.
+    is_pointer: bool
+    # The string data address for pointer writes, or the constant for constant writes.
+    value: int
+    # Stack offset of the destination, if the destination is a stack slot.
+    slot: Optional[int] = None
+    # True if this is a call rather than a write; `is_pointer` and `value` are then unused.
+    is_call: bool = False
+
+
+def pair_pointers_with_lengths(
+    events: Iterable[StoreEvent], address_size: int
+) -> List[Tuple[int, int, int]]:
+    """
+    Pair each string pointer write with at most one constant length write, in a single forward pass
+    over the writes in a basic block.
+
+    A pointer written to a stack slot is treated as the `_address` field of a `&str` on the stack,
+    and is paired with the next constant written to the `_length` field at +`address_size`.
+    A pointer written anywhere else, e.g. to a register, is paired with the nearest following
+    constant which is not written to a stack slot; if several such pointers are pending,
+    the most recently written one is paired first. Each constant is used for at most one pointer.
+    Pointers which are not in a stack slot are no longer pending after a call, since any constant
+    written after it is an argument to, or a use of the result of, something else.
+
+    Returns tuples of (address of the pointer write, string data address, length).
+    """
+    pairs: List[Tuple[int, int, int]] = []
+
+    # Pointers which do not have a length yet.
+    pending_by_slot: Dict[int, StoreEvent] = {}
+    pending_without_slot: List[StoreEvent] = []
+
+    for event in events:
+        if event.is_call:
+            pending_without_slot.clear()
+            continue
+        if event.is_pointer:
+            if event.slot is not None:
+                # Overwrites any earlier pointer in the same slot, which can then never get a length.
+                pending_by_slot[event.slot] = event
+            else:
+                pending_without_slot.append(event)
+            continue
+
+        pointer: Optional[StoreEvent] = None
+        if event.slot is not None:
+            # A constant in any other stack slot is some other local, not a length.
+            pointer = pending_by_slot.pop(event.slot - address_size, None)
+        elif pending_without_slot:
+            pointer = pending_without_slot.pop()
+        if pointer is not None:
+            pairs.append((pointer.address, pointer.value, event.value))
+
+    return pairs
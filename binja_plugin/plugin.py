@@ -2,12 +2,18 @@ from binaryninja.log import Logger
 from binaryninja.plugin import PluginCommand
 
 from . import actions
+from .settings import register_settings
 
 logger = Logger(session_id=0, logger_name=__name__)
 
 PLUGIN_NAME = "Rust String Slicer"
 
 plugin_commands = [
+    (
+        f"{PLUGIN_NAME}\\Recover All String Slices",
+        "Recover String Slices from Readonly Data, then from Code for the Strings Left Over",
+        actions.action_recover_all_string_slices,
+    ),
     (
         f"{PLUGIN_NAME}\\Recover String Slices from Readonly Data",
         "Recover String Slices from Readonly Data",
@@ -18,10 +24,17 @@ plugin_commands = [
         "Recover String Slices from Code",
         actions.action_recover_string_slices_from_code,
     ),
+    (
+        f"{PLUGIN_NAME}\\Search Recovered Strings",
+        "Search the Strings Recovered in this Session by Text, Regular Expression or Address",
+        actions.action_search_recovered_strings,
+    ),
 ]
 
 
 def plugin_init():
+    register_settings()
+
     for command_name, command_description, command_action in plugin_commands:
         PluginCommand.register(
             name=command_name, description=command_description, action=command_action
@@ -0,0 +1,61 @@
+from array import array
+from bisect import bisect_right
+from typing import Iterable, List, Tuple
+
+_END_MASK = (1 << 64) - 1
+
+
+class ReadOnlyRegionIndex:
+    """
+    Sorted, merged, non-overlapping set of half-open [start, end) address intervals,
+    used to quickly check whether an address lies in read-only data.
+    """
+
+    def __init__(self, intervals: Iterable[Tuple[int, int]]):
+        # Each interval is packed into one integer for sorting, which is smaller than a tuple,
+        # since there is one for every char array when indexing those.
+        keys = sorted((start << 64) | end for start, end in intervals if end > start)
+        self._starts = array("Q")
+        self._ends = array("Q")
+        for key in keys:
+            start = key >> 64
+            end = key & _END_MASK
+            if self._starts and start <= self._ends[-1]:
+                # Overlapping or directly adjacent; extend the previous interval.
+                if end > self._ends[-1]:
+                    self._ends[-1] = end
+            else:
+                self._starts.append(start)
+                self._ends.append(end)
+
+    @property
+    def intervals(self) -> List[Tuple[int, int]]:
+        return list(zip(self._starts, self._ends))
+
+    def __repr__(self):
+        return f"ReadOnlyRegionIndex({', '.join(f'[{start:#x}, {end:#x})' for start, end in self.intervals)})"
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __bool__(self) -> bool:
+        return len(self._starts) != 0
+
+    def __contains__(self, address: int) -> bool:
+        return self.interval_index(address) >= 0
+
+    def interval_index(self, address: int) -> int:
+        """
+        Get the index into `intervals` of the interval containing `address`, or -1 if there is none.
+        """
+        i = bisect_right(self._starts, address) - 1
+        if i >= 0 and address < self._ends[i]:
+            return i
+        return -1
+
+    def contains_range(self, address: int, length: int) -> bool:
+        """
+        Check whether all of [address, address + length) lies within a single read-only interval.
+        """
+        i = bisect_right(self._starts, address) - 1
+        return i >= 0 and address < self._ends[i] and address + length <= self._ends[i]
@@ -0,0 +1,117 @@
+"""
+Structured report of a run of a recovery task: time spent in each stage, candidate counts,
+rejections by reason, and calls made on the binary view.
+"""
+
+import json
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Optional
+
+
+class RejectionReason(Enum):
+    ZERO_LENGTH = "zero_length"
+    LENGTH_TOO_LONG = "length_too_long"
+    READ_FAILURE = "read_failure"
+    INVALID_UTF8 = "invalid_utf8"
+    NOT_PRINTABLE = "not_printable"
+    NON_INTEGER_LENGTH_VAR = "non_integer_length_var"
+    DUPLICATE = "duplicate"
+
+
+# Stages which are timed, in the order they run.
+STAGES = ("enumeration", "reads", "validation", "application", "catalogue")
+
+
+@dataclass
+class RunReport:
+    task: str
+    filename: Optional[str] = None
+    started_at: float = field(default_factory=time.time)
+    cache_hit: bool = False
+    cancelled: bool = False
+    # Seconds spent in each of `STAGES`.
+    timings: Dict[str, float] = field(
+        default_factory=lambda: {stage: 0.0 for stage in STAGES}
+    )
+    # Number of candidates which were enumerated, read, validated and finally recovered.
+    candidates: Dict[str, int] = field(
+        default_factory=lambda: {
+            "enumerated": 0,
+            "read": 0,
+            "validated": 0,
+            "recovered": 0,
+        }
+    )
+    rejections: Counter = field(default_factory=Counter)
+    # Calls made on the binary view, by name.
+    api_calls: Counter = field(default_factory=Counter)
+    # Anything else specific to the task.
+    details: Dict[str, int] = field(default_factory=dict)
+
+    def reject(self, reason: RejectionReason) -> None:
+        self.rejections[reason.value] += 1
+
+    def summary(self) -> str:
+        """
+        One line summary of progress so far, for a task's progress text.
+        """
+        return (
+            f"{self.candidates['recovered']} recovered, "
+            f"{sum(self.rejections.values())} rejected of {self.candidates['enumerated']} candidates, "
+            f"{sum(self.api_calls.values())} API calls"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "task": self.task,
+            "filename": self.filename,
+            "started_at": self.started_at,
+            "cache_hit": self.cache_hit,
+            "cancelled": self.cancelled,
+            "timings": dict(self.timings),
+            "candidates": dict(self.candidates),
+            "rejections": dict(sorted(self.rejections.items())),
+            "api_calls": dict(sorted(self.api_calls.items())),
+            "api_calls_total": sum(self.api_calls.values()),
+            "details": dict(self.details),
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+
+class ApiCallCounter:
+    """
+    Proxy which forwards everything to `target`, and counts each method call
+    and property access on it in `counts`, by name.
+    """
+
+    def __init__(self, target: Any, counts: Counter):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_counts", counts)
+
+    def __getattr__(self, name: str) -> Any:
+        target = object.__getattribute__(self, "_target")
+        counts = object.__getattribute__(self, "_counts")
+        class_attribute = getattr(type(target), name, None)
+        if isinstance(class_attribute, property):
+            counts[name] += 1
+            return getattr(target, name)
+
+        value = getattr(target, name)
+        if not callable(value):
+            return value
+
+        def counting_method(*args, **kwargs):
+            counts[name] += 1
+            return value(*args, **kwargs)
+
+        # Found by normal attribute lookup from now on, without going through `__getattr__`.
+        object.__setattr__(self, name, counting_method)
+        return counting_method
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(object.__getattribute__(self, "_target"), name, value)
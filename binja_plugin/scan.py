@@ -0,0 +1,77 @@
+import sys
+from array import array
+from itertools import islice
+from typing import Iterator, Tuple
+
+from .regions import ReadOnlyRegionIndex
+
+# Candidate string slices with a length at or above this are rejected.
+MAX_STRING_SLICE_LENGTH = 0x1000  # TODO: maybe change this limit
+
+_USIZE_TYPECODES = {
+    typecode: array(typecode).itemsize for typecode in ("H", "I", "L", "Q")
+}
+
+
+def _usize_typecode(address_size: int) -> str:
+    for typecode, itemsize in _USIZE_TYPECODES.items():
+        if itemsize == address_size:
+            return typecode
+    raise ValueError(f"Unsupported address size {address_size}")
+
+
+def read_usize_words(
+    buffer: bytes, base_address: int, address_size: int, byteorder: str
+) -> Tuple[int, array]:
+    """
+    View `buffer`, which is loaded at `base_address`, as an array of `usize` words.
+
+    Words are aligned to `address_size` relative to the start of the address space,
+    not the start of the buffer, since that is how the compiler lays out `&str` pairs.
+    Returns the address of the first word, and the array of words.
+    """
+    typecode = _usize_typecode(address_size)
+    skip = -base_address % address_size
+    count = (len(buffer) - skip) // address_size
+    words = array(typecode)
+    if count > 0:
+        words.frombytes(memoryview(buffer)[skip : skip + count * address_size])
+        if byteorder != sys.byteorder:
+            words.byteswap()
+    return base_address + skip, words
+
+
+def scan_string_slice_pairs(
+    buffer: bytes,
+    base_address: int,
+    address_size: int,
+    byteorder: str,
+    readonly_regions: ReadOnlyRegionIndex,
+    max_length: int = MAX_STRING_SLICE_LENGTH,
+) -> Iterator[Tuple[int, int, int]]:
+    """
+    Find all candidate `&str` (pointer, length) pairs in `buffer`.
+
+    A candidate is an aligned pointer-sized word which points into read-only data,
+    followed by a pointer-sized word in [1, max_length), such that the whole
+    pointed to range lies in read-only data.
+
+    Yields tuples of (address of the pair, address of the string data, length).
+    """
+    first_word_address, words = read_usize_words(
+        buffer, base_address, address_size, byteorder
+    )
+    if len(words) < 2 or not readonly_regions:
+        return
+
+    lowest_address = readonly_regions.intervals[0][0]
+    highest_address = readonly_regions.intervals[-1][1]
+
+    # Check the length first, since it is the cheapest and most selective comparison.
+    for index, (pointer, length) in enumerate(zip(words, islice(words, 1, None))):
+        if (
+            0 < length < max_length
+            and lowest_address <= pointer < highest_address
+            and readonly_regions.contains_range(pointer, length)
+        ):
+            yield first_word_address + index * address_size, pointer, length
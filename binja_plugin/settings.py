@@ -0,0 +1,136 @@
+import json
+
+from binaryninja.settings import Settings
+
+from .validate import DEFAULT_MIN_PRINTABLE_SCORE
+
+SETTINGS_GROUP = "rustStringSlicer"
+
+BULK_SCAN_SETTING = f"{SETTINGS_GROUP}.readonlyData.bulkScan"
+CODE_WORKER_COUNT_SETTING = f"{SETTINGS_GROUP}.code.workerCount"
+INCREMENTAL_SETTING = f"{SETTINGS_GROUP}.incremental"
+MIN_PRINTABLE_SCORE_SETTING = f"{SETTINGS_GROUP}.minPrintableScore"
+DEBUG_LOGGING_SETTING = f"{SETTINGS_GROUP}.debugLogging"
+REPORT_DIRECTORY_SETTING = f"{SETTINGS_GROUP}.reportDirectory"
+CACHE_SETTING = f"{SETTINGS_GROUP}.cache.enabled"
+CACHE_DIRECTORY_SETTING = f"{SETTINGS_GROUP}.cache.directory"
+CACHE_MAX_SIZE_SETTING = f"{SETTINGS_GROUP}.cache.maxSize"
+
+
+def register_settings():
+    settings = Settings()
+    settings.register_group(SETTINGS_GROUP, "Rust String Slicer")
+    settings.register_setting(
+        BULK_SCAN_SETTING,
+        json.dumps(
+            {
+                "title": "Bulk Scan Readonly Data",
+                "type": "boolean",
+                "default": False,
+                "description": "When recovering string slices from readonly data, read each read-only region once and scan it for (pointer, length) pairs, instead of only checking data vars which are already typed as pointers. This is faster on large binaries, and also finds string slices which autoanalysis did not type as pointers.",
+                "ignore": ["SettingsProjectScope"],
+            }
+        ),
+    )
+    settings.register_setting(
+        CODE_WORKER_COUNT_SETTING,
+        json.dumps(
+            {
+                "title": "Code Scan Worker Count",
+                "type": "number",
+                "default": 0,
+                "minValue": 0,
+                "maxValue": 256,
+                "description": "Number of threads to scan functions with, when recovering string slices from code. 0 uses one thread per core.",
+                "ignore": ["SettingsProjectScope"],
+            }
+        ),
+    )
+    settings.register_setting(
+        INCREMENTAL_SETTING,
+        json.dumps(
+            {
+                "title": "Incremental Re-scans",
+                "type": "boolean",
+                "default": False,
+                "description": "Track changes to data vars, functions, segments and sections, and on later runs of either command only re-examine what changed since the last run on the same binary view. Ignored for bulk scans of readonly data.",
+                "ignore": ["SettingsProjectScope"],
+            }
+        ),
+    )
+    settings.register_setting(
+        CACHE_SETTING,
+        json.dumps(
+            {
+                "title": "Cache Results",
+                "type": "boolean",
+                "default": False,
+                "description": "Store recovered string slices in the database's metadata, keyed by a hash of the read-only segments and sections, and reuse them on later runs instead of detecting them again. Not used for incremental re-scans.",
+                "ignore": ["SettingsProjectScope"],
+            }
+        ),
+    )
+    settings.register_setting(
+        CACHE_DIRECTORY_SETTING,
+        json.dumps(
+            {
+                "title": "Cache Directory",
+                "type": "string",
+                "default": "",
+                "description": "If set, also store cached results in this directory, so that they can be reused across databases containing the same read-only data.",
+                "ignore": ["SettingsProjectScope", "SettingsResourceScope"],
+            }
+        ),
+    )
+    settings.register_setting(
+        CACHE_MAX_SIZE_SETTING,
+        json.dumps(
+            {
+                "title": "Cache Directory Maximum Size (MiB)",
+                "type": "number",
+                "default": 256,
+                "minValue": 1,
+                "maxValue": 1048576,
+                "description": "Maximum total size of the cache directory. The least recently used results are removed first.",
+                "ignore": ["SettingsProjectScope", "SettingsResourceScope"],
+            }
+        ),
+    )
+    settings.register_setting(
+        MIN_PRINTABLE_SCORE_SETTING,
+        json.dumps(
+            {
+                "title": "Minimum Printable Score",
+                "type": "number",
+                "default": DEFAULT_MIN_PRINTABLE_SCORE,
+                "minValue": 0,
+                "maxValue": 1,
+                "description": "Minimum fraction of characters in a recovered string which must not be control characters. Candidates below this are treated as binary data which happens to be valid UTF-8.",
+                "ignore": ["SettingsProjectScope"],
+            }
+        ),
+    )
+    settings.register_setting(
+        DEBUG_LOGGING_SETTING,
+        json.dumps(
+            {
+                "title": "Log Every Candidate",
+                "type": "boolean",
+                "default": False,
+                "description": "Log every candidate and recovered string at Debug level. Formatting these messages is slow on large binaries.",
+                "ignore": ["SettingsProjectScope"],
+            }
+        ),
+    )
+    settings.register_setting(
+        REPORT_DIRECTORY_SETTING,
+        json.dumps(
+            {
+                "title": "Run Report Directory",
+                "type": "string",
+                "default": "",
+                "description": "If set, write a JSON report of each run of either command to this directory, with the time spent in each stage, candidate counts, rejections by reason and the number of API calls made.",
+                "ignore": ["SettingsProjectScope", "SettingsResourceScope"],
+            }
+        ),
+    )
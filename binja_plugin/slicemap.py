@@ -0,0 +1,185 @@
+from array import array
+from bisect import bisect_right
+from typing import Iterable, List, Tuple
+
+# Each interval is packed into one integer for sorting, which is smaller than a tuple:
+# the start in the high bits, and the end subtracted from this in the low bits,
+# so that intervals sort by start, and for the same start, longest first.
+_END_MASK = (1 << 64) - 1
+
+
+def resolve_overlaps(slices: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Resolve the (address, length) of the string data of string slices into a set of
+    non-overlapping (address, length) intervals, in address order, in O(n log n).
+
+    rustc packs many string literals into one blob without terminators, so a slice which
+    contains another is usually a length which ran on into the next literal; it is dropped
+    in favour of the slices within it. Of the slices which are left, where two partially
+    overlap, the one which starts first is kept.
+    """
+    addresses, lengths, _distinct_count = _resolve_overlaps(slices)
+    return list(zip(addresses, lengths))
+
+
+def _resolve_overlaps(slices: Iterable[Tuple[int, int]]) -> Tuple[array, array, int]:
+    """
+    Like `resolve_overlaps`, but return the addresses and lengths as separate arrays,
+    and also the number of distinct slices of a non-zero length.
+    """
+    # The slices are usually already in address order, which sorting is fastest for.
+    keys = sorted(
+        (address << 64) | (_END_MASK - (address + length))
+        for address, length in slices
+        if length > 0
+    )
+
+    # Going backwards, every interval already seen starts at or after this one,
+    # so this one contains another if any of them ends at or before it does.
+    innermost_starts = array("Q")
+    innermost_ends = array("Q")
+    distinct_count = 0
+    previous_key = None
+    min_end = None
+    for key in reversed(keys):
+        # Duplicates are adjacent.
+        if key == previous_key:
+            continue
+        previous_key = key
+        distinct_count += 1
+        end = _END_MASK - (key & _END_MASK)
+        if min_end is not None and min_end <= end:
+            continue
+        min_end = end
+        innermost_starts.append(key >> 64)
+        innermost_ends.append(end)
+    del keys
+
+    addresses = array("Q")
+    lengths = array("Q")
+    last_end = None
+    for i in range(len(innermost_starts) - 1, -1, -1):
+        start = innermost_starts[i]
+        if last_end is None or start >= last_end:
+            last_end = innermost_ends[i]
+            addresses.append(start)
+            lengths.append(last_end - start)
+    return addresses, lengths, distinct_count
+
+
+def uncovered_ranges(
+    ranges: Iterable[Tuple[int, int]], slices: Iterable[Tuple[int, int]]
+) -> List[Tuple[int, int]]:
+    """
+    Get the parts of the (address, length) `ranges` which none of the (address, length)
+    of the string data of `slices` cover, as (address, length), in address order.
+    """
+    # Merge the slices into sorted, non-overlapping [start, end) intervals.
+    covered_starts = array("Q")
+    covered_ends = array("Q")
+    for start, end in sorted(
+        (address, address + length) for address, length in slices if length > 0
+    ):
+        if covered_ends and start <= covered_ends[-1]:
+            if end > covered_ends[-1]:
+                covered_ends[-1] = end
+        else:
+            covered_starts.append(start)
+            covered_ends.append(end)
+
+    uncovered: List[Tuple[int, int]] = []
+    for address, length in sorted(ranges):
+        end = address + length
+        # The first interval which ends after the start of this range.
+        i = bisect_right(covered_ends, address)
+        while i < len(covered_starts) and covered_starts[i] < end:
+            if covered_starts[i] > address:
+                uncovered.append((address, covered_starts[i] - address))
+            address = max(address, covered_ends[i])
+            i += 1
+        if address < end:
+            uncovered.append((address, end - address))
+    return uncovered
+
+
+class SliceMap:
+    """
+    Sorted, non-overlapping set of the `char[]` definitions made for the string data
+    of string slices in one run, which is updated one batch of string slices at a time.
+
+    Each batch is resolved with `resolve_overlaps`, and then against the definitions made for
+    earlier batches by the same rules: a new slice within an earlier definition replaces it,
+    and a new slice which contains or partially overlaps an earlier definition is skipped.
+    """
+
+    def __init__(self):
+        self._starts = array("Q")
+        self._ends = array("Q")
+        # Number of slices which were not defined, because they overlapped another.
+        self.skipped = 0
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __repr__(self):
+        return f"<SliceMap: {len(self)} definitions>"
+
+    def update(
+        self, slices: Iterable[Tuple[int, int]]
+    ) -> Tuple[array, array, List[int]]:
+        """
+        Add the (address, length) of the string data of a batch of string slices.
+
+        Returns the addresses and lengths of the new definitions to make, in address order,
+        and the addresses of earlier definitions which they replace, and so must be undefined first.
+        """
+        addresses, lengths, distinct_count = _resolve_overlaps(slices)
+        self.skipped += distinct_count - len(addresses)
+
+        if not self._starts or addresses and addresses[0] >= self._ends[-1]:
+            # All after the earlier definitions, as when chunks are applied in address order.
+            self._starts.extend(addresses)
+            self._ends.extend(
+                address + length for address, length in zip(addresses, lengths)
+            )
+            return addresses, lengths, []
+
+        # Merge the batch with the earlier definitions in one pass, into new arrays. The runs of
+        # earlier definitions between the slices of the batch are copied across as array slices.
+        old_starts = self._starts
+        old_ends = self._ends
+        starts = array("Q")
+        ends = array("Q")
+        to_define_addresses = array("Q")
+        to_define_lengths = array("Q")
+        to_undefine: List[int] = []
+        j = 0
+        for start, length in zip(addresses, lengths):
+            end = start + length
+            k = bisect_right(old_starts, start, j)
+            starts += old_starts[j:k]
+            ends += old_ends[j:k]
+            j = k
+            if ends and ends[-1] > start:
+                # Overlaps the earlier definition which starts at or before this one,
+                # since the slices of the batch do not overlap each other.
+                if (starts[-1], ends[-1]) == (start, end):
+                    continue
+                if ends[-1] < end:
+                    self.skipped += 1
+                    continue
+                to_undefine.append(starts.pop())
+                ends.pop()
+            elif j < len(old_starts) and old_starts[j] < end:
+                # Contains or overlaps the earlier definition which starts after this one.
+                self.skipped += 1
+                continue
+            starts.append(start)
+            ends.append(end)
+            to_define_addresses.append(start)
+            to_define_lengths.append(length)
+        starts += old_starts[j:]
+        ends += old_ends[j:]
+        self._starts = starts
+        self._ends = ends
+        return to_define_addresses, to_define_lengths, to_undefine
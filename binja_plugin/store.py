@@ -0,0 +1,169 @@
+"""
+Columnar store of recovered string slices.
+
+Each field is held in its own typed `array`, rather than as one Python object per string slice,
+and the string data itself is not stored, since it can be read back from the binary when needed.
+"""
+
+import sys
+from array import array
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from .engine import RustStringSlice, SliceSource
+from .scan import MAX_STRING_SLICE_LENGTH
+
+# Stored in place of the location of string slices which do not have one.
+NO_LOCATION = 0xFFFFFFFFFFFFFFFF
+
+# Number of low bits holding the length of a candidate in a `CandidateSet`.
+_LENGTH_BITS = (MAX_STRING_SLICE_LENGTH - 1).bit_length()
+_LENGTH_MASK = (1 << _LENGTH_BITS) - 1
+
+
+class StoredStringSlice(NamedTuple):
+    address: int
+    length: int
+    location: Optional[int]
+    source: SliceSource
+    confidence: float
+
+
+class SliceStore:
+    """
+    Parallel arrays of the address, length, location, source and confidence of string slices.
+    """
+
+    __slots__ = ("addresses", "lengths", "locations", "sources", "confidences")
+
+    def __init__(self, string_slices: Iterable[RustStringSlice] = ()):
+        self.addresses = array("Q")
+        self.lengths = array("I")
+        self.locations = array("Q")
+        self.sources = array("B")
+        self.confidences = array("f")
+        self.extend(string_slices)
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    def __iter__(self) -> Iterator[StoredStringSlice]:
+        for i in range(len(self.addresses)):
+            yield self[i]
+
+    def __getitem__(self, i: int) -> StoredStringSlice:
+        location = self.locations[i]
+        return StoredStringSlice(
+            address=self.addresses[i],
+            length=self.lengths[i],
+            location=None if location == NO_LOCATION else location,
+            source=SliceSource(self.sources[i]),
+            confidence=self.confidences[i],
+        )
+
+    def append(self, string_slice: RustStringSlice) -> None:
+        self.addresses.append(string_slice.address)
+        self.lengths.append(string_slice.length)
+        self.locations.append(
+            NO_LOCATION if string_slice.location is None else string_slice.location
+        )
+        self.sources.append(string_slice.source)
+        self.confidences.append(string_slice.confidence)
+
+    def extend(self, string_slices: Iterable[RustStringSlice]) -> None:
+        for string_slice in string_slices:
+            self.append(string_slice)
+
+    def sort_by_location(self) -> None:
+        """
+        Sort all columns in place, in order of location and then of the address of the string data,
+        with the string slices which do not have a location last.
+        """
+        order = sorted(
+            range(len(self.addresses)),
+            key=lambda i: (self.locations[i], self.addresses[i]),
+        )
+        for name in self.__slots__:
+            column = getattr(self, name)
+            setattr(self, name, array(column.typecode, (column[i] for i in order)))
+
+    def to_bytes(self) -> bytes:
+        """
+        Pack each column as a little-endian array, one after the other.
+        """
+        columns: List[array] = [
+            self.addresses,
+            self.locations,
+            self.lengths,
+            self.sources,
+            self.confidences,
+        ]
+        if sys.byteorder == "big":
+            columns = [array(column.typecode, column) for column in columns]
+            for column in columns:
+                column.byteswap()
+        return b"".join(column.tobytes() for column in columns)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, count: int) -> Optional["SliceStore"]:
+        """
+        Unpack `count` string slices packed with `to_bytes`,
+        or return None if `data` is the wrong size or has an unknown source.
+        """
+        store = cls()
+        columns: List[array] = [
+            store.addresses,
+            store.locations,
+            store.lengths,
+            store.sources,
+            store.confidences,
+        ]
+        if len(data) != sum(column.itemsize for column in columns) * count:
+            return None
+        offset = 0
+        for column in columns:
+            size = column.itemsize * count
+            column.frombytes(data[offset : offset + size])
+            offset += size
+            if sys.byteorder == "big":
+                column.byteswap()
+
+        known_sources = set(SliceSource)
+        if not known_sources.issuperset(store.sources):
+            return None
+        return store
+
+
+class CandidateSet:
+    """
+    Set of (address, length) candidates, which is updated one batch of candidates at a time.
+
+    Each candidate is packed into a single int, `address << _LENGTH_BITS | length`, since a
+    candidate is only added once its length has been checked to be below `MAX_STRING_SLICE_LENGTH`.
+    """
+
+    __slots__ = ("_packed",)
+
+    def __init__(self):
+        self._packed: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._packed)
+
+    def __contains__(self, candidate: Tuple[int, int]) -> bool:
+        address, length = candidate
+        if not 0 <= length < MAX_STRING_SLICE_LENGTH:
+            return False
+        return (address << _LENGTH_BITS | length) in self._packed
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for packed in sorted(self._packed):
+            yield packed >> _LENGTH_BITS, packed & _LENGTH_MASK
+
+    def update(self, candidates: Iterable[Tuple[int, int]]) -> None:
+        """
+        Add a batch of candidates, each with a length below `MAX_STRING_SLICE_LENGTH`.
+        """
+        packed = self._packed
+        for address, length in candidates:
+            assert 0 <= length < MAX_STRING_SLICE_LENGTH
+            packed.add(address << _LENGTH_BITS | length)
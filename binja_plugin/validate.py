@@ -0,0 +1,73 @@
+"""
+Validation of candidate string slice data as UTF-8, and scoring of how printable it is,
+without raising and catching an exception for each invalid candidate.
+"""
+
+from typing import Iterable, List, NamedTuple, Tuple
+
+# Candidates where less than this fraction of characters are printable are rejected,
+# since they are more likely to be binary data which happens to be valid UTF-8.
+DEFAULT_MIN_PRINTABLE_SCORE = 0.75
+
+# Every byte except the ASCII control characters, other than tab, line feed and carriage return.
+# Deleting these from a candidate leaves only its control characters.
+_NON_CONTROL_BYTES = bytes(
+    byte
+    for byte in range(0x100)
+    if not ((byte < 0x20 and byte not in b"\t\n\r") or byte == 0x7F)
+)
+
+_REPLACEMENT_CHARACTER = "�"
+_REPLACEMENT_CHARACTER_UTF8 = _REPLACEMENT_CHARACTER.encode("utf-8")
+
+
+class SpanVerdict(NamedTuple):
+    valid_utf8: bool
+    # Fraction of characters which are not control characters, from 0 to 1; 0 if not valid UTF-8.
+    printable_score: float
+
+    def is_plausible(self, min_printable_score: float) -> bool:
+        return self.valid_utf8 and self.printable_score >= min_printable_score
+
+
+_INVALID = SpanVerdict(valid_utf8=False, printable_score=0.0)
+
+
+def score_string_slice(data: bytes) -> SpanVerdict:
+    """
+    Check whether `data` is valid UTF-8, and score the fraction of its characters which are printable.
+    """
+    if not data:
+        return SpanVerdict(valid_utf8=True, printable_score=1.0)
+
+    # ASCII control characters never occur inside a multi-byte UTF-8 sequence,
+    # so they can be counted on the raw bytes.
+    control_count = len(data.translate(None, _NON_CONTROL_BYTES))
+    if data.isascii():
+        return SpanVerdict(
+            valid_utf8=True, printable_score=1.0 - control_count / len(data)
+        )
+
+    # Each invalid sequence decodes to an extra replacement character,
+    # on top of those which are really encoded in the data.
+    text = data.decode("utf-8", "replace")
+    if text.count(_REPLACEMENT_CHARACTER) != data.count(_REPLACEMENT_CHARACTER_UTF8):
+        return _INVALID
+    return SpanVerdict(valid_utf8=True, printable_score=1.0 - control_count / len(text))
+
+
+def validate_spans(
+    buffer: bytes, spans: Iterable[Tuple[int, int]]
+) -> List[SpanVerdict]:
+    """
+    Validate and score each (offset, length) span of `buffer`.
+    Spans which extend past the end of the buffer are invalid.
+    """
+    buffer_length = len(buffer)
+    verdicts: List[SpanVerdict] = []
+    for offset, length in spans:
+        if offset < 0 or offset + length > buffer_length:
+            verdicts.append(_INVALID)
+        else:
+            verdicts.append(score_string_slice(buffer[offset : offset + length]))
+    return verdicts
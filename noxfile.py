@@ -1,5 +1,8 @@
 import nox
 
+# The benchmark session is slow, so only run it when asked for with `nox -s benchmark`.
+nox.options.sessions = ["format", "lint", "test"]
+
 
 @nox.session
 def format(session):
@@ -14,3 +17,17 @@ def lint(session):
 
     session.run("ruff", ".")
     session.run("mypy", ".")
+
+
+@nox.session(python=["3.8", "3.9", "3.10", "3.11", "3.12", "3.13", "3.14"])
+def test(session):
+    # The tests only cover the parts of the plugin which do not depend on Binary Ninja.
+    session.install("-r", "dev-requirements.txt")
+    session.run("pytest")
+
+
+@nox.session
+def benchmark(session):
+    # Pure Python, against a stand-in for the Binary Ninja API, so nothing needs to be installed.
+    # Pass extra arguments after `--`, e.g. `nox -s benchmark -- --sizes 1000000`.
+    session.run("python", "-m", "benchmarks.bench_tasks", *session.posargs)
@@ -0,0 +1,20 @@
+#!/bin/sh
+# Rebuild the fixture binaries from strings.rs, with rustc and the rust-lld which rustup installs.
+# Run from this directory. No other targets or linkers need to be installed.
+set -e
+
+LLD="$(rustc --print sysroot)/lib/rustlib/$(rustc -vV | sed -n 's/^host: //p')/bin/rust-lld"
+TMP="$(mktemp -d)"
+trap 'rm -rf "$TMP"' EXIT
+
+for target in x86_64-unknown-linux-gnu x86_64-pc-windows-msvc x86_64-apple-darwin; do
+    RUSTC_BOOTSTRAP=1 rustc --crate-type=lib --emit=obj -C panic=abort -C opt-level=1 \
+        --target "$target" -o "$TMP/$target.o" strings.rs
+done
+
+# Position-independent, so the `&str` pairs are in .data.rel.ro, with RELA relocations.
+"$LLD" -flavor gnu -pie --no-dynamic-linker -e _start -o strings.elf "$TMP/x86_64-unknown-linux-gnu.o"
+"$LLD" -flavor link /entry:_start /subsystem:console /nodefaultlib /opt:noref /dynamicbase \
+    /out:strings.exe "$TMP/x86_64-pc-windows-msvc.o"
+"$LLD" -flavor darwin -arch x86_64 -platform_version macos 11.0 11.0 -e __start \
+    -o strings.macho "$TMP/x86_64-apple-darwin.o"
@@ -0,0 +1,39 @@
+// A trivial Rust program with a static table of `&str`, built for each binary format by `build.sh`.
+//
+// Only the standard library for the host is installed by rustup, so this is built without `core`,
+// and defines the few lang items which static string slices need itself.
+
+#![feature(no_core, lang_items)]
+#![allow(internal_features)]
+#![no_core]
+
+#[lang = "pointee_sized"]
+pub trait PointeeSized {}
+#[lang = "meta_sized"]
+pub trait MetaSized: PointeeSized {}
+#[lang = "sized"]
+pub trait Sized: MetaSized {}
+#[lang = "copy"]
+pub trait Copy {}
+#[lang = "sync"]
+pub unsafe trait Sync {}
+unsafe impl Sync for &'static str {}
+unsafe impl Sync for [&'static str; 4] {}
+#[lang = "drop_in_place"]
+pub unsafe fn drop_in_place<T: PointeeSized>(_to_drop: *mut T) {}
+
+#[no_mangle]
+pub static PANIC_MESSAGES: [&'static str; 4] = [
+    "called `Option::unwrap()` on a `None` value",
+    "attempt to add with overflow",
+    "index out of bounds",
+    "src/main.rs",
+];
+
+#[no_mangle]
+pub static VERSION: &'static str = "rust_string_slicer fixture 1.0";
+
+#[no_mangle]
+pub extern "C" fn _start() -> ! {
+    loop {}
+}
@@ -0,0 +1,41 @@
+from binja_plugin.cache import (
+    compute_content_hash,
+    deserialize_string_slices,
+    serialize_string_slices,
+)
+from binja_plugin.engine import RustStringSlice, SliceSource
+from binja_plugin.store import SliceStore
+
+CONTENT_HASH = compute_content_hash([(0x1000, b"index out of bounds")], 8, "little")
+
+
+def make_string_slices():
+    return SliceStore(
+        [
+            RustStringSlice(
+                address=0x1000,
+                length=19,
+                data=b"index out of bounds",
+                location=0x2000,
+                source=SliceSource.READONLY_DATA_BULK_SCAN,
+            )
+        ]
+    )
+
+
+def test_round_trip():
+    blob = serialize_string_slices(make_string_slices(), CONTENT_HASH, 0.9)
+    string_slices = deserialize_string_slices(blob, CONTENT_HASH, 0.9)
+    assert string_slices is not None
+    assert list(string_slices) == list(make_string_slices())
+
+
+def test_different_content_hash_is_a_miss():
+    blob = serialize_string_slices(make_string_slices(), CONTENT_HASH, 0.9)
+    other_content_hash = compute_content_hash([(0x1000, b"src/main.rs")], 8, "little")
+    assert deserialize_string_slices(blob, other_content_hash, 0.9) is None
+
+
+def test_different_min_printable_score_is_a_miss():
+    blob = serialize_string_slices(make_string_slices(), CONTENT_HASH, 0.9)
+    assert deserialize_string_slices(blob, CONTENT_HASH, 0.5) is None
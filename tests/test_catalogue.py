@@ -0,0 +1,58 @@
+from binja_plugin.catalogue import StringCatalogue
+from binja_plugin.engine import RustStringSlice, SliceSource
+
+REFERENCING_FUNCTIONS = {0x5000: (0x1000, 0x1100), 0x6000: (0x1200,)}
+
+
+def string_slice(address, data, location=None):
+    return RustStringSlice(
+        address=address,
+        length=len(data),
+        data=data,
+        location=location,
+        source=SliceSource.READONLY_DATA,
+    )
+
+
+def make_catalogue():
+    catalogue = StringCatalogue()
+    catalogue.add(
+        [
+            string_slice(0x5000, b"index out of bounds", location=0x9000),
+            string_slice(0x6000, b"attempt to add with overflow", location=0x9010),
+        ],
+        REFERENCING_FUNCTIONS,
+    )
+    return catalogue
+
+
+def test_search():
+    catalogue = make_catalogue()
+    assert [entry.text for entry in catalogue.search("out of")] == [
+        "index out of bounds"
+    ]
+    assert [entry.text for entry in catalogue.search_regex(r"^a.*w$")] == [
+        "attempt to add with overflow"
+    ]
+    assert [entry.address for entry in catalogue.lookup(0x9010)] == [0x6000]
+    assert catalogue.search("unwrap") == []
+
+
+def test_referencing_functions():
+    catalogue = make_catalogue()
+    [entry] = catalogue.search("bounds")
+    assert list(entry.referencing_functions) == [0x1000, 0x1100]
+    assert list(catalogue.referencing_functions(0x6000)) == [0x1200]
+    assert list(catalogue.referencing_functions(0x7000)) == []
+
+
+def test_recovering_again_replaces_referencing_functions():
+    catalogue = make_catalogue()
+    catalogue.add(
+        [string_slice(0x5000, b"index out of bounds", location=0x9000)],
+        {0x5000: (0x1300,)},
+    )
+
+    assert len(catalogue) == 2
+    assert list(catalogue.referencing_functions(0x5000)) == [0x1300]
+    assert list(catalogue.referencing_functions(0x6000)) == [0x1200]
@@ -0,0 +1,129 @@
+import os
+import struct
+
+import pytest
+
+from binja_plugin.engine import SliceSource
+from binja_plugin.loader import UnsupportedBinaryError, load_binary, load_binary_file
+
+FIXTURES_DIRECTORY = os.path.join(os.path.dirname(__file__), "fixtures")
+
+# The strings in `fixtures/strings.rs`, in the order of their `&str` in read-only data.
+FIXTURE_STRINGS = [
+    "called `Option::unwrap()` on a `None` value",
+    "attempt to add with overflow",
+    "index out of bounds",
+    "src/main.rs",
+    "rust_string_slicer fixture 1.0",
+]
+
+
+@pytest.mark.parametrize(
+    "filename, binary_format",
+    [
+        ("strings.elf", "ELF"),
+        ("strings.exe", "PE"),
+        ("strings.macho", "Mach-O"),
+    ],
+)
+def test_recover_from_readonly_data(filename, binary_format):
+    loaded = load_binary_file(os.path.join(FIXTURES_DIRECTORY, filename))
+    assert loaded.format == binary_format
+    assert loaded.address_size == 8
+    assert loaded.byteorder == "little"
+
+    string_slices = loaded.create_engine().recover_from_readonly_data()
+
+    assert [string_slice.text for string_slice in string_slices] == FIXTURE_STRINGS
+    for string_slice in string_slices:
+        assert string_slice.length == len(string_slice.data)
+        assert string_slice.source == SliceSource.READONLY_DATA_BULK_SCAN
+
+    # The first four are one `[&str; 4]`, so their (pointer, length) pairs follow each other.
+    first_location = string_slices[0].location
+    assert first_location is not None
+    assert [string_slice.location for string_slice in string_slices[:4]] == [
+        first_location + i * 16 for i in range(4)
+    ]
+
+
+def test_elf_pie_relocations_are_applied():
+    with open(os.path.join(FIXTURES_DIRECTORY, "strings.elf"), "rb") as f:
+        data = f.read()
+    loaded = load_binary(data)
+
+    sections = {section.name: section for section in loaded.sections}
+    data_rel_ro = sections[".data.rel.ro"]
+    # The linker leaves the pointers in .data.rel.ro as zero in the file,
+    # for RELA relocations to fill in when the binary is loaded.
+    assert data_rel_ro.data not in data
+
+    string_slices = loaded.create_engine().recover_from_readonly_data()
+    assert len(string_slices) == len(FIXTURE_STRINGS)
+    for string_slice in string_slices:
+        assert string_slice.location is not None
+        assert data_rel_ro.address <= string_slice.location < data_rel_ro.end
+        offset = string_slice.location - data_rel_ro.address
+        assert data_rel_ro.data[offset : offset + 8] == string_slice.address.to_bytes(
+            8, "little"
+        )
+
+
+def test_unsupported_binary():
+    with pytest.raises(UnsupportedBinaryError):
+        load_binary(b"\x00" * 64)
+
+
+def macho_header(ncmds, sizeofcmds):
+    # 64-bit little-endian Mach-O header, for x86_64.
+    return struct.pack(
+        "<4sIIIIIII", b"\xcf\xfa\xed\xfe", 0x1000007, 3, 2, ncmds, sizeofcmds, 0, 0
+    )
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        # A load command of size 0, which would otherwise be read again `ncmds` times.
+        macho_header(0xFFFFFFFF, 0xFFFFFFFF) + struct.pack("<II", 0x19, 0) + bytes(24),
+        # A load command which runs past the end of the file.
+        macho_header(1, 0x48) + struct.pack("<II", 0x19, 0x1000) + bytes(0x40),
+        # More load commands than fit in `sizeofcmds`.
+        macho_header(2, 0x10) + struct.pack("<II", 0x2, 0x10) + bytes(0x48),
+        # A segment command which claims more sections than it holds.
+        macho_header(1, 0x48)
+        + struct.pack(
+            "<II16sQQQQiiII", 0x19, 0x48, b"__TEXT", 0, 0, 0, 0, 5, 5, 0xFFFFFFFF, 0
+        ),
+    ],
+    ids=[
+        "zero_cmdsize",
+        "cmdsize_past_end",
+        "ncmds_past_sizeofcmds",
+        "too_many_sections",
+    ],
+)
+def test_malformed_macho(data):
+    with pytest.raises(UnsupportedBinaryError):
+        load_binary(data)
+
+
+def test_truncated_macho():
+    with open(os.path.join(FIXTURES_DIRECTORY, "strings.macho"), "rb") as f:
+        data = f.read()
+    with pytest.raises(UnsupportedBinaryError):
+        load_binary(data[:0x100])
+
+
+@pytest.mark.parametrize(
+    "e_shoff, e_shnum",
+    [(0x7FFFFFFFFFFFFFFF, 1), (0x40, 0xFFFF)],
+    ids=["e_shoff_past_end", "e_shnum_past_end"],
+)
+def test_malformed_elf_section_headers(e_shoff, e_shnum):
+    with open(os.path.join(FIXTURES_DIRECTORY, "strings.elf"), "rb") as f:
+        data = bytearray(f.read())
+    struct.pack_into("<Q", data, 0x28, e_shoff)
+    struct.pack_into("<H", data, 0x3C, e_shnum)
+    with pytest.raises(UnsupportedBinaryError):
+        load_binary(bytes(data))
@@ -0,0 +1,154 @@
+from collections import Counter
+
+from binja_plugin.pairing import StoreEvent, pair_pointers_with_lengths
+
+ADDRESS_SIZE = 8
+
+
+def pointer(address, value, slot=None):
+    return StoreEvent(address=address, is_pointer=True, value=value, slot=slot)
+
+
+def constant(address, value, slot=None):
+    return StoreEvent(address=address, is_pointer=False, value=value, slot=slot)
+
+
+def call(address):
+    return StoreEvent(address=address, is_pointer=False, value=0, is_call=True)
+
+
+def assert_one_length_per_pointer(pairs):
+    counts = Counter(pointer_address for pointer_address, _value, _length in pairs)
+    assert all(count == 1 for count in counts.values()), counts
+
+
+def test_register_pointer_takes_next_constant():
+    # rdx = "SizeLimitExhausted"; r8 = 0x12
+    pairs = pair_pointers_with_lengths(
+        [pointer(0x1000, 0x5000), constant(0x1007, 0x12)], ADDRESS_SIZE
+    )
+    assert pairs == [(0x1000, 0x5000, 0x12)]
+
+
+def test_constant_in_unrelated_stack_slot_is_not_a_length():
+    # rdx = str; var_10 = 0; r8 = 0x12
+    pairs = pair_pointers_with_lengths(
+        [
+            pointer(0x1000, 0x5000),
+            constant(0x1007, 0, slot=-0x10),
+            constant(0x100F, 0x12),
+        ],
+        ADDRESS_SIZE,
+    )
+    assert pairs == [(0x1000, 0x5000, 0x12)]
+
+
+def test_stack_str_takes_constant_in_its_length_slot():
+    # var_28 = str; var_18 = 1; var_20 = 0x37
+    pairs = pair_pointers_with_lengths(
+        [
+            pointer(0x1000, 0x5000, slot=-0x28),
+            constant(0x1008, 1, slot=-0x18),
+            constant(0x1010, 0x37, slot=-0x20),
+        ],
+        ADDRESS_SIZE,
+    )
+    assert pairs == [(0x1000, 0x5000, 0x37)]
+
+
+def test_stack_str_does_not_take_constant_without_slot():
+    # var_28 = str; r8 = 5
+    pairs = pair_pointers_with_lengths(
+        [pointer(0x1000, 0x5000, slot=-0x28), constant(0x1008, 5)], ADDRESS_SIZE
+    )
+    assert pairs == []
+
+
+def test_interleaved_stack_and_register_pointers():
+    # var_28 = a; rdx = b; var_20 = 3; var_10 = 0; r8 = 9
+    pairs = pair_pointers_with_lengths(
+        [
+            pointer(0x1000, 0x5000, slot=-0x28),
+            pointer(0x1008, 0x6000),
+            constant(0x1010, 3, slot=-0x20),
+            constant(0x1018, 0, slot=-0x10),
+            constant(0x1020, 9),
+        ],
+        ADDRESS_SIZE,
+    )
+    assert sorted(pairs) == [(0x1000, 0x5000, 3), (0x1008, 0x6000, 9)]
+    assert_one_length_per_pointer(pairs)
+
+
+def test_several_pending_register_pointers():
+    # rdx = a; r9 = b; r8 = 5; rcx = 7; rax = 11
+    pairs = pair_pointers_with_lengths(
+        [
+            pointer(0x1000, 0x5000),
+            pointer(0x1008, 0x6000),
+            constant(0x1010, 5),
+            constant(0x1018, 7),
+            constant(0x1020, 11),
+        ],
+        ADDRESS_SIZE,
+    )
+    # The most recently written pointer is paired first, and the last constant is left over.
+    assert pairs == [(0x1008, 0x6000, 5), (0x1000, 0x5000, 7)]
+    assert_one_length_per_pointer(pairs)
+
+
+def test_several_pending_stack_strs():
+    # var_38 = a; var_28 = b; var_20 = 4; var_30 = 6
+    pairs = pair_pointers_with_lengths(
+        [
+            pointer(0x1000, 0x5000, slot=-0x38),
+            pointer(0x1008, 0x6000, slot=-0x28),
+            constant(0x1010, 4, slot=-0x20),
+            constant(0x1018, 6, slot=-0x30),
+        ],
+        ADDRESS_SIZE,
+    )
+    assert pairs == [(0x1008, 0x6000, 4), (0x1000, 0x5000, 6)]
+    assert_one_length_per_pointer(pairs)
+
+
+def test_overwritten_stack_pointer_gets_no_length():
+    # var_28 = a; var_28 = b; var_20 = 4
+    pairs = pair_pointers_with_lengths(
+        [
+            pointer(0x1000, 0x5000, slot=-0x28),
+            pointer(0x1008, 0x6000, slot=-0x28),
+            constant(0x1010, 4, slot=-0x20),
+        ],
+        ADDRESS_SIZE,
+    )
+    assert pairs == [(0x1008, 0x6000, 4)]
+
+
+def test_register_pointer_is_dropped_at_call():
+    # rdx = a; r8 = 0x14; call; rdi = a; call; rax = 1
+    pairs = pair_pointers_with_lengths(
+        [
+            pointer(0x1000, 0x5000),
+            constant(0x1007, 0x14),
+            call(0x100E),
+            pointer(0x1013, 0x5000),
+            call(0x101A),
+            constant(0x101F, 1),
+        ],
+        ADDRESS_SIZE,
+    )
+    assert pairs == [(0x1000, 0x5000, 0x14)]
+
+
+def test_stack_str_is_kept_across_call():
+    # var_28 = a; call; var_20 = 5
+    pairs = pair_pointers_with_lengths(
+        [
+            pointer(0x1000, 0x5000, slot=-0x28),
+            call(0x1008),
+            constant(0x1010, 5, slot=-0x20),
+        ],
+        ADDRESS_SIZE,
+    )
+    assert pairs == [(0x1000, 0x5000, 5)]
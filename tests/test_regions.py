@@ -0,0 +1,50 @@
+from binja_plugin.regions import ReadOnlyRegionIndex
+
+
+def test_intervals_are_sorted_and_merged():
+    index = ReadOnlyRegionIndex(
+        [
+            (0x3000, 0x3100),
+            # Directly adjacent to the first.
+            (0x1000, 0x1100),
+            (0x1100, 0x1200),
+            # Overlapping, and contained.
+            (0x1180, 0x1300),
+            (0x1010, 0x1020),
+            # Empty.
+            (0x5000, 0x5000),
+        ]
+    )
+    assert index.intervals == [(0x1000, 0x1300), (0x3000, 0x3100)]
+    assert len(index) == 2
+    assert index
+
+
+def test_empty():
+    index = ReadOnlyRegionIndex([])
+    assert not index
+    assert 0x1000 not in index
+    assert index.interval_index(0x1000) == -1
+
+
+def test_contains():
+    index = ReadOnlyRegionIndex([(0x1000, 0x1100), (0x2000, 0x2100)])
+    assert 0x1000 in index
+    assert 0x10FF in index
+    # Intervals are half-open.
+    assert 0x1100 not in index
+    assert 0xFFF not in index
+    assert 0x1800 not in index
+    assert index.interval_index(0x2050) == 1
+
+
+def test_contains_range():
+    index = ReadOnlyRegionIndex([(0x1000, 0x1100), (0x1100, 0x1200), (0x2000, 0x2100)])
+    assert index.contains_range(0x1000, 0x100)
+    # Spans what were two adjacent intervals, which are merged.
+    assert index.contains_range(0x10F0, 0x20)
+    assert index.contains_range(0x11F0, 0x10)
+    assert not index.contains_range(0x11F0, 0x11)
+    # Spans the gap between two intervals.
+    assert not index.contains_range(0x1FF0, 0x20)
+    assert not index.contains_range(0xFF0, 0x20)
@@ -0,0 +1,85 @@
+import struct
+
+import pytest
+
+from binja_plugin.regions import ReadOnlyRegionIndex
+from binja_plugin.scan import read_usize_words, scan_string_slice_pairs
+
+READONLY_REGIONS = ReadOnlyRegionIndex([(0x1000, 0x1100)])
+
+
+def pack(byteorder, address_size, *words):
+    prefix = "<" if byteorder == "little" else ">"
+    typecode = "Q" if address_size == 8 else "I"
+    return struct.pack(f"{prefix}{len(words)}{typecode}", *words)
+
+
+@pytest.mark.parametrize("byteorder", ["little", "big"])
+@pytest.mark.parametrize("address_size", [4, 8])
+def test_read_usize_words(byteorder, address_size):
+    buffer = pack(byteorder, address_size, 1, 0x1234, 2 ** (8 * address_size) - 1)
+    first_word_address, words = read_usize_words(
+        buffer, 0x2000, address_size, byteorder
+    )
+    assert first_word_address == 0x2000
+    assert list(words) == [1, 0x1234, 2 ** (8 * address_size) - 1]
+
+
+def test_read_usize_words_is_aligned_to_the_address_space():
+    # The buffer starts 3 bytes before an 8-byte boundary, and has a partial word at the end.
+    buffer = b"\xaa" * 3 + pack("little", 8, 0x11, 0x22) + b"\xbb" * 5
+    first_word_address, words = read_usize_words(buffer, 0x1FFD, 8, "little")
+    assert first_word_address == 0x2000
+    assert list(words) == [0x11, 0x22]
+
+
+def test_read_usize_words_shorter_than_a_word():
+    first_word_address, words = read_usize_words(b"\x00" * 6, 0x2001, 8, "little")
+    assert first_word_address == 0x2008
+    assert list(words) == []
+
+
+def test_read_usize_words_unsupported_address_size():
+    with pytest.raises(ValueError):
+        read_usize_words(b"\x00" * 8, 0x2000, 3, "little")
+
+
+@pytest.mark.parametrize("byteorder", ["little", "big"])
+def test_scan_string_slice_pairs(byteorder):
+    pairs = [
+        (0x1010, 5),  # a pair
+        (0x10F0, 0x20),  # runs past the end of read-only data
+        (0x1010, 0),  # empty
+        (0x3000, 5),  # points outside read-only data
+        (0x1000, 0x1000),  # too long
+        (0x1020, 0xC),  # a pair
+    ]
+    buffer = pack(byteorder, 8, *(word for pair in pairs for word in pair))
+    assert list(
+        scan_string_slice_pairs(buffer, 0x2000, 8, byteorder, READONLY_REGIONS)
+    ) == [(0x2000, 0x1010, 5), (0x2050, 0x1020, 0xC)]
+
+
+def test_scan_string_slice_pairs_only_at_aligned_addresses():
+    # The pair is at 0x2004 in the address space, which is not 8-byte aligned.
+    buffer = b"\x00" * 4 + pack("little", 8, 0x1010, 5)
+    assert (
+        list(scan_string_slice_pairs(buffer, 0x2000, 8, "little", READONLY_REGIONS))
+        == []
+    )
+    # The same pair at an aligned address is found, even though the buffer itself is not aligned.
+    assert list(
+        scan_string_slice_pairs(buffer, 0x1FFC, 8, "little", READONLY_REGIONS)
+    ) == [(0x2000, 0x1010, 5)]
+
+
+def test_scan_string_slice_pairs_max_length():
+    buffer = pack("little", 8, 0x1010, 0x10)
+    assert (
+        list(
+            scan_string_slice_pairs(
+                buffer, 0x2000, 8, "little", READONLY_REGIONS, max_length=0x10
+            )
+        )
+        == []
+    )
@@ -0,0 +1,66 @@
+from binja_plugin.slicemap import SliceMap, resolve_overlaps, uncovered_ranges
+
+
+def test_contained_slice_replaces_the_slice_containing_it():
+    # "{size limit reached}" and the length which ran on into "SizeLimitExhausted".
+    assert resolve_overlaps([(0x1000, 0x27), (0x1000, 0x14), (0x1014, 0x12)]) == [
+        (0x1000, 0x14),
+        (0x1014, 0x12),
+    ]
+
+
+def test_first_of_partially_overlapping_slices_is_kept():
+    assert resolve_overlaps([(0x1008, 0x10), (0x1000, 0x10), (0x1020, 4)]) == [
+        (0x1000, 0x10),
+        (0x1020, 4),
+    ]
+
+
+def test_duplicates_and_empty_slices_are_dropped():
+    assert resolve_overlaps([(0x1000, 8), (0x1000, 8), (0x1010, 0)]) == [(0x1000, 8)]
+
+
+def test_later_batch_in_address_order_is_appended():
+    slice_map = SliceMap()
+    slice_map.update([(0x1000, 8)])
+    addresses, lengths, to_undefine = slice_map.update([(0x2000, 4), (0x1008, 4)])
+
+    assert list(zip(addresses, lengths)) == [(0x1008, 4), (0x2000, 4)]
+    assert to_undefine == []
+    assert len(slice_map) == 3
+
+
+def test_later_batch_replaces_the_definition_containing_its_slices():
+    slice_map = SliceMap()
+    slice_map.update([(0x1000, 0x27), (0x2000, 8)])
+    addresses, lengths, to_undefine = slice_map.update(
+        [(0x1014, 0x12), (0x1000, 0x14), (0x500, 4)]
+    )
+
+    assert list(zip(addresses, lengths)) == [(0x500, 4), (0x1000, 0x14), (0x1014, 0x12)]
+    assert to_undefine == [0x1000]
+    assert len(slice_map) == 4
+    assert slice_map.skipped == 0
+
+
+def test_later_batch_skips_slices_overlapping_or_containing_a_definition():
+    slice_map = SliceMap()
+    slice_map.update([(0x1000, 0x10), (0x2000, 8)])
+    addresses, lengths, to_undefine = slice_map.update(
+        [(0xFF8, 0x10), (0x1FF0, 0x20), (0x2000, 8), (0x3000, 4)]
+    )
+
+    assert list(zip(addresses, lengths)) == [(0x3000, 4)]
+    assert to_undefine == []
+    assert len(slice_map) == 3
+    assert slice_map.skipped == 2
+
+
+def test_uncovered_ranges():
+    char_arrays = [(0x2000, 0x10), (0x1000, 0x27), (0x3000, 8)]
+    slices = [(0x1000, 0x14), (0x1008, 4), (0x2004, 4), (0x2008, 8), (0x2FF8, 0x10)]
+    assert uncovered_ranges(char_arrays, slices) == [
+        # "SizeLimitExhausted" after "{size limit reached}" is still left for the code pass.
+        (0x1014, 0x13),
+        (0x2000, 4),
+    ]
@@ -0,0 +1,15 @@
+from binja_plugin.store import CandidateSet
+
+
+def test_candidate_set_is_updated_one_batch_at_a_time():
+    candidates = CandidateSet()
+    candidates.update([(0x5000, 19), (0x4000, 11)])
+    candidates.update([(0x5000, 4), (0x6000, 1), (0x4000, 11)])
+
+    assert len(candidates) == 4
+    assert list(candidates) == [(0x4000, 11), (0x5000, 4), (0x5000, 19), (0x6000, 1)]
+    assert (0x5000, 19) in candidates
+    assert (0x5000, 4) in candidates
+    assert (0x5000, 5) not in candidates
+    assert (0x7000, 1) not in candidates
+    assert (0x5000, 0x1000 + 19) not in candidates
@@ -0,0 +1,84 @@
+import pytest
+
+from binja_plugin.validate import SpanVerdict, score_string_slice, validate_spans
+
+
+def test_ascii():
+    assert score_string_slice(b"index out of bounds") == SpanVerdict(True, 1.0)
+
+
+def test_ascii_control_characters_lower_the_score():
+    # Tab, line feed and carriage return are printable; the NUL and BEL are not.
+    verdict = score_string_slice(b"a\tb\r\n\x00\x07x")
+    assert verdict.valid_utf8
+    assert verdict.printable_score == pytest.approx(1 - 2 / 8)
+
+
+def test_empty():
+    assert score_string_slice(b"") == SpanVerdict(True, 1.0)
+
+
+def test_multi_byte_text_is_scored_by_character():
+    # 4 characters in 9 bytes, one of which is a control character.
+    verdict = score_string_slice("é€😀\x01".encode("utf-8"))
+    assert verdict.valid_utf8
+    assert verdict.printable_score == pytest.approx(3 / 4)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"\xc0\xaf",  # overlong encoding of "/"
+        b"\xe0\x80\xaf",  # overlong three byte encoding of "/"
+        b"\xed\xa0\x80",  # UTF-16 surrogate U+D800
+        b"caf\xc3",  # sequence truncated at the end
+        b"\xff",
+        b"ok \x80 continuation byte on its own",
+    ],
+    ids=[
+        "overlong",
+        "overlong_3",
+        "surrogate",
+        "truncated",
+        "invalid_byte",
+        "lone_continuation",
+    ],
+)
+def test_invalid_utf8(data):
+    with pytest.raises(UnicodeDecodeError):
+        data.decode("utf-8")
+    assert score_string_slice(data) == SpanVerdict(False, 0.0)
+    assert not score_string_slice(data).is_plausible(0.0)
+
+
+def test_genuine_replacement_character_is_valid():
+    # U+FFFD encoded in the data itself is not mistaken for an invalid sequence.
+    data = "bad � char".encode("utf-8")
+    verdict = score_string_slice(data)
+    assert verdict == SpanVerdict(True, 1.0)
+    # ...but one next to an invalid sequence still is.
+    assert not score_string_slice(data + b"\xff").valid_utf8
+
+
+def test_is_plausible():
+    assert SpanVerdict(True, 0.75).is_plausible(0.75)
+    assert not SpanVerdict(True, 0.74).is_plausible(0.75)
+    assert not SpanVerdict(False, 1.0).is_plausible(0.0)
+
+
+def test_validate_spans():
+    buffer = b"src/main.rs\x00\xff\xfe"
+    verdicts = validate_spans(
+        buffer, [(0, 11), (4, 4), (12, 2), (10, 5), (-1, 2), (14, 0)]
+    )
+    assert verdicts == [
+        SpanVerdict(True, 1.0),
+        SpanVerdict(True, 1.0),
+        # Invalid UTF-8.
+        SpanVerdict(False, 0.0),
+        # Out of range, past the end and before the start.
+        SpanVerdict(False, 0.0),
+        SpanVerdict(False, 0.0),
+        # Empty, at the very end.
+        SpanVerdict(True, 1.0),
+    ]